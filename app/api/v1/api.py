@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import cartao
+from app.api.v1.endpoints import cartao, monitoramento
 
 router = APIRouter()
 
 router.include_router(cartao.router, prefix="/cartoes", tags=["Cartão"])
+router.include_router(monitoramento.router, prefix="/monitoramento", tags=["Monitoramento"])
@@ -1,12 +1,22 @@
+from datetime import datetime
 from uuid import UUID
+from typing import List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Header, Path, Query
+from fastapi.responses import StreamingResponse
 from app.services.cartao_services import CartaoServices
+from app.services.exportacao_services import ExportacaoServices
+from app.services.status_services import StatusServices
+from app.services.idempotencia_services import IdempotenciaServices
+from app.core.respostas import RespostaModelo
 from app.core.deps import (
     auth_cartoes_por_cpf,
     auth_atualizar_informacoes,
     auth_recarregar_cartao,
-    auth_transferir_saldo
+    auth_transferir_saldo,
+    auth_extrato,
+    auth_operador,
+    ler_lote_cartoes
 )
 from app.schemas.cartao_schema import (
     CartaoRequest,
@@ -14,11 +24,15 @@ from app.schemas.cartao_schema import (
     CartaoRecarga,
     CartaoTransferir,
     CartaoResponseWrapper,
+    CartaoLoteWrapper,
     CartoesPorCpfWrapper,
     CartaoUpdateWrapper,
     CartaoRecargaWrapper,
     CartaoTransferirWrapper
 )
+from app.models.cartao_model import StatusEnum
+from app.schemas.movimentacao_schema import ExtratoWrapper
+from app.schemas.status_schema import TransicaoStatusRequest, TransicaoStatusWrapper
 from app.api.v1.endpoints.router_config.config import RouteConfig
 
 router = APIRouter()
@@ -28,31 +42,108 @@ router = APIRouter()
 async def solicitar_cartao(
         dados_cartao: CartaoRequest,
         cartao_services: CartaoServices = Depends()
-) -> CartaoResponseWrapper:
+) -> RespostaModelo:
     cartao_response = await cartao_services.solicitar_cartao(
         dados_cartao,
         exchange="card_exchange",
         routing_key="approval_rk"
     )
 
-    return CartaoResponseWrapper(
+    return RespostaModelo(CartaoResponseWrapper(
         status_code=cartao_response["status_code"],
         message=cartao_response["message"],
         data=cartao_response["data"]
+    ))
+
+
+@router.post("/solicitar_cartoes_lote", **RouteConfig.solicitar_cartoes_lote())
+async def solicitar_cartoes_lote(
+        itens: List[dict] = Depends(ler_lote_cartoes),
+        cartao_services: CartaoServices = Depends()
+) -> RespostaModelo:
+    cartao_response = await cartao_services.solicitar_cartoes_lote(
+        itens,
+        exchange="card_exchange",
+        routing_key="approval_rk"
     )
 
+    return RespostaModelo(CartaoLoteWrapper(
+        status_code=cartao_response["status_code"],
+        message=cartao_response["message"],
+        data=cartao_response["data"]
+    ))
+
 
 @router.get("/listar_cartoes/cpf/{cpf_titular}", **RouteConfig.cartoes_por_cpf())
 async def cartoes_por_cpf(
         cpf_titular: str = Depends(auth_cartoes_por_cpf),
+        limite: int = Query(
+            default=50,
+            ge=1,
+            le=500,
+            title="Limite",
+            description="Quantidade máxima de cartões retornados na página."
+        ),
+        cursor: Optional[str] = Query(
+            default=None,
+            title="Cursor",
+            description="Cursor retornado em proximo_cursor pela página anterior."
+        ),
+        fields: Optional[str] = Query(
+            default=None,
+            title="Campos",
+            description="Campos retornados, separados por vírgula (ex.: uuid,status,saldo). "
+                        "Por padrão, todos os campos são retornados.",
+            examples=["uuid,status,saldo"]
+        ),
         cartao_services: CartaoServices = Depends()
-) -> CartoesPorCpfWrapper:
-    cartao_response = await cartao_services.cartoes_por_cpf(cpf_titular)
+) -> RespostaModelo:
+    cartao_response = await cartao_services.cartoes_por_cpf(cpf_titular, limite, cursor, fields)
 
-    return CartoesPorCpfWrapper(
+    return RespostaModelo(CartoesPorCpfWrapper(
         status_code=cartao_response["status_code"],
         message=cartao_response["message"],
         data=cartao_response["data"]
+    ), exclude_unset=True)
+
+
+@router.get("/exportar_cartoes", **RouteConfig.exportar_cartoes())
+async def exportar_cartoes(
+        formato: Literal["ndjson", "csv"] = Query(
+            default="ndjson",
+            title="Formato",
+            description="Formato da exportação: ndjson (uma linha JSON por cartão) ou csv."
+        ),
+        status_cartao: Optional[StatusEnum] = Query(
+            default=None,
+            alias="status",
+            title="Status",
+            description="Exporta apenas os cartões com o status informado."
+        ),
+        data_criacao_inicio: Optional[datetime] = Query(
+            default=None,
+            title="Criados a partir de",
+            description="Exporta apenas os cartões criados a partir desta data e hora (inclusive)."
+        ),
+        data_criacao_fim: Optional[datetime] = Query(
+            default=None,
+            title="Criados antes de",
+            description="Exporta apenas os cartões criados antes desta data e hora (exclusive)."
+        ),
+        prefixo_cpf: Optional[str] = Query(
+            default=None,
+            title="Prefixo do CPF",
+            description="Exporta apenas os cartões cujo CPF do titular começa com os dígitos informados."
+        ),
+        _: None = Depends(auth_operador),
+        exportacao_services: ExportacaoServices = Depends()
+) -> StreamingResponse:
+    return await exportacao_services.exportar_cartoes(
+        formato,
+        status_cartao,
+        data_criacao_inicio,
+        data_criacao_fim,
+        prefixo_cpf
     )
 
 
@@ -61,44 +152,119 @@ async def atualizar_dados(
         dados_atualizados: CartaoUpdate,
         uuid: UUID = Depends(auth_atualizar_informacoes),
         cartao_services: CartaoServices = Depends()
-) -> CartaoUpdateWrapper:
+) -> RespostaModelo:
     cartao_response = await cartao_services.atualizar_dados(
         dados_atualizados,
         uuid,
-        queue="approval_queue"
+        exchange="card_exchange",
+        routing_key="activation_rk"
     )
 
-    return CartaoUpdateWrapper(
+    return RespostaModelo(CartaoUpdateWrapper(
         status_code=cartao_response["status_code"],
         message=cartao_response["message"],
         data=cartao_response["data"]
+    ))
+
+
+@router.post("/transicionar_status", **RouteConfig.transicionar_status())
+async def transicionar_status(
+        transicao: TransicaoStatusRequest,
+        _: None = Depends(auth_operador),
+        status_services: StatusServices = Depends()
+) -> RespostaModelo:
+    status_response = await status_services.transicionar(
+        transicao.uuids,
+        transicao.status,
+        exchange="card_exchange",
+        routing_key="activation_rk"
     )
 
+    return RespostaModelo(TransicaoStatusWrapper(
+        status_code=status_response["status_code"],
+        message=status_response["message"],
+        data=status_response["data"]
+    ))
+
 
 @router.post("/recarregar_cartao/{uuid}", **RouteConfig.recarregar_cartao())
 async def recarregar_cartao(
         uuid: UUID = Path(title="UUID do cartão", description="UUID do cartão a ser recarregado."),
         recarga: CartaoRecarga = Depends(auth_recarregar_cartao),
-        cartao_services: CartaoServices = Depends()
-) -> CartaoRecargaWrapper:
-    cartao_response = await cartao_services.recarregar_cartao(recarga, uuid)
+        idempotency_key: Optional[str] = Header(
+            default=None,
+            alias="Idempotency-Key",
+            description="Chave única da requisição. Repetições com a mesma chave devolvem a resposta original."
+        ),
+        cartao_services: CartaoServices = Depends(),
+        idempotencia_services: IdempotenciaServices = Depends()
+) -> RespostaModelo:
+    async def operacao():
+        cartao_response = await cartao_services.recarregar_cartao(recarga, uuid, idempotency_key)
 
-    return CartaoRecargaWrapper(
-        status_code=cartao_response["status_code"],
-        message=cartao_response["message"],
-        data=cartao_response["data"]
+        return CartaoRecargaWrapper(
+            status_code=cartao_response["status_code"],
+            message=cartao_response["message"],
+            data=cartao_response["data"]
+        )
+
+    return await idempotencia_services.executar(
+        chave=idempotency_key,
+        escopo=f"recarregar_cartao:{uuid}",
+        requisicao=recarga.model_dump(mode="json"),
+        operacao=operacao
     )
 
 
 @router.post("/transferir_saldo", **RouteConfig.transferir_saldo())
 async def transferir_saldo(
         transferencia: CartaoTransferir = Depends(auth_transferir_saldo),
+        idempotency_key: Optional[str] = Header(
+            default=None,
+            alias="Idempotency-Key",
+            description="Chave única da requisição. Repetições com a mesma chave devolvem a resposta original."
+        ),
+        cartao_services: CartaoServices = Depends(),
+        idempotencia_services: IdempotenciaServices = Depends()
+) -> RespostaModelo:
+    async def operacao():
+        cartao_response = await cartao_services.transferir_saldo(transferencia, idempotency_key)
+
+        return CartaoTransferirWrapper(
+            status_code=cartao_response["status_code"],
+            message=cartao_response["message"],
+            data=cartao_response["data"]
+        )
+
+    return await idempotencia_services.executar(
+        chave=idempotency_key,
+        escopo=f"transferir_saldo:{transferencia.uuid_pagante}",
+        requisicao=transferencia.model_dump(mode="json"),
+        operacao=operacao
+    )
+
+
+@router.get("/extrato/{uuid}", **RouteConfig.extrato())
+async def extrato(
+        uuid: UUID = Depends(auth_extrato),
+        limite: int = Query(
+            default=50,
+            ge=1,
+            le=500,
+            title="Limite",
+            description="Quantidade máxima de movimentações na página."
+        ),
+        cursor: Optional[str] = Query(
+            default=None,
+            title="Cursor",
+            description="Cursor retornado pela página anterior."
+        ),
         cartao_services: CartaoServices = Depends()
-) -> CartaoTransferirWrapper:
-    cartao_response = await cartao_services.transferir_saldo(transferencia)
+) -> RespostaModelo:
+    cartao_response = await cartao_services.extrato(uuid, limite, cursor)
 
-    return CartaoTransferirWrapper(
+    return RespostaModelo(ExtratoWrapper(
         status_code=cartao_response["status_code"],
         message=cartao_response["message"],
         data=cartao_response["data"]
-    )
+    ))
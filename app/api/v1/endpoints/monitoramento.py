@@ -0,0 +1,24 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.metricas import metricas
+from app.core.respostas import RespostaModelo
+from app.database.base import metricas_pool
+from app.schemas.monitoramento_schema import PoolConexoesWrapper, PoolConexoesResponse
+from app.api.v1.endpoints.router_config.config import RouteConfig
+
+router = APIRouter()
+
+
+@router.get("/pool_conexoes", **RouteConfig.pool_conexoes())
+async def pool_conexoes() -> RespostaModelo:
+    return RespostaModelo(PoolConexoesWrapper(
+        status_code=status.HTTP_200_OK,
+        message="Métricas do pool de conexões obtidas com sucesso.",
+        data=PoolConexoesResponse(**metricas_pool())
+    ))
+
+
+@router.get("/metricas", **RouteConfig.metricas())
+async def exportar_metricas() -> PlainTextResponse:
+    return PlainTextResponse(metricas.exportar(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,12 +1,17 @@
 from fastapi import status
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from app.schemas.cartao_schema import (
     CartaoResponseWrapper,
+    CartaoLoteWrapper,
     CartoesPorCpfWrapper,
     CartaoUpdateWrapper,
     CartaoRecargaWrapper,
     CartaoTransferirWrapper,
 )
+from app.schemas.movimentacao_schema import ExtratoWrapper
+from app.schemas.monitoramento_schema import PoolConexoesWrapper
+from app.schemas.status_schema import TransicaoStatusWrapper
 from app.api.v1.endpoints.responses.cartao_responses import Responses
 
 
@@ -25,19 +30,83 @@ class RouteConfig:
             }
         }
 
+    @staticmethod
+    def solicitar_cartoes_lote():
+        return {
+            "response_model": CartaoLoteWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Solicitar cartões em lote",
+            "description": "Gera um cartão para cada solicitação do lote, enviado como array JSON ou NDJSON "
+                           "(application/x-ndjson), e informa o resultado de cada item.",
+            "responses": {
+                **Responses.SolicitarCartoesLote.sucesso,
+                **Responses.SolicitarCartoesLote.erros_validacao
+            },
+            "openapi_extra": {
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {
+                                "type": "array",
+                                "items": {"$ref": "#/components/schemas/CartaoRequest"}
+                            }
+                        },
+                        "application/x-ndjson": {
+                            "schema": {"type": "string"}
+                        }
+                    }
+                }
+            }
+        }
+
     @staticmethod
     def cartoes_por_cpf():
         return {
             "response_model": CartoesPorCpfWrapper,
+            "response_model_exclude_unset": True,
             "status_code": status.HTTP_200_OK,
             "summary": "Listar cartões por CPF",
-            "description": "Retorna todos os cartões vinculados ao CPF informado.",
+            "description": "Retorna os cartões vinculados ao CPF informado, paginados por cursor, com os campos "
+                           "solicitados em fields.",
             "responses": {
                 **Responses.CartoesPorCpf.sucesso,
+                **Responses.CartoesPorCpf.parametros_invalidos,
                 **Responses.CartoesPorCpf.cpf_invalido
             }
         }
 
+    @staticmethod
+    def extrato():
+        return {
+            "response_model": ExtratoWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Extrato do cartão",
+            "description": "Retorna as movimentações do cartão do UUID informado, da mais recente para a mais "
+                           "antiga, paginadas por cursor.",
+            "responses": {
+                **Responses.Extrato.sucesso,
+                **Responses.Extrato.cursor_invalido,
+                **Responses.Extrato.uuid_invalido
+            }
+        }
+
+    @staticmethod
+    def exportar_cartoes():
+        return {
+            "response_class": StreamingResponse,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Exportar cartões",
+            "description": "Exporta os cartões que atendem aos filtros informados, em NDJSON ou CSV, transmitidos "
+                           "à medida que são lidos do banco. Número do cartão, CVV e token não são exportados. "
+                           "Requer a chave de API do operador no header X-API-Key.",
+            "responses": {
+                **Responses.ExportarCartoes.sucesso,
+                **Responses.ExportarCartoes.erros_validacao,
+                **Responses.ExportarCartoes.nao_autorizado
+            }
+        }
+
     @staticmethod
     def atualizar_dados():
         return {
@@ -53,6 +122,22 @@ class RouteConfig:
             }
         }
 
+    @staticmethod
+    def transicionar_status():
+        return {
+            "response_model": TransicaoStatusWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Alterar status em lote",
+            "description": "Altera o status de vários cartões em uma única instrução, respeitando as transições "
+                           "permitidas a partir do status atual de cada cartão. Requer a chave de API do operador "
+                           "no header X-API-Key.",
+            "responses": {
+                **Responses.TransicionarStatus.sucesso,
+                **Responses.TransicionarStatus.erros_validacao,
+                **Responses.ExportarCartoes.nao_autorizado
+            }
+        }
+
     @staticmethod
     def recarregar_cartao():
         return {
@@ -64,6 +149,7 @@ class RouteConfig:
                 **Responses.RecarregarCartao.sucesso,
                 **Responses.RecarregarCartao.erros_validacao,
                 **Responses.RecarregarCartao.uuid_invalido,
+                **Responses.RecarregarCartao.idempotencia,
             }
         }
 
@@ -77,5 +163,26 @@ class RouteConfig:
             "responses": {
                 **Responses.TransferirSaldo.sucesso,
                 **Responses.TransferirSaldo.erros_validacao,
+                **Responses.TransferirSaldo.idempotencia,
             }
         }
+
+    @staticmethod
+    def pool_conexoes():
+        return {
+            "response_model": PoolConexoesWrapper,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Métricas do pool de conexões",
+            "description": "Retorna a utilização atual do pool de conexões com o banco de dados."
+        }
+
+    @staticmethod
+    def metricas():
+        return {
+            "response_class": PlainTextResponse,
+            "status_code": status.HTTP_200_OK,
+            "summary": "Métricas da aplicação",
+            "description": "Retorna, no formato de texto do Prometheus, a latência por rota, as requisições em "
+                           "andamento, as consultas ao banco de dados e a latência de publicação, consumo e envio "
+                           "de e-mails."
+        }
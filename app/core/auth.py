@@ -1,21 +1,20 @@
 from datetime import datetime, timedelta
 
-from pytz import timezone
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt
 
-from app.core.configs import settings
+from app.core.configs import settings, FUSO_HORARIO
 
 oauth2_schema = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1}")
 
 
 def _criar_token(tipo_token: str, tempo_vida: timedelta, sub: str) -> str:
-    sp = timezone("America/Sao_Paulo")
-    expira = datetime.now(tz=sp) + tempo_vida
+    agora = datetime.now(tz=FUSO_HORARIO)
+    expira = agora + tempo_vida
     payload = {
         "type": tipo_token,
         "exp": expira,
-        "iat": datetime.now(tz=sp),
+        "iat": agora,
         "sub": str(sub)
     }
 
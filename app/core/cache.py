@@ -0,0 +1,157 @@
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from os import environ
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+from uuid import UUID
+
+try:
+    from redis import asyncio as redis
+except ImportError:
+    redis = None
+
+
+@dataclass(frozen=True)
+class SessaoCartao:
+    cpf_titular: str
+    uuids: FrozenSet[UUID]
+    expiracao: float
+
+
+class MemoriaBackend:
+    def __init__(self, max_entradas: int):
+        self.__max_entradas = max_entradas
+        self.__entradas: "OrderedDict[str, SessaoCartao]" = OrderedDict()
+        self.__por_cpf: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entradas)
+
+    async def obter(self, chave: str) -> Optional[SessaoCartao]:
+        sessao = self.__entradas.get(chave)
+
+        if sessao is None:
+            return None
+
+        if sessao.expiracao <= time.time():
+            self.__remover(chave)
+            return None
+
+        self.__entradas.move_to_end(chave)
+        return sessao
+
+    async def salvar(self, chave: str, sessao: SessaoCartao):
+        self.__remover(chave)
+        self.__entradas[chave] = sessao
+        self.__por_cpf.setdefault(sessao.cpf_titular, set()).add(chave)
+
+        while len(self.__entradas) > self.__max_entradas:
+            self.__remover(next(iter(self.__entradas)))
+
+    async def invalidar(self, cpf_titular: str):
+        for chave in self.__por_cpf.pop(cpf_titular, set()):
+            self.__entradas.pop(chave, None)
+
+    def __remover(self, chave: str):
+        sessao = self.__entradas.pop(chave, None)
+
+        if sessao is not None:
+            chaves = self.__por_cpf.get(sessao.cpf_titular)
+            if chaves is not None:
+                chaves.discard(chave)
+                if not chaves:
+                    del self.__por_cpf[sessao.cpf_titular]
+
+
+class RedisBackend:
+    def __init__(self, cliente, prefixo: str = "auth"):
+        self.__cliente = cliente
+        self.__prefixo = prefixo
+
+    async def obter(self, chave: str) -> Optional[SessaoCartao]:
+        valor = await self.__cliente.get(f"{self.__prefixo}:token:{chave}")
+
+        if valor is None:
+            return None
+
+        dados = json.loads(valor)
+        return SessaoCartao(
+            cpf_titular=dados["cpf_titular"],
+            uuids=frozenset(UUID(uuid) for uuid in dados["uuids"]),
+            expiracao=dados["expiracao"]
+        )
+
+    async def salvar(self, chave: str, sessao: SessaoCartao):
+        ttl = int(sessao.expiracao - time.time())
+
+        if ttl <= 0:
+            return
+
+        chave_cpf = f"{self.__prefixo}:cpf:{sessao.cpf_titular}"
+        await self.__cliente.set(
+            f"{self.__prefixo}:token:{chave}",
+            json.dumps({
+                "cpf_titular": sessao.cpf_titular,
+                "uuids": [str(uuid) for uuid in sessao.uuids],
+                "expiracao": sessao.expiracao
+            }),
+            ex=ttl
+        )
+        await self.__cliente.sadd(chave_cpf, chave)
+        await self.__cliente.expire(chave_cpf, ttl)
+
+    async def invalidar(self, cpf_titular: str):
+        chave_cpf = f"{self.__prefixo}:cpf:{cpf_titular}"
+        chaves = await self.__cliente.smembers(chave_cpf)
+
+        await self.__cliente.delete(
+            chave_cpf,
+            *(
+                f"{self.__prefixo}:token:{chave.decode() if isinstance(chave, bytes) else chave}"
+                for chave in chaves
+            )
+        )
+
+
+class CacheAutenticacao:
+    def __init__(self, backend=None, ttl: Optional[float] = None):
+        self.__ttl = ttl or float(environ.get("AUTH_CACHE_TTL", 60))
+        self.backend = backend or self.__backend_padrao()
+
+    @staticmethod
+    def __backend_padrao():
+        redis_url = environ.get("AUTH_CACHE_REDIS_URL")
+
+        if redis_url and redis is not None:
+            return RedisBackend(redis.from_url(redis_url))
+
+        if redis_url:
+            print("AUTH_CACHE_REDIS_URL definida, mas o pacote redis não está instalado. Usando cache em memória.")
+
+        return MemoriaBackend(int(environ.get("AUTH_CACHE_MAX_ENTRADAS", 10000)))
+
+    @staticmethod
+    def chave(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    async def obter(self, token: str) -> Optional[SessaoCartao]:
+        return await self.backend.obter(self.chave(token))
+
+    async def salvar(self, token: str, cpf_titular: str, uuids: Iterable[UUID], expiracao: float) -> SessaoCartao:
+        sessao = SessaoCartao(
+            cpf_titular=cpf_titular,
+            uuids=frozenset(uuids),
+            expiracao=min(expiracao, time.time() + self.__ttl)
+        )
+        await self.backend.salvar(self.chave(token), sessao)
+
+        return sessao
+
+    async def invalidar(self, cpfs: Iterable[str]):
+        for cpf_titular in set(cpfs):
+            await self.backend.invalidar(cpf_titular)
+
+
+cache_autenticacao: CacheAutenticacao = CacheAutenticacao()
@@ -1,6 +1,8 @@
 from os import environ
+from typing import Optional
 
 from pydantic import BaseModel
+from pytz import timezone
 
 
 class Settings(BaseModel):
@@ -10,9 +12,21 @@ class Settings(BaseModel):
     JWT_SECRET: str = environ.get("JWT_SECRET")
     ALGORITHM: str = environ.get("ALGORITHM")
     TOKEN_EXPIRATION_MINUTES: int = int(environ.get("TOKEN_EXPIRATION_MINUTES"))
+    FIELD_CIPHER_KEYS: Optional[str] = environ.get("FIELD_CIPHER_KEYS")
+    CARD_FINGERPRINT_KEY: Optional[str] = environ.get("CARD_FINGERPRINT_KEY")
+    DB_POOL_SIZE: int = int(environ.get("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(environ.get("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT: float = float(environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(environ.get("DB_POOL_RECYCLE", 1800))
+    DB_STATEMENT_TIMEOUT_MS: int = int(environ.get("DB_STATEMENT_TIMEOUT_MS", 30000))
+    DB_STATEMENT_CACHE_SIZE: int = int(environ.get("DB_STATEMENT_CACHE_SIZE", 100))
+    DB_ECHO: bool = environ.get("DB_ECHO", "false").lower() == "true"
+    OPERADOR_API_KEY: Optional[str] = environ.get("OPERADOR_API_KEY")
 
     class Config:
         case_sensitive = True
 
 
 settings: Settings = Settings()
+
+FUSO_HORARIO = timezone("America/Sao_Paulo")
@@ -0,0 +1,75 @@
+import base64
+import hashlib
+import hmac
+import os
+from typing import Dict, Optional, Tuple
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from app.core.configs import settings
+
+
+def derivar_chave(chave: bytes, tamanho: int, info: bytes) -> bytes:
+    return HKDF(algorithm=hashes.SHA256(), length=tamanho, salt=None, info=info).derive(chave)
+
+
+def carregar_chaves(chaves_config: Optional[str], segredo: str) -> Tuple[Dict[str, bytes], str]:
+    if not chaves_config:
+        return {"0": derivar_chave(segredo.encode(), 32, b"api-cartoes:field-cipher")}, "0"
+
+    chaves = {}
+    for item in chaves_config.split(","):
+        kid, chave = item.strip().split(":", 1)
+        chaves[kid] = base64.urlsafe_b64decode(chave)
+
+    return chaves, next(iter(chaves))
+
+
+class FieldCipher:
+    def __init__(self, chaves: Dict[str, bytes], chave_ativa: str):
+        if chave_ativa not in chaves:
+            raise ValueError("A chave ativa deve estar entre as chaves configuradas.")
+
+        self.__chave_ativa = chave_ativa
+        self.__gcm = {kid: AESGCM(chave) for kid, chave in chaves.items()}
+
+    @classmethod
+    def from_settings(cls, chaves_config: Optional[str], segredo: str) -> "FieldCipher":
+        return cls(*carregar_chaves(chaves_config, segredo))
+
+    @property
+    def chave_ativa(self) -> str:
+        return self.__chave_ativa
+
+    def encrypt(self, texto: str, contexto: str) -> str:
+        nonce = os.urandom(12)
+        dados = nonce + self.__gcm[self.__chave_ativa].encrypt(nonce, texto.encode(), contexto.encode())
+
+        return f"{self.__chave_ativa}:{base64.urlsafe_b64encode(dados).decode()}"
+
+    def decrypt(self, valor: str, contexto: str) -> str:
+        kid, conteudo = valor.split(":", 1)
+        dados = base64.urlsafe_b64decode(conteudo)
+
+        try:
+            texto = self.__gcm[kid].decrypt(dados[:12], dados[12:], contexto.encode())
+        except (KeyError, InvalidTag):
+            raise ValueError(f"Não foi possível descriptografar o campo {contexto}.")
+
+        return texto.decode()
+
+
+field_cipher: FieldCipher = FieldCipher.from_settings(settings.FIELD_CIPHER_KEYS, settings.JWT_SECRET)
+
+_chave_fingerprint: bytes = (
+    base64.urlsafe_b64decode(settings.CARD_FINGERPRINT_KEY)
+    if settings.CARD_FINGERPRINT_KEY
+    else derivar_chave(settings.JWT_SECRET.encode(), 32, b"api-cartoes:fingerprint")
+)
+
+
+def fingerprint(texto: str) -> str:
+    return hmac.new(_chave_fingerprint, texto.encode(), hashlib.sha256).hexdigest()
@@ -1,16 +1,19 @@
+import json
+import secrets
 from uuid import UUID
+from typing import List, Optional
 
-from fastapi import Depends, HTTPException, status, Path
+from fastapi import Depends, HTTPException, status, Header, Path, Request
 from jose import jwt, JWTError
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
 from app.core.auth import oauth2_schema
-from app.models.cartao_model import CartaoModel
+from app.core.cache import cache_autenticacao, SessaoCartao
 from app.core.configs import settings
-from app.database.base import get_session
+from app.database.unit_of_work import UnitOfWork, get_unit_of_work
 from app.schemas.cartao_schema import CartaoTransferir, CartaoRecarga
 
+LIMITE_LOTE_CARTOES = 5000
+
 credential_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="Credencial inválida para o CPF vinculado.",
@@ -23,55 +26,67 @@ credential_exception = HTTPException(
 
 
 async def validar_token_cartao(
-        db: AsyncSession,
+        uow: UnitOfWork,
         token: str,
         uuid: UUID = None
-) -> CartaoModel:
+) -> SessaoCartao:
+    sessao = await cache_autenticacao.obter(token)
+
+    if sessao is not None and (uuid is None or uuid in sessao.uuids):
+        return sessao
+
     try:
         payload = jwt.decode(
             token,
             settings.JWT_SECRET,
             algorithms=[settings.ALGORITHM]
         )
-        token_cpf = payload.get("sub")
+    except JWTError:
+        raise credential_exception
 
-        if not token_cpf:
-            raise credential_exception
+    token_cpf = payload.get("sub")
 
-        if uuid:
-            query = await db.execute(
-                select(CartaoModel).where(CartaoModel.uuid == uuid)
+    if not token_cpf:
+        raise credential_exception
+
+    if uuid:
+        cartao = await uow.cartao(uuid)
+
+        if not cartao:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Cartão não encontrado, verifique o UUID."
             )
-            cartao = query.scalars().first()
 
-            if not cartao:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Cartão não encontrado, verifique o UUID."
-                )
+        if cartao.cpf_titular != token_cpf or cartao.token != token:
+            raise credential_exception
 
-            if cartao.cpf_titular != token_cpf or cartao.hash_token_descriptografado != token:
-                raise credential_exception
+        cartoes = [cartao]
 
-        else:
-            query = await db.execute(
-                select(CartaoModel).where(CartaoModel.cpf_titular == token_cpf)
+    else:
+        cartoes_titular = await uow.tokens_do_titular(token_cpf)
+
+        if not cartoes_titular:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O CPF informado não está vinculado a nenhum cartão ou é inválido."
             )
-            cartao = query.scalars().first()
 
-            if not cartao:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O CPF informado não está vinculado a nenhum cartão ou é inválido."
-                )
+        cartoes = [cartao for cartao in cartoes_titular if cartao.token == token]
 
-            if cartao.hash_token_descriptografado != token:
-                raise credential_exception
+        if not cartoes:
+            raise credential_exception
 
-        return cartao
+    uuids = {cartao.uuid for cartao in cartoes}
+    if sessao is not None and sessao.cpf_titular == token_cpf:
+        uuids |= sessao.uuids
 
-    except JWTError:
-        raise credential_exception
+    return await cache_autenticacao.salvar(
+        token,
+        token_cpf,
+        uuids,
+        min(payload["exp"], max(cartao.token_expiracao.timestamp() for cartao in cartoes))
+    )
 
 
 async def auth_cartoes_por_cpf(
@@ -80,17 +95,17 @@ async def auth_cartoes_por_cpf(
             description="CPF do titular do cartão."
         ),
         token: str = Depends(oauth2_schema),
-        db: AsyncSession = Depends(get_session)
+        uow: UnitOfWork = Depends(get_unit_of_work)
 ) -> str:
-    cartao = await validar_token_cartao(db, token, uuid=None)
+    sessao = await validar_token_cartao(uow, token, uuid=None)
 
-    if cartao.cpf_titular != cpf_titular:
+    if sessao.cpf_titular != cpf_titular:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="O CPF informado não está vinculado a nenhum cartão ou é inválido."
         )
 
-    return cartao.cpf_titular
+    return sessao.cpf_titular
 
 
 async def auth_atualizar_informacoes(
@@ -99,11 +114,24 @@ async def auth_atualizar_informacoes(
             description="UUID do cartão a ser atualizado."
         ),
         token: str = Depends(oauth2_schema),
-        db: AsyncSession = Depends(get_session)
+        uow: UnitOfWork = Depends(get_unit_of_work)
 ) -> UUID:
-    cartao = await validar_token_cartao(db, token, uuid)
+    await validar_token_cartao(uow, token, uuid)
 
-    return cartao.uuid
+    return uuid
+
+
+async def auth_extrato(
+        uuid: UUID = Path(
+            title="UUID do cartão",
+            description="UUID do cartão a ser consultado."
+        ),
+        token: str = Depends(oauth2_schema),
+        uow: UnitOfWork = Depends(get_unit_of_work)
+) -> UUID:
+    await validar_token_cartao(uow, token, uuid)
+
+    return uuid
 
 
 async def auth_recarregar_cartao(
@@ -113,9 +141,9 @@ async def auth_recarregar_cartao(
             description="UUID do cartão do titular."
         ),
         token: str = Depends(oauth2_schema),
-        db: AsyncSession = Depends(get_session)
+        uow: UnitOfWork = Depends(get_unit_of_work)
 ) -> CartaoRecarga:
-    await validar_token_cartao(db, token, uuid)
+    await validar_token_cartao(uow, token, uuid)
 
     return CartaoRecarga(valor=recarga.valor)
 
@@ -123,12 +151,65 @@ async def auth_recarregar_cartao(
 async def auth_transferir_saldo(
         transferencia: CartaoTransferir,
         token: str = Depends(oauth2_schema),
-        db: AsyncSession = Depends(get_session)
+        uow: UnitOfWork = Depends(get_unit_of_work)
 ) -> CartaoTransferir:
-    cartao = await validar_token_cartao(db, token, transferencia.uuid_pagante)
+    await validar_token_cartao(uow, token, transferencia.uuid_pagante)
 
     return CartaoTransferir(
-        uuid_pagante=cartao.uuid,
+        uuid_pagante=transferencia.uuid_pagante,
         uuid_recebente=transferencia.uuid_recebente,
         valor=transferencia.valor
     )
+
+
+async def auth_operador(
+        api_key: Optional[str] = Header(
+            default=None,
+            alias="X-API-Key",
+            description="Chave de API do operador, definida em OPERADOR_API_KEY."
+        )
+):
+    if (
+        not settings.OPERADOR_API_KEY
+        or api_key is None
+        or not secrets.compare_digest(api_key.encode(), settings.OPERADOR_API_KEY.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Chave de API do operador inválida."
+        )
+
+
+async def ler_lote_cartoes(request: Request) -> List[dict]:
+    corpo_invalido = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="O corpo deve ser um array JSON ou NDJSON de solicitações de cartão."
+    )
+
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            itens = []
+            resto = b""
+            async for bloco in request.stream():
+                linhas = (resto + bloco).split(b"\n")
+                resto = linhas.pop()
+                itens.extend(json.loads(linha) for linha in linhas if linha.strip())
+                if len(itens) > LIMITE_LOTE_CARTOES:
+                    break
+            if resto.strip():
+                itens.append(json.loads(resto))
+        else:
+            itens = json.loads(await request.body())
+    except ValueError:
+        raise corpo_invalido
+
+    if not isinstance(itens, list) or not all(isinstance(item, dict) for item in itens):
+        raise corpo_invalido
+
+    if not 0 < len(itens) <= LIMITE_LOTE_CARTOES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"O lote deve conter entre 1 e {LIMITE_LOTE_CARTOES} solicitações."
+        )
+
+    return itens
@@ -0,0 +1,12 @@
+from decimal import Decimal
+
+CENTAVO = Decimal("0.01")
+LIMITE_SALDO_CENTAVOS = 10 ** 11
+
+
+def para_centavos(valor: Decimal) -> int:
+    return int(valor / CENTAVO)
+
+
+def de_centavos(centavos: int) -> Decimal:
+    return Decimal(centavos) * CENTAVO
@@ -0,0 +1,123 @@
+import asyncio
+import secrets
+from collections import deque
+from functools import lru_cache
+from os import environ
+from typing import List, Optional
+
+TAMANHO_NUMERO = 16
+
+
+@lru_cache(maxsize=None)
+def carregar_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def validar_luhn(numero: str) -> bool:
+    soma = 0
+
+    for i, digito in enumerate(reversed(numero)):
+        n = int(digito)
+        if i % 2 == 1:
+            n *= 2
+            if n > 9:
+                n -= 9
+        soma += n
+
+    return soma % 10 == 0
+
+
+def digito_verificador(parcial: str) -> str:
+    soma = 0
+
+    for i, digito in enumerate(reversed(parcial)):
+        n = int(digito)
+        if i % 2 == 0:
+            n *= 2
+            if n > 9:
+                n -= 9
+        soma += n
+
+    return str((10 - soma % 10) % 10)
+
+
+def gerar_numero_cartao() -> str:
+    parcial = f"{secrets.randbelow(10 ** (TAMANHO_NUMERO - 1)):0{TAMANHO_NUMERO - 1}d}"
+    return parcial + digito_verificador(parcial)
+
+
+def gerar_numeros_cartao(quantidade: int) -> List[str]:
+    np = carregar_numpy()
+
+    if np is None:
+        return [gerar_numero_cartao() for _ in range(quantidade)]
+
+    digitos_necessarios = quantidade * (TAMANHO_NUMERO - 1)
+    digitos = np.empty(0, dtype=np.uint8)
+
+    while digitos.size < digitos_necessarios:
+        bruto = np.frombuffer(secrets.token_bytes(digitos_necessarios - digitos.size + 64), dtype=np.uint8)
+        digitos = np.concatenate((digitos, bruto[bruto < 250] % 10))
+
+    parciais = digitos[:digitos_necessarios].reshape(quantidade, TAMANHO_NUMERO - 1).astype(np.int64)
+
+    dobrados = parciais[:, 0::2] * 2
+    dobrados -= np.where(dobrados > 9, 9, 0)
+    soma = dobrados.sum(axis=1) + parciais[:, 1::2].sum(axis=1)
+    verificadores = (10 - soma % 10) % 10
+
+    numeros = np.concatenate((parciais, verificadores[:, None]), axis=1).astype(np.uint8) + ord("0")
+    texto = numeros.tobytes().decode()
+
+    return [texto[i:i + TAMANHO_NUMERO] for i in range(0, len(texto), TAMANHO_NUMERO)]
+
+
+class NumerosCartaoPool:
+    def __init__(self, tamanho: Optional[int] = None, minimo: Optional[int] = None):
+        self.__tamanho = tamanho or int(environ.get("CARTAO_POOL_NUMEROS", 1000))
+        self.__minimo = minimo or self.__tamanho // 4
+        self.__numeros: deque = deque()
+        self.__reabastecendo: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self.__numeros)
+
+    def obter(self) -> str:
+        try:
+            numero = self.__numeros.popleft()
+        except IndexError:
+            numero = gerar_numero_cartao()
+
+        if len(self.__numeros) < self.__minimo:
+            self.__agendar_reabastecimento()
+
+        return numero
+
+    def __agendar_reabastecimento(self):
+        if self.__reabastecendo is not None and not self.__reabastecendo.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.__numeros.extend(gerar_numeros_cartao(self.__tamanho - len(self.__numeros)))
+            return
+
+        self.__reabastecendo = loop.run_in_executor(
+            None,
+            gerar_numeros_cartao,
+            self.__tamanho - len(self.__numeros)
+        )
+        self.__reabastecendo.add_done_callback(self.__reabastecer)
+
+    def __reabastecer(self, futuro: asyncio.Future):
+        if not futuro.cancelled() and futuro.exception() is None:
+            self.__numeros.extend(futuro.result())
+
+
+numeros_cartao: NumerosCartaoPool = NumerosCartaoPool()
@@ -0,0 +1,316 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from os import environ
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+
+BUCKETS_LATENCIA: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def escapar(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def formatar_rotulos(nomes: Tuple[str, ...], valores: Tuple, extra: str = "") -> str:
+    pares = [f'{nome}="{escapar(valor)}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+class Contador:
+    tipo = "counter"
+
+    def __init__(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()):
+        self.nome = nome
+        self.descricao = descricao
+        self.rotulos = rotulos
+        self.valores: Dict[Tuple, float] = defaultdict(float)
+
+    def inc(self, *rotulos, valor: float = 1):
+        self.valores[rotulos] += valor
+
+    def snapshot(self) -> list:
+        return [[list(rotulos), valor] for rotulos, valor in self.valores.items()]
+
+    def combinar(self, valores: Dict[Tuple, float], snapshot: list):
+        for rotulos, valor in snapshot:
+            valores[tuple(rotulos)] += valor
+
+    def linhas(self, valores: Dict[Tuple, float]) -> List[str]:
+        return [
+            f"{self.nome}{formatar_rotulos(self.rotulos, rotulos)} {valor}"
+            for rotulos, valor in valores.items()
+        ]
+
+
+class Medidor(Contador):
+    tipo = "gauge"
+
+    def dec(self, *rotulos, valor: float = 1):
+        self.valores[rotulos] -= valor
+
+
+class Histograma:
+    tipo = "histogram"
+
+    def __init__(
+            self,
+            nome: str,
+            descricao: str,
+            rotulos: Tuple[str, ...] = (),
+            buckets: Tuple[float, ...] = BUCKETS_LATENCIA
+    ):
+        self.nome = nome
+        self.descricao = descricao
+        self.rotulos = rotulos
+        self.buckets = buckets
+        self.valores: Dict[Tuple, list] = {}
+
+    def observar(self, valor: float, *rotulos):
+        contagens = self.valores.get(rotulos)
+        if contagens is None:
+            contagens = self.valores[rotulos] = [0] * (len(self.buckets) + 1) + [0.0]
+
+        contagens[bisect_left(self.buckets, valor)] += 1
+        contagens[-1] += valor
+
+    def snapshot(self) -> list:
+        return [[list(rotulos), contagens] for rotulos, contagens in self.valores.items()]
+
+    def combinar(self, valores: Dict[Tuple, list], snapshot: list):
+        for rotulos, contagens in snapshot:
+            atuais = valores.setdefault(tuple(rotulos), [0] * (len(self.buckets) + 1) + [0.0])
+            for i, contagem in enumerate(contagens):
+                atuais[i] += contagem
+
+    def linhas(self, valores: Dict[Tuple, list]) -> List[str]:
+        linhas = []
+
+        for rotulos, contagens in valores.items():
+            acumulado = 0
+            for limite, contagem in zip(self.buckets + (float("inf"),), contagens):
+                acumulado += contagem
+                le = 'le="+Inf"' if limite == float("inf") else f'le="{limite}"'
+                linhas.append(f"{self.nome}_bucket{formatar_rotulos(self.rotulos, rotulos, le)} {acumulado}")
+            linhas.append(f"{self.nome}_sum{formatar_rotulos(self.rotulos, rotulos)} {contagens[-1]}")
+            linhas.append(f"{self.nome}_count{formatar_rotulos(self.rotulos, rotulos)} {acumulado}")
+
+        return linhas
+
+
+def processo_ativo(arquivo: Path) -> bool:
+    host, _, pid = arquivo.stem.rpartition("-")
+    if host != socket.gethostname() or not pid.isdigit():
+        return True
+
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    return True
+
+
+class RegistroMetricas:
+    def __init__(self, diretorio: Optional[str] = None, intervalo: Optional[float] = None):
+        self.__metricas: Dict[str, object] = {}
+        self.__diretorio = Path(diretorio) if diretorio else None
+        self.__intervalo = intervalo or float(environ.get("METRICAS_INTERVALO", 5))
+        self.__arquivo: Optional[Path] = None
+
+    def registrar(self, metrica):
+        self.__metricas[metrica.nome] = metrica
+        return metrica
+
+    def contador(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()) -> Contador:
+        return self.registrar(Contador(nome, descricao, rotulos))
+
+    def medidor(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()) -> Medidor:
+        return self.registrar(Medidor(nome, descricao, rotulos))
+
+    def histograma(self, nome: str, descricao: str, rotulos: Tuple[str, ...] = ()) -> Histograma:
+        return self.registrar(Histograma(nome, descricao, rotulos))
+
+    def snapshot(self) -> dict:
+        return {nome: metrica.snapshot() for nome, metrica in self.__metricas.items()}
+
+    def gravar(self):
+        if self.__diretorio is None:
+            return
+
+        if self.__arquivo is None:
+            self.__diretorio.mkdir(parents=True, exist_ok=True)
+            self.__arquivo = self.__diretorio / f"{socket.gethostname()}-{os.getpid()}.json"
+
+        temporario = self.__arquivo.with_suffix(".tmp")
+        temporario.write_text(json.dumps(self.snapshot()), encoding="utf-8")
+        temporario.replace(self.__arquivo)
+
+    def remover(self):
+        if self.__arquivo is not None:
+            self.__arquivo.unlink(missing_ok=True)
+            self.__arquivo = None
+
+    def limpar_orfaos(self):
+        if self.__diretorio is None or not self.__diretorio.is_dir():
+            return
+
+        for arquivo in self.__diretorio.glob("*.json"):
+            if not processo_ativo(arquivo):
+                arquivo.unlink(missing_ok=True)
+
+    def __snapshots(self) -> List[Tuple[dict, bool]]:
+        if self.__diretorio is None:
+            return [(self.snapshot(), True)]
+
+        self.gravar()
+        self.limpar_orfaos()
+        limite = time.time() - 3 * self.__intervalo
+        snapshots = []
+        for arquivo in self.__diretorio.glob("*.json"):
+            try:
+                recente = arquivo == self.__arquivo or arquivo.stat().st_mtime >= limite
+                snapshots.append((json.loads(arquivo.read_text(encoding="utf-8")), recente))
+            except (OSError, ValueError) as e:
+                print(f"Falha ao ler as métricas de {arquivo.name}: {e}")
+
+        return snapshots
+
+    def exportar(self) -> str:
+        snapshots = self.__snapshots()
+        linhas = []
+
+        for nome, metrica in self.__metricas.items():
+            valores = defaultdict(float) if isinstance(metrica, Contador) else {}
+            for snapshot, recente in snapshots:
+                if recente or not isinstance(metrica, Medidor):
+                    metrica.combinar(valores, snapshot.get(nome, []))
+
+            linhas.append(f"# HELP {nome} {metrica.descricao}")
+            linhas.append(f"# TYPE {nome} {metrica.tipo}")
+            linhas.extend(metrica.linhas(valores))
+
+        return "\n".join(linhas) + "\n"
+
+
+metricas: RegistroMetricas = RegistroMetricas(environ.get("METRICAS_DIRETORIO"))
+
+http_requisicoes = metricas.contador(
+    "http_requisicoes_total", "Requisições HTTP atendidas.", ("metodo", "rota", "status")
+)
+http_duracao = metricas.histograma(
+    "http_requisicao_duracao_segundos", "Latência das requisições HTTP por rota.", ("metodo", "rota")
+)
+http_em_andamento = metricas.medidor(
+    "http_requisicoes_em_andamento", "Requisições HTTP em andamento.", ("metodo",)
+)
+db_consultas = metricas.contador(
+    "db_consultas_total", "Instruções SQL executadas.", ("operacao",)
+)
+db_duracao = metricas.histograma(
+    "db_consulta_duracao_segundos", "Duração das instruções SQL.", ("operacao",)
+)
+amqp_publicacoes = metricas.contador(
+    "amqp_mensagens_publicadas_total", "Mensagens publicadas no RabbitMQ.", ("exchange", "resultado")
+)
+amqp_publicacao_duracao = metricas.histograma(
+    "amqp_publicacao_duracao_segundos", "Latência das publicações no RabbitMQ, por chamada.", ("operacao",)
+)
+amqp_consumo_duracao = metricas.histograma(
+    "amqp_consumo_duracao_segundos", "Tempo de processamento das mensagens consumidas.", ("fila", "resultado")
+)
+smtp_envio_duracao = metricas.histograma(
+    "smtp_envio_duracao_segundos", "Latência de cada tentativa de envio de e-mail.", ("resultado",)
+)
+
+
+class MetricasMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        metodo = scope["method"]
+        status_code = 500
+
+        async def enviar(mensagem):
+            nonlocal status_code
+            if mensagem["type"] == "http.response.start":
+                status_code = mensagem["status"]
+            await send(mensagem)
+
+        http_em_andamento.inc(metodo)
+        inicio = time.perf_counter()
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            duracao = time.perf_counter() - inicio
+            http_em_andamento.dec(metodo)
+            rota = getattr(scope.get("route"), "path", "nao_encontrada")
+            http_duracao.observar(duracao, metodo, rota)
+            http_requisicoes.inc(metodo, rota, status_code)
+
+
+def instrumentar_engine(engine: "Engine"):
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def antes_de_executar(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.inicio_metricas = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def depois_de_executar(conn, cursor, statement, parameters, context, executemany):
+        inicio = getattr(context, "inicio_metricas", None)
+        operacao = statement.lstrip().split(None, 1)[0].upper()
+
+        db_consultas.inc(operacao)
+        if inicio is not None:
+            db_duracao.observar(time.perf_counter() - inicio, operacao)
+
+
+class ExportadorMetricas:
+    def __init__(self, intervalo: Optional[float] = None):
+        self.__intervalo = intervalo or float(environ.get("METRICAS_INTERVALO", 5))
+        self.__parar = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.__task is None and environ.get("METRICAS_DIRETORIO"):
+            metricas.limpar_orfaos()
+            self.__parar.clear()
+            self.__task = asyncio.create_task(self.__executar())
+
+    async def stop(self):
+        if self.__task is not None:
+            self.__parar.set()
+            await self.__task
+            self.__task = None
+            metricas.remover()
+
+    async def __executar(self):
+        while not self.__parar.is_set():
+            try:
+                await asyncio.wait_for(self.__parar.wait(), timeout=self.__intervalo)
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                metricas.gravar()
+            except OSError as e:
+                print(f"Falha ao gravar as métricas: {e}")
@@ -0,0 +1,24 @@
+import base64
+import json
+from typing import Any, List
+
+from fastapi import HTTPException, status
+
+
+def codificar_cursor(*valores: Any) -> str:
+    return base64.urlsafe_b64encode(json.dumps(valores, default=str).encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor: str, quantidade: int) -> List[Any]:
+    try:
+        valores = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        valores = None
+
+    if not isinstance(valores, list) or len(valores) != quantidade:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido."
+        )
+
+    return valores
@@ -0,0 +1,18 @@
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class RespostaModelo(JSONResponse):
+
+    def __init__(self, content: Any, status_code: Optional[int] = None, exclude_unset: bool = False, **kwargs):
+        self.exclude_unset = exclude_unset
+        super().__init__(content, status_code=status_code or getattr(content, "status_code", 200), **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, exclude_unset=self.exclude_unset)
+
+        return to_json(content)
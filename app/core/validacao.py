@@ -0,0 +1,61 @@
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Optional
+
+from fastapi import Request, status
+from fastapi.dependencies.utils import get_flat_dependant
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+class TabelaSemAcentos(dict):
+    def __missing__(self, codigo: int) -> Optional[int]:
+        valor = None if unicodedata.category(chr(codigo)) == "Mn" else codigo
+        self[codigo] = valor
+        return valor
+
+
+SEM_ACENTOS: TabelaSemAcentos = TabelaSemAcentos({codigo: None for codigo in range(0x0300, 0x0370)})
+
+
+@lru_cache(maxsize=4096)
+def normalizar_texto(texto: str) -> str:
+    texto = " ".join(texto.split())
+
+    if texto.isascii():
+        return texto
+
+    return unicodedata.normalize("NFD", texto).translate(SEM_ACENTOS)
+
+
+def mensagem_validacao(modelo: type, campo, erro: dict) -> Optional[str]:
+    mensagens: Dict[str, Dict[str, str]] = getattr(modelo, "mensagens_erro", {}).get(campo)
+
+    if not mensagens:
+        return None
+
+    entrada = erro.get("input")
+    tipo = "vazio" if isinstance(entrada, str) and not entrada.strip() else erro["type"]
+
+    return mensagens.get(tipo) or mensagens.get(erro["type"]) or mensagens.get("padrao")
+
+
+async def tratar_erro_validacao(request: Request, exc: RequestValidationError) -> JSONResponse:
+    dependant = getattr(request.scope.get("route"), "dependant", None)
+    modelos = [
+        parametro.type_
+        for parametro in (get_flat_dependant(dependant).body_params if dependant else [])
+        if isinstance(parametro.type_, type) and issubclass(parametro.type_, BaseModel)
+    ]
+    erro = exc.errors()[0]
+    local = erro["loc"]
+
+    if len(local) > 1 and local[0] == "body":
+        for modelo in modelos:
+            mensagem = mensagem_validacao(modelo, local[1], erro)
+            if mensagem:
+                return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": mensagem})
+
+    return await request_validation_exception_handler(request, exc)
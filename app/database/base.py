@@ -4,13 +4,23 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessi
 from sqlalchemy.orm import declarative_base
 
 from app.core.configs import settings
+from app.core.metricas import instrumentar_engine
 
 engine: AsyncEngine = create_async_engine(
     settings.DB_URL,
     pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+    },
     future=True,
-    echo=True
+    echo=settings.DB_ECHO
 )
+instrumentar_engine(engine.sync_engine)
 
 Base = declarative_base()
 
@@ -26,3 +36,18 @@ async_session = async_sessionmaker(
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
+
+
+def metricas_pool() -> dict:
+    pool = engine.pool
+    capacidade = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    em_uso = pool.checkedout()
+
+    return {
+        "tamanho": pool.size(),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "em_uso": em_uso,
+        "disponiveis": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "utilizacao": round(em_uso / capacidade, 4) if capacidade else 0.0
+    }
@@ -0,0 +1,47 @@
+from datetime import date
+from typing import List
+
+
+def primeiro_dia_do_mes(dia: date) -> date:
+    return dia.replace(day=1)
+
+
+def proximo_mes(mes: date) -> date:
+    return date(mes.year + mes.month // 12, mes.month % 12 + 1, 1)
+
+
+def meses_a_partir_de(inicio: date, quantidade: int) -> List[date]:
+    meses = [primeiro_dia_do_mes(inicio)]
+
+    while len(meses) < quantidade:
+        meses.append(proximo_mes(meses[-1]))
+
+    return meses
+
+
+def ddl_particao_mensal(tabela: str, mes: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {tabela}_{mes:%Y_%m} PARTITION OF {tabela} "
+        f"FOR VALUES FROM ('{mes:%Y-%m-%d} 00:00:00+00') TO ('{proximo_mes(mes):%Y-%m-%d} 00:00:00+00')"
+    )
+
+
+def ddl_particao_padrao(tabela: str) -> str:
+    return f"CREATE TABLE IF NOT EXISTS {tabela}_padrao PARTITION OF {tabela} DEFAULT"
+
+
+def ddls_particao_mensal_com_padrao(tabela: str, mes: date) -> List[str]:
+    # Linhas do mês que já caíram na partição padrão impedem o CREATE ... PARTITION OF;
+    # a padrão é desanexada, as linhas do mês são movidas para a nova partição e ela é
+    # anexada de volta. Executar em uma única transação.
+    inicio, fim = f"{mes:%Y-%m-%d} 00:00:00+00", f"{proximo_mes(mes):%Y-%m-%d} 00:00:00+00"
+
+    return [
+        f"LOCK TABLE {tabela} IN ACCESS EXCLUSIVE MODE",
+        f"ALTER TABLE {tabela} DETACH PARTITION {tabela}_padrao",
+        ddl_particao_mensal(tabela, mes),
+        f"WITH movidas AS (DELETE FROM {tabela}_padrao "
+        f"WHERE data_criacao >= '{inicio}' AND data_criacao < '{fim}' RETURNING *) "
+        f"INSERT INTO {tabela} SELECT * FROM movidas",
+        f"ALTER TABLE {tabela} ATTACH PARTITION {tabela}_padrao DEFAULT",
+    ]
@@ -0,0 +1,23 @@
+from sqlalchemy import String
+from sqlalchemy.types import TypeDecorator
+
+from app.core.crypto import field_cipher
+
+
+class EncryptedString(TypeDecorator):
+    impl = String
+    cache_ok = True
+
+    def __init__(self, contexto: str):
+        super().__init__()
+        self.contexto = contexto
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return field_cipher.encrypt(value, self.contexto)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return field_cipher.decrypt(value, self.contexto)
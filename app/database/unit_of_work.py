@@ -0,0 +1,68 @@
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.database.base import async_session
+from app.models.cartao_model import CartaoModel
+
+
+class UnitOfWork:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.__cartoes: Dict[UUID, Optional[CartaoModel]] = {}
+        self.__cartoes_por_cpf: Dict[str, List[CartaoModel]] = {}
+        self.__confirmacao_adiada = False
+
+    async def confirmar(self):
+        if self.__confirmacao_adiada:
+            await self.session.flush()
+        else:
+            await self.session.commit()
+
+    @asynccontextmanager
+    async def adiar_confirmacao(self) -> AsyncIterator[None]:
+        self.__confirmacao_adiada = True
+        try:
+            yield
+        finally:
+            self.__confirmacao_adiada = False
+
+    async def cartao(self, uuid: UUID) -> Optional[CartaoModel]:
+        if uuid not in self.__cartoes:
+            query = await self.session.execute(
+                select(CartaoModel).where(CartaoModel.uuid == uuid)
+            )
+            self.__cartoes[uuid] = query.scalars().first()
+
+        return self.__cartoes[uuid]
+
+    async def cartoes_do_titular(self, cpf_titular: str) -> List[CartaoModel]:
+        if cpf_titular not in self.__cartoes_por_cpf:
+            query = await self.session.execute(
+                select(CartaoModel).where(CartaoModel.cpf_titular == cpf_titular)
+            )
+            cartoes = query.scalars().all()
+
+            self.__cartoes_por_cpf[cpf_titular] = cartoes
+            self.__cartoes.update((cartao.uuid, cartao) for cartao in cartoes)
+
+        return self.__cartoes_por_cpf[cpf_titular]
+
+    async def tokens_do_titular(self, cpf_titular: str) -> Sequence:
+        if cpf_titular in self.__cartoes_por_cpf:
+            return self.__cartoes_por_cpf[cpf_titular]
+
+        query = await self.session.execute(
+            select(CartaoModel.uuid, CartaoModel.token, CartaoModel.token_expiracao)
+            .where(CartaoModel.cpf_titular == cpf_titular)
+        )
+        return query.all()
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    async with async_session() as session:
+        yield UnitOfWork(session)
@@ -1,12 +1,63 @@
+import json
+from contextlib import asynccontextmanager
+from os import environ
+from pathlib import Path
+
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.exceptions import RequestValidationError
+from sqlalchemy import text
 
 from app.core.configs import settings
+from app.core.metricas import ExportadorMetricas, MetricasMiddleware
+from app.core.validacao import tratar_erro_validacao
+from app.database.base import engine
 from app.api.v1.api import router
+from app.services.rabbitmq_publisher import RabbitmqPublisher
+from app.services.outbox_relay import OutboxRelay
+from app.services.idempotencia_services import LimpezaIdempotencia
+from app.services.status_services import VarreduraExpiracao
 
 load_dotenv()
 
+CAMINHO_OPENAPI = Path(environ.get("OPENAPI_ARQUIVO", Path(__file__).with_name("openapi.json")))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        async with engine.connect() as conexao:
+            await conexao.execute(text("SELECT 1"))
+    except Exception as e:
+        print(f"Falha ao conectar ao banco de dados na inicialização: {e}")
+
+    app.state.rabbitmq_publisher = RabbitmqPublisher()
+    try:
+        await app.state.rabbitmq_publisher.connect()
+    except HTTPException as e:
+        print(f"Falha ao conectar ao RabbitMQ na inicialização: {e.detail}")
+
+    app.state.outbox_relay = OutboxRelay(app.state.rabbitmq_publisher)
+    app.state.outbox_relay.start()
+    app.state.limpeza_idempotencia = LimpezaIdempotencia()
+    app.state.limpeza_idempotencia.start()
+    app.state.varredura_expiracao = VarreduraExpiracao()
+    app.state.varredura_expiracao.start()
+    app.state.exportador_metricas = ExportadorMetricas()
+    app.state.exportador_metricas.start()
+
+    yield
+
+    await app.state.exportador_metricas.stop()
+    await app.state.varredura_expiracao.stop()
+    await app.state.limpeza_idempotencia.stop()
+    await app.state.outbox_relay.stop()
+    await app.state.rabbitmq_publisher.close()
+    await engine.dispose()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="API de Gerenciamento de Cartões",
     description="""
     Esta API é responsável pelo gerenciamento de cartões de crédito, permitindo a solicitação, atualização, recarga e transferência de saldo entre cartões. Além disso, a API oferece funcionalidades de autenticação e segurança para proteger os dados dos usuários.
@@ -41,8 +92,20 @@ app = FastAPI(
     version="1.1"
 )
 
+app.add_exception_handler(RequestValidationError, tratar_erro_validacao)
+app.add_middleware(MetricasMiddleware)
 app.include_router(router, prefix=settings.API_V1)
 
+
+def openapi_pre_gerado() -> dict:
+    if app.openapi_schema is None and CAMINHO_OPENAPI.is_file():
+        app.openapi_schema = json.loads(CAMINHO_OPENAPI.read_text(encoding="utf-8"))
+
+    return FastAPI.openapi(app)
+
+
+app.openapi = openapi_pre_gerado
+
 if __name__ == '__main__':
     import uvicorn
 
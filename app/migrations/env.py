@@ -24,6 +24,9 @@ if config.config_file_name is not None:
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
 from app.models.cartao_model import CartaoModel
+from app.models.outbox_model import OutboxModel
+from app.models.movimentacao_model import MovimentacaoModel
+from app.models.idempotencia_model import IdempotenciaModel
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
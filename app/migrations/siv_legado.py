@@ -0,0 +1,22 @@
+# Formato anterior do número do cartão (AES-SIV), congelado para as migrações
+# 08a6f046a9d7 e 80643cafdce8; a aplicação grava com AES-GCM e usa o fingerprint HMAC.
+# Não alterar: mudar a derivação ou o formato impede converter os dados já gravados.
+import base64
+
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
+
+from app.core.configs import settings
+from app.core.crypto import carregar_chaves, derivar_chave
+
+_chaves, _chave_ativa = carregar_chaves(settings.FIELD_CIPHER_KEYS, settings.JWT_SECRET)
+_siv = {kid: AESSIV(derivar_chave(chave, 64, b"api-cartoes:aes-siv")) for kid, chave in _chaves.items()}
+
+
+def cifrar_siv(texto: str, contexto: str) -> str:
+    dados = _siv[_chave_ativa].encrypt(texto.encode(), [contexto.encode()])
+    return f"{_chave_ativa}:{base64.urlsafe_b64encode(dados).decode()}"
+
+
+def decifrar_siv(valor: str, contexto: str) -> str:
+    kid, conteudo = valor.split(":", 1)
+    return _siv[kid].decrypt(base64.urlsafe_b64decode(conteudo), [contexto.encode()]).decode()
@@ -0,0 +1,95 @@
+"""Criptografia AES dos campos sensiveis
+
+Revision ID: 08a6f046a9d7
+Revises: 377428141858
+Create Date: 2026-10-18 10:41:27.906114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from jose import jwt
+
+from app.core.configs import settings
+from app.core.crypto import field_cipher
+from app.migrations.siv_legado import cifrar_siv, decifrar_siv
+
+
+# revision identifiers, used by Alembic.
+revision: str = '08a6f046a9d7'
+down_revision: Union[str, None] = '377428141858'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAMANHO_LOTE = 1000
+
+
+cartoes = sa.table(
+    'cartoes',
+    sa.column('id', sa.Integer),
+    sa.column('numero_cartao', sa.String),
+    sa.column('cvv', sa.String),
+    sa.column('token', sa.String),
+)
+
+
+def _jwt_decode(valor: str, campo: str) -> str:
+    return jwt.decode(valor, settings.JWT_SECRET, algorithms=[settings.ALGORITHM])[campo]
+
+
+def _jwt_encode(valor: str, campo: str) -> str:
+    return jwt.encode({campo: valor}, settings.JWT_SECRET, algorithm=settings.ALGORITHM)
+
+
+def _converter(converter_numero, converter_cvv, converter_token) -> None:
+    conn = op.get_bind()
+    ultimo_id = 0
+
+    while True:
+        linhas = conn.execute(
+            sa.select(cartoes)
+            .where(cartoes.c.id > ultimo_id)
+            .order_by(cartoes.c.id)
+            .limit(TAMANHO_LOTE)
+        ).all()
+
+        if not linhas:
+            break
+
+        conn.execute(
+            cartoes.update()
+            .where(cartoes.c.id == sa.bindparam('b_id'))
+            .values(
+                numero_cartao=sa.bindparam('b_numero_cartao'),
+                cvv=sa.bindparam('b_cvv'),
+                token=sa.bindparam('b_token')
+            ),
+            [
+                {
+                    'b_id': linha.id,
+                    'b_numero_cartao': converter_numero(linha.numero_cartao),
+                    'b_cvv': converter_cvv(linha.cvv),
+                    'b_token': converter_token(linha.token)
+                }
+                for linha in linhas
+            ]
+        )
+
+        ultimo_id = linhas[-1].id
+
+
+def upgrade() -> None:
+    _converter(
+        lambda v: cifrar_siv(_jwt_decode(v, 'numero_cartao'), 'numero_cartao'),
+        lambda v: field_cipher.encrypt(_jwt_decode(v, 'cvv'), 'cvv'),
+        lambda v: field_cipher.encrypt(_jwt_decode(v, 'token'), 'token'),
+    )
+
+
+def downgrade() -> None:
+    _converter(
+        lambda v: _jwt_encode(decifrar_siv(v, 'numero_cartao'), 'numero_cartao'),
+        lambda v: _jwt_encode(field_cipher.decrypt(v, 'cvv'), 'cvv'),
+        lambda v: _jwt_encode(field_cipher.decrypt(v, 'token'), 'token'),
+    )
@@ -0,0 +1,65 @@
+"""Criada a tabela movimentacoes
+
+Revision ID: 25e4b54ad4bd
+Revises: ed548bfbf554
+Create Date: 2026-10-18 15:22:09.184377
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.database.particoes import meses_a_partir_de, ddl_particao_mensal, ddl_particao_padrao
+
+
+# revision identifiers, used by Alembic.
+revision: str = '25e4b54ad4bd'
+down_revision: Union[str, None] = 'ed548bfbf554'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MESES_INICIAIS = 12
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('movimentacoes_id_seq')))
+    op.create_table('movimentacoes',
+    sa.Column('id', sa.BigInteger(), server_default=sa.text("nextval('movimentacoes_id_seq')"), nullable=False),
+    sa.Column('data_criacao', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('cartao_id', sa.Integer(), nullable=False),
+    sa.Column('tipo', sa.Enum('CREDITO', 'DEBITO', name='tipomovimentacaoenum'), nullable=False),
+    sa.Column('operacao', sa.Enum('SALDO_INICIAL', 'RECARGA', 'TRANSFERENCIA', 'AJUSTE', name='operacaoenum'), nullable=False),
+    sa.Column('valor_centavos', sa.BigInteger(), nullable=False),
+    sa.Column('saldo_centavos', sa.BigInteger(), nullable=False),
+    sa.Column('contraparte_uuid', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('chave_idempotencia', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['cartao_id'], ['cartoes.id'], ),
+    sa.PrimaryKeyConstraint('id', 'data_criacao'),
+    postgresql_partition_by='RANGE (data_criacao)'
+    )
+    op.create_index(
+        'ix_movimentacoes_cartao_id_data_criacao_id',
+        'movimentacoes',
+        ['cartao_id', sa.text('data_criacao DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+    for mes in meses_a_partir_de(datetime.now(timezone.utc).date(), MESES_INICIAIS):
+        op.execute(ddl_particao_mensal('movimentacoes', mes))
+    op.execute(ddl_particao_padrao('movimentacoes'))
+
+    op.execute(
+        "INSERT INTO movimentacoes (data_criacao, cartao_id, tipo, operacao, valor_centavos, saldo_centavos) "
+        "SELECT now(), id, 'CREDITO', 'SALDO_INICIAL', saldo_centavos, saldo_centavos "
+        "FROM cartoes WHERE saldo_centavos > 0"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('movimentacoes')
+    op.execute(sa.schema.DropSequence(sa.Sequence('movimentacoes_id_seq')))
+    sa.Enum(name='operacaoenum').drop(op.get_bind(), checkfirst=False)
+    sa.Enum(name='tipomovimentacaoenum').drop(op.get_bind(), checkfirst=False)
@@ -0,0 +1,38 @@
+"""Criada a tabela chaves_idempotencia
+
+Revision ID: 277c4d33fe0f
+Revises: 25e4b54ad4bd
+Create Date: 2026-10-18 16:48:30.771205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '277c4d33fe0f'
+down_revision: Union[str, None] = '25e4b54ad4bd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('chaves_idempotencia',
+    sa.Column('escopo', sa.String(), nullable=False),
+    sa.Column('chave', sa.String(), nullable=False),
+    sa.Column('hash_requisicao', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('resposta', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('data_criacao', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('expiracao', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('escopo', 'chave')
+    )
+    op.create_index(op.f('ix_chaves_idempotencia_expiracao'), 'chaves_idempotencia', ['expiracao'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_chaves_idempotencia_expiracao'), table_name='chaves_idempotencia')
+    op.drop_table('chaves_idempotencia')
@@ -0,0 +1,48 @@
+"""Indices compostos da tabela cartoes
+
+Revision ID: 7a87250c3b84
+Revises: 277c4d33fe0f
+Create Date: 2026-10-18 18:12:04.519832
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a87250c3b84'
+down_revision: Union[str, None] = '277c4d33fe0f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_cartoes_cpf_titular_id', 'cartoes', ['cpf_titular', 'id'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_cartoes_cpf_titular_titular_cartao', 'cartoes', ['cpf_titular', 'titular_cartao'],
+                        unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index('ix_cartoes_cpf_titular', table_name='cartoes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_cartoes_titular_cartao', table_name='cartoes', postgresql_concurrently=True,
+                      if_exists=True)
+        op.drop_index('ix_cartoes_endereco', table_name='cartoes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_cartoes_id', table_name='cartoes', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_cartoes_id', 'cartoes', ['id'], unique=False, postgresql_concurrently=True,
+                        if_not_exists=True)
+        op.create_index('ix_cartoes_endereco', 'cartoes', ['endereco'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_cartoes_titular_cartao', 'cartoes', ['titular_cartao'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_cartoes_cpf_titular', 'cartoes', ['cpf_titular'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+
+        op.drop_index('ix_cartoes_cpf_titular_titular_cartao', table_name='cartoes', postgresql_concurrently=True,
+                      if_exists=True)
+        op.drop_index('ix_cartoes_cpf_titular_id', table_name='cartoes', postgresql_concurrently=True,
+                      if_exists=True)
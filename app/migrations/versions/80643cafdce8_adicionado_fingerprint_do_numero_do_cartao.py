@@ -0,0 +1,91 @@
+"""Adicionado fingerprint do numero do cartao
+
+Revision ID: 80643cafdce8
+Revises: 08a6f046a9d7
+Create Date: 2026-10-18 11:58:12.337460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.crypto import field_cipher, fingerprint
+from app.migrations.siv_legado import cifrar_siv, decifrar_siv
+
+
+# revision identifiers, used by Alembic.
+revision: str = '80643cafdce8'
+down_revision: Union[str, None] = '08a6f046a9d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAMANHO_LOTE = 1000
+
+
+cartoes = sa.table(
+    'cartoes',
+    sa.column('id', sa.Integer),
+    sa.column('numero_cartao', sa.String),
+    sa.column('numero_cartao_fingerprint', sa.String),
+)
+
+
+def _converter(converter) -> None:
+    conn = op.get_bind()
+    ultimo_id = 0
+
+    while True:
+        linhas = conn.execute(
+            sa.select(cartoes.c.id, cartoes.c.numero_cartao)
+            .where(cartoes.c.id > ultimo_id)
+            .order_by(cartoes.c.id)
+            .limit(TAMANHO_LOTE)
+        ).all()
+
+        if not linhas:
+            break
+
+        conn.execute(
+            cartoes.update()
+            .where(cartoes.c.id == sa.bindparam('b_id'))
+            .values(
+                numero_cartao=sa.bindparam('b_numero_cartao'),
+                numero_cartao_fingerprint=sa.bindparam('b_fingerprint')
+            ),
+            [{'b_id': linha.id, **converter(linha.numero_cartao)} for linha in linhas]
+        )
+
+        ultimo_id = linhas[-1].id
+
+
+def _para_gcm(valor: str) -> dict:
+    numero_cartao = decifrar_siv(valor, 'numero_cartao')
+    return {
+        'b_numero_cartao': field_cipher.encrypt(numero_cartao, 'numero_cartao'),
+        'b_fingerprint': fingerprint(numero_cartao)
+    }
+
+
+def _para_siv(valor: str) -> dict:
+    numero_cartao = field_cipher.decrypt(valor, 'numero_cartao')
+    return {
+        'b_numero_cartao': cifrar_siv(numero_cartao, 'numero_cartao'),
+        'b_fingerprint': None
+    }
+
+
+def upgrade() -> None:
+    op.add_column('cartoes', sa.Column('numero_cartao_fingerprint', sa.String(length=64), nullable=True))
+    _converter(_para_gcm)
+    op.alter_column('cartoes', 'numero_cartao_fingerprint', nullable=False)
+    op.create_unique_constraint('cartoes_numero_cartao_fingerprint_key', 'cartoes', ['numero_cartao_fingerprint'])
+    op.drop_constraint('cartoes_numero_cartao_key', 'cartoes', type_='unique')
+
+
+def downgrade() -> None:
+    op.drop_constraint('cartoes_numero_cartao_fingerprint_key', 'cartoes', type_='unique')
+    op.alter_column('cartoes', 'numero_cartao_fingerprint', nullable=True)
+    _converter(_para_siv)
+    op.create_unique_constraint('cartoes_numero_cartao_key', 'cartoes', ['numero_cartao'])
+    op.drop_column('cartoes', 'numero_cartao_fingerprint')
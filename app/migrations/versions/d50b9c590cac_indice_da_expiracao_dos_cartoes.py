@@ -0,0 +1,28 @@
+"""Indice da expiracao dos cartoes
+
+Revision ID: d50b9c590cac
+Revises: 7a87250c3b84
+Create Date: 2026-10-18 19:02:41.118274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd50b9c590cac'
+down_revision: Union[str, None] = '7a87250c3b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_cartoes_expiracao', 'cartoes', ['expiracao'], unique=False,
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_cartoes_expiracao', table_name='cartoes', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,32 @@
+"""Saldo em centavos
+
+Revision ID: ed548bfbf554
+Revises: 80643cafdce8
+Create Date: 2026-10-18 14:05:41.512803
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ed548bfbf554'
+down_revision: Union[str, None] = '80643cafdce8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('cartoes', sa.Column('saldo_centavos', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute('UPDATE cartoes SET saldo_centavos = ROUND(saldo::numeric * 100)::bigint')
+    op.alter_column('cartoes', 'saldo_centavos', server_default=None)
+    op.drop_column('cartoes', 'saldo')
+
+
+def downgrade() -> None:
+    op.add_column('cartoes', sa.Column('saldo', sa.Float(), server_default='0', nullable=False))
+    op.execute('UPDATE cartoes SET saldo = saldo_centavos / 100.0')
+    op.alter_column('cartoes', 'saldo', server_default=None)
+    op.drop_column('cartoes', 'saldo_centavos')
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database.base import Base
+
+
+class IdempotenciaModel(Base):
+    __tablename__ = 'chaves_idempotencia'
+
+    escopo = Column(String, primary_key=True)
+    chave = Column(String, primary_key=True)
+    hash_requisicao = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    resposta = Column(JSONB, nullable=True)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    expiracao = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,47 @@
+import enum
+from datetime import datetime, timezone
+
+from sqlalchemy import Enum, Column, Integer, BigInteger, String, DateTime, ForeignKey, Index, Sequence
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database.base import Base
+
+
+class TipoMovimentacaoEnum(enum.Enum):
+    CREDITO = "CREDITO"
+    DEBITO = "DEBITO"
+
+
+class OperacaoEnum(enum.Enum):
+    SALDO_INICIAL = "SALDO_INICIAL"
+    RECARGA = "RECARGA"
+    TRANSFERENCIA = "TRANSFERENCIA"
+    AJUSTE = "AJUSTE"
+
+
+class MovimentacaoModel(Base):
+    __tablename__ = 'movimentacoes'
+    __table_args__ = (
+        Index(
+            'ix_movimentacoes_cartao_id_data_criacao_id',
+            'cartao_id',
+            'data_criacao',
+            'id',
+            postgresql_ops={'data_criacao': 'DESC', 'id': 'DESC'}
+        ),
+        {'postgresql_partition_by': 'RANGE (data_criacao)'},
+    )
+
+    id = Column(BigInteger, Sequence('movimentacoes_id_seq'), primary_key=True)
+    data_criacao = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(timezone.utc)
+    )
+    cartao_id = Column(Integer, ForeignKey('cartoes.id'), nullable=False)
+    tipo = Column(Enum(TipoMovimentacaoEnum), nullable=False)
+    operacao = Column(Enum(OperacaoEnum), nullable=False)
+    valor_centavos = Column(BigInteger, nullable=False)
+    saldo_centavos = Column(BigInteger, nullable=False)
+    contraparte_uuid = Column(UUID(as_uuid=True), nullable=True)
+    chave_idempotencia = Column(String, nullable=True)
@@ -0,0 +1,16 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.database.base import Base
+
+
+class OutboxModel(Base):
+    __tablename__ = 'outbox'
+
+    id = Column(BigInteger, primary_key=True)
+    exchange = Column(String, nullable=False)
+    routing_key = Column(String, nullable=False)
+    payload = Column(JSONB, nullable=False)
+    data_criacao = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
@@ -1,99 +1,90 @@
-import unicodedata
+from decimal import Decimal
 from uuid import UUID
-from typing import List, Optional
+from typing import Annotated, Any, Callable, ClassVar, Dict, List, Optional
 
 from fastapi import HTTPException, status
-from pydantic import BaseModel, field_validator, Field
-from pytz import timezone
+from pydantic import AfterValidator, BaseModel, Field, StringConstraints
+from pydantic_core import PydanticCustomError
 
+from app.core.configs import FUSO_HORARIO
+from app.core.dinheiro import CENTAVO, LIMITE_SALDO_CENTAVOS, de_centavos
+from app.core.validacao import normalizar_texto
 from app.models.cartao_model import CartaoModel, StatusEnum
 
 
+def validar_tamanho_cpf(cpf: str) -> str:
+    if len(cpf) != 11:
+        raise PydanticCustomError("cpf_tamanho", "O CPF deve conter exatamente 11 dígitos.")
+    return cpf
+
+
+TextoNormalizado = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, min_length=1),
+    AfterValidator(normalizar_texto)
+]
+NomeTitular = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, min_length=1, pattern=r"^[\p{L}\s]+$"),
+    AfterValidator(normalizar_texto)
+]
+Cpf = Annotated[str, StringConstraints(pattern=r"^[0-9]+$"), AfterValidator(validar_tamanho_cpf)]
+Valor = Annotated[
+    Decimal,
+    Field(ge=0, le=LIMITE_SALDO_CENTAVOS * CENTAVO, decimal_places=2, allow_inf_nan=False),
+    AfterValidator(lambda valor: valor.quantize(CENTAVO))
+]
+
+MENSAGENS_VALOR: Dict[str, str] = {
+    "greater_than_equal": "O valor da recarga deve ser maior do que 0.",
+    "less_than_equal": f"O valor da recarga não pode ser maior do que R${de_centavos(LIMITE_SALDO_CENTAVOS):.2f}.",
+    "padrao": "O valor da recarga deve ser um número válido."
+}
+
+
 class CartaoRequest(BaseModel):
-    titular_cartao: str = Field(
+    titular_cartao: NomeTitular = Field(
         title="Nome completo do titular",
         description="Nome completo do titular do cartão.",
         examples=["JOAO DA SILVA"]
     )
-    cpf_titular: str = Field(
+    cpf_titular: Cpf = Field(
         title="CPF do titular",
         description="CPF do titular do cartão.",
         examples=["12345678912"]
     )
-    endereco: str = Field(
+    endereco: TextoNormalizado = Field(
         title="Endereço do titular",
         description="Endereço completo do titular do cartão.",
         examples=["RUA DA FELICIDADE, BAIRRO ALEGRIA"]
     )
-    email: str = Field(
+    email: TextoNormalizado = Field(
         title="E-mail do titular",
         description="E-mail do titular do cartão.",
         examples=["JOAODASILVA@EMAIL.COM"]
     )
 
+    mensagens_erro: ClassVar[Dict[str, Dict[str, str]]] = {
+        "titular_cartao": {
+            "vazio": "Nome titular é um campo obrigatório e não pode ser uma string vazia.",
+            "string_pattern_mismatch": "O nome do titular deve ser composto apenas por letras."
+        },
+        "cpf_titular": {
+            "vazio": "CPF é um campo obrigatório e não pode ser uma string vazia.",
+            "string_pattern_mismatch": "O CPF deve conter apenas números.",
+            "cpf_tamanho": "O CPF deve conter exatamente 11 dígitos."
+        },
+        "endereco": {
+            "vazio": "Endereço é um campo obrigatório e não pode ser uma string vazia."
+        },
+        "email": {
+            "vazio": "E-mail é um campo obrigatório e não pode ser uma string vazia."
+        }
+    }
+
     class Config:
         from_attributes = True
 
-    @field_validator("endereco", mode="before")
-    def validator_endereco(cls, v):
-        if not v.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Endereço é um campo obrigatório e não pode ser uma string vazia."
-            )
-        v = " ".join(v.split())
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-        )
-
-    @field_validator("titular_cartao", mode="before")
-    def validator_titular_cartao(cls, v):
-        if not v.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Nome titular é um campo obrigatório e não pode ser uma string vazia."
-            )
-        v = " ".join(v.split())
-        if not all(parte.isalpha() or parte.isspace() for parte in v):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O nome do titular deve ser composto apenas por letras."
-            )
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-        )
-
-    @field_validator('cpf_titular', mode="before")
-    def validar_cpf(cls, v):
-        if not v.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="CPF é um campo obrigatório e não pode ser uma string vazia."
-            )
-        if not v.isdigit():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O CPF deve conter apenas números."
-            )
-        if len(v) != 11:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O CPF deve conter exatamente 11 dígitos."
-            )
-        return v
-
-    @field_validator("email", mode="before")
-    def validator_email(cls, v):
-        if not v.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="E-mail é um campo obrigatório e não pode ser uma string vazia."
-            )
-        v = " ".join(v.split())
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-        )
-
 
 class CartaoRequestResponse(BaseModel):
     titular_cartao: str = Field(
@@ -122,12 +113,12 @@ class CartaoRequestResponse(BaseModel):
 
     @classmethod
     def from_model(cls, cartao: CartaoModel) -> "CartaoRequestResponse":
-        return cls(
+        return cls.model_construct(
             titular_cartao=cartao.titular_cartao,
             cpf_titular=cartao.cpf_titular,
             endereco=cartao.endereco,
             status=cartao.status,
-            token=cartao.hash_token_descriptografado
+            token=cartao.token
         )
 
 
@@ -146,6 +137,49 @@ class CartaoResponseWrapper(BaseModel):
     )
 
 
+class CartaoLoteItemResponse(BaseModel):
+    indice: int = Field(
+        title="Índice do item",
+        description="Posição do item no lote enviado, começando em 0."
+    )
+    status_code: int = Field(
+        title="Código HTTP do item",
+        description="Código HTTP indicando o resultado da solicitação do item."
+    )
+    detail: Optional[str] = Field(
+        None,
+        title="Detalhe do erro",
+        description="Motivo da rejeição do item, quando houver."
+    )
+    data: Optional[CartaoRequestResponse] = Field(
+        None,
+        title="Dados do cartão criado",
+        description="Dados do cartão criado para o item."
+    )
+
+
+class CartaoLoteResponse(BaseModel):
+    itens: List[CartaoLoteItemResponse] = Field(
+        title="Resultado por item",
+        description="Resultado da solicitação de cada item do lote, na ordem de envio."
+    )
+
+
+class CartaoLoteWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: CartaoLoteResponse = Field(
+        title="Resultado do lote",
+        description="Resultado da solicitação de cada cartão do lote."
+    )
+
+
 class CartaoResponse(BaseModel):
     uuid: UUID = Field(
         title="UUID do cartão",
@@ -171,9 +205,9 @@ class CartaoResponse(BaseModel):
         title="Endereço do titular",
         description="Endereço completo do titular do cartão."
     )
-    saldo: float = Field(
+    saldo: Decimal = Field(
         title="Saldo do cartão",
-        description="Saldo atual do cartão."
+        description="Saldo atual do cartão, como decimal exato."
     )
     numero_cartao: str = Field(
         title="Número do cartão",
@@ -201,7 +235,7 @@ class CartaoResponse(BaseModel):
 
     @classmethod
     def from_model(cls, cartao: CartaoModel) -> "CartaoResponse":
-        return cls(
+        return cls.model_construct(
             uuid=cartao.uuid,
             titular_cartao=cartao.titular_cartao,
             cpf_titular=cartao.cpf_titular,
@@ -209,18 +243,123 @@ class CartaoResponse(BaseModel):
             email=cartao.email,
             endereco=cartao.endereco,
             saldo=cartao.saldo,
-            numero_cartao=cartao.numero_cartao_descriptografado,
-            cvv=cartao.cvv_descriptografado,
+            numero_cartao=cartao.numero_cartao,
+            cvv=cartao.cvv,
             expiracao=cartao.expiracao.strftime("%m/%Y"),
-            data_criacao=cartao.data_criacao.astimezone(timezone('America/Sao_Paulo')).strftime('%d/%m/%Y %H:%M:%S'),
-            token=cartao.hash_token_descriptografado
+            data_criacao=cartao.data_criacao.astimezone(FUSO_HORARIO).strftime('%d/%m/%Y %H:%M:%S'),
+            token=cartao.token
         )
 
 
+COLUNAS_CAMPOS: Dict[str, str] = {"saldo": "saldo_centavos"}
+
+FORMATADORES_CAMPOS: Dict[str, Callable[[Any], Any]] = {
+    "saldo": lambda linha: de_centavos(linha.saldo_centavos),
+    "expiracao": lambda linha: linha.expiracao.strftime("%m/%Y"),
+    "data_criacao": lambda linha: linha.data_criacao.astimezone(FUSO_HORARIO).strftime('%d/%m/%Y %H:%M:%S')
+}
+
+
+class CartaoParcialResponse(BaseModel):
+    uuid: Optional[UUID] = Field(
+        default=None,
+        title="UUID do cartão",
+        description="Identificador único do cartão."
+    )
+    titular_cartao: Optional[str] = Field(
+        default=None,
+        title="Nome do titular do cartão",
+        description="Nome completo do titular do cartão."
+    )
+    cpf_titular: Optional[str] = Field(
+        default=None,
+        title="CPF do titular",
+        description="CPF do titular do cartão."
+    )
+    status: Optional[StatusEnum] = Field(
+        default=None,
+        title="Status do cartão",
+        description="Status atual do cartão."
+    )
+    email: Optional[str] = Field(
+        default=None,
+        title="E-mail do titular",
+        description="E-mail do titular do cartão."
+    )
+    endereco: Optional[str] = Field(
+        default=None,
+        title="Endereço do titular",
+        description="Endereço completo do titular do cartão."
+    )
+    saldo: Optional[Decimal] = Field(
+        default=None,
+        title="Saldo do cartão",
+        description="Saldo atual do cartão, como decimal exato."
+    )
+    numero_cartao: Optional[str] = Field(
+        default=None,
+        title="Número do cartão",
+        description="Número do cartão de crédito."
+    )
+    cvv: Optional[str] = Field(
+        default=None,
+        title="CVV do cartão",
+        description="Código de verificação do cartão."
+    )
+    expiracao: Optional[str] = Field(
+        default=None,
+        title="Data de expiração",
+        description="Data de expiração do cartão no formato MM/AAAA."
+    )
+    data_criacao: Optional[str] = Field(
+        default=None,
+        title="Data de criação",
+        description="Data e hora em que o cartão foi criado, no formato dd/MM/yyyy HH:mm:ss."
+    )
+    token: Optional[str] = Field(
+        default=None,
+        title="Token de acesso",
+        description="Token de acesso do CPF vinculado ao cartão."
+    )
+
+    @classmethod
+    def campos(cls, fields: Optional[str]) -> List[str]:
+        if fields is None:
+            return list(cls.model_fields)
+
+        campos = list(dict.fromkeys(campo.strip() for campo in fields.split(",") if campo.strip()))
+        invalidos = [campo for campo in campos if campo not in cls.model_fields]
+
+        if not campos or invalidos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos inválidos em fields: {', '.join(invalidos) or fields}. "
+                       f"Campos disponíveis: {', '.join(cls.model_fields)}."
+            )
+
+        return campos
+
+    @staticmethod
+    def colunas(campos: List[str]) -> list:
+        return [getattr(CartaoModel, COLUNAS_CAMPOS.get(campo, campo)) for campo in campos]
+
+    @classmethod
+    def from_row(cls, linha, campos: List[str]) -> "CartaoParcialResponse":
+        return cls.model_construct(**{
+            campo: FORMATADORES_CAMPOS[campo](linha) if campo in FORMATADORES_CAMPOS else getattr(linha, campo)
+            for campo in campos
+        })
+
+
 class CartoesPorCpfResponse(BaseModel):
-    cartoes: List[CartaoResponse] = Field(
+    cartoes: List[CartaoParcialResponse] = Field(
         title="Lista de cartões",
-        description="Lista de cartões associados ao CPF fornecido."
+        description="Página de cartões associados ao CPF fornecido, contendo apenas os campos solicitados."
+    )
+    proximo_cursor: Optional[str] = Field(
+        default=None,
+        title="Cursor da próxima página",
+        description="Valor a ser enviado no parâmetro cursor para obter a próxima página, ou nulo na última página."
     )
 
 
@@ -240,13 +379,13 @@ class CartoesPorCpfWrapper(BaseModel):
 
 
 class CartaoUpdate(BaseModel):
-    titular_cartao: Optional[str] = Field(
+    titular_cartao: Optional[NomeTitular] = Field(
         None,
         title="Nome do titular do cartão",
         description="Nome completo do titular do cartão.",
         examples=['JOAO DA SILVA']
     )
-    endereco: Optional[str] = Field(
+    endereco: Optional[TextoNormalizado] = Field(
         None,
         title="Endereço do titular",
         description="Endereço completo do titular do cartão.",
@@ -258,77 +397,34 @@ class CartaoUpdate(BaseModel):
         description="Status atual do cartão.",
         examples=["ATIVO"]
     )
-    email: Optional[str] = Field(
+    email: Optional[TextoNormalizado] = Field(
         None,
         title="E-mail do titular",
         description="E-mail do titular do cartão",
         examples=["JOAODASILVA@EMAIL.COM"]
     )
 
+    mensagens_erro: ClassVar[Dict[str, Dict[str, str]]] = {
+        "titular_cartao": {
+            "vazio": "O nome do titular não pode ser uma string vazia.",
+            "string_pattern_mismatch": "O nome do titular deve ser composto apenas por letras."
+        },
+        "endereco": {
+            "vazio": "Endereço inválido. O endereço não pode ser vazio."
+        },
+        "status": {
+            "vazio": "O status não pode ser uma string vazia.",
+            "enum": "O status fornecido deve ser do tipo StatusEnum."
+        },
+        "email": {
+            "vazio": "E-mail é um campo obrigatório e não pode ser uma string vazia."
+        }
+    }
+
     class Config:
         from_attributes = True
         extra = "forbid"
 
-    @field_validator("endereco", mode="before")
-    def validator_endereco(cls, v):
-        if v is not None:
-            if not v.strip():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Endereço inválido. O endereço não pode ser vazio."
-                )
-            v = " ".join(v.split())
-            return ''.join(
-                c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-            )
-        return v
-
-    @field_validator("titular_cartao", mode="before")
-    def validator_titular_cartao(cls, v):
-        if v is not None:
-            if not v.strip():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O nome do titular não pode ser uma string vazia."
-                )
-            v = " ".join(v.split())
-            if not all(parte.isalpha() or parte.isspace() for parte in v):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O nome do titular deve ser composto apenas por letras."
-                )
-            return ''.join(
-                c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-            )
-        return v
-
-    @field_validator("status", mode="before")
-    def validator_status(cls, v):
-        if v is not None:
-            if not v.strip():
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O status não pode ser uma string vazia."
-                )
-            if v not in StatusEnum:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O status fornecido deve ser do tipo StatusEnum."
-                )
-        return v
-
-    @field_validator("email", mode="before")
-    def validator_email(cls, v):
-        if not v.strip():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="E-mail é um campo obrigatório e não pode ser uma string vazia."
-            )
-        v = " ".join(v.split())
-        return ''.join(
-            c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
-        )
-
 
 class CartaoUpdateWrapper(BaseModel):
     status_code: int = Field(
@@ -346,29 +442,19 @@ class CartaoUpdateWrapper(BaseModel):
 
 
 class CartaoRecarga(BaseModel):
-    valor: float = Field(
+    valor: Valor = Field(
         title="Valor da recarga",
-        description="Valor da recarga a ser inserida no cartão do UUID informado.",
-        examples=[10.00]
+        description="Valor da recarga a ser inserida no cartão do UUID informado, com até duas casas decimais.",
+        examples=["10.00"]
     )
 
+    mensagens_erro: ClassVar[Dict[str, Dict[str, str]]] = {
+        "valor": MENSAGENS_VALOR
+    }
+
     class Config:
         from_attributes = True
 
-    @field_validator("valor", mode="before")
-    def validator_valor(cls, v):
-        if not isinstance(v, (float, int)):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O valor da recarga deve ser um número válido."
-            )
-        if v < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O valor da recarga deve ser maior do que 0."
-            )
-        return float(v)
-
 
 class CartaoRecargaWrapper(BaseModel):
     status_code: int = Field(
@@ -396,25 +482,15 @@ class CartaoTransferir(BaseModel):
         description="Identificador do recebente.",
         examples=['4ddde01x-10zz-41c9-j3eg-0nbw2e4a2ja7']
     )
-    valor: float = Field(
+    valor: Valor = Field(
         title="Valor a ser transferido",
-        description="Valor a ser transferido para outro cartão.",
-        examples=[200.00]
+        description="Valor a ser transferido para outro cartão, com até duas casas decimais.",
+        examples=["200.00"]
     )
 
-    @field_validator("valor", mode="before")
-    def validator_valor(cls, v):
-        if not isinstance(v, (float, int)):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O valor da recarga deve ser um número válido."
-            )
-        if v < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O valor da recarga deve ser maior do que 0."
-            )
-        return float(v)
+    mensagens_erro: ClassVar[Dict[str, Dict[str, str]]] = {
+        "valor": MENSAGENS_VALOR
+    }
 
 
 class CartaoTransferirWrapper(BaseModel):
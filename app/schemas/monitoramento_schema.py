@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field
+
+
+class PoolConexoesResponse(BaseModel):
+    tamanho: int = Field(
+        title="Tamanho do pool",
+        description="Quantidade de conexões mantidas abertas pelo pool."
+    )
+    max_overflow: int = Field(
+        title="Overflow máximo",
+        description="Quantidade máxima de conexões extras além do tamanho do pool."
+    )
+    em_uso: int = Field(
+        title="Conexões em uso",
+        description="Quantidade de conexões emprestadas no momento."
+    )
+    disponiveis: int = Field(
+        title="Conexões disponíveis",
+        description="Quantidade de conexões ociosas no pool."
+    )
+    overflow: int = Field(
+        title="Conexões de overflow",
+        description="Quantidade de conexões extras abertas no momento."
+    )
+    utilizacao: float = Field(
+        title="Utilização do pool",
+        description="Fração da capacidade total (tamanho + overflow máximo) em uso."
+    )
+
+
+class PoolConexoesWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: PoolConexoesResponse = Field(
+        title="Métricas do pool",
+        description="Métricas de utilização do pool de conexões com o banco de dados."
+    )
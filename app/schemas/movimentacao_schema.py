@@ -0,0 +1,75 @@
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.configs import FUSO_HORARIO
+from app.core.dinheiro import de_centavos
+from app.models.movimentacao_model import MovimentacaoModel, TipoMovimentacaoEnum, OperacaoEnum
+
+
+class MovimentacaoResponse(BaseModel):
+    tipo: TipoMovimentacaoEnum = Field(
+        title="Tipo da movimentação",
+        description="Indica se a movimentação foi um crédito ou um débito no cartão."
+    )
+    operacao: OperacaoEnum = Field(
+        title="Operação",
+        description="Operação que originou a movimentação."
+    )
+    valor: Decimal = Field(
+        title="Valor",
+        description="Valor movimentado, como decimal exato."
+    )
+    saldo: Decimal = Field(
+        title="Saldo após a movimentação",
+        description="Saldo do cartão imediatamente após a movimentação."
+    )
+    contraparte_uuid: Optional[UUID] = Field(
+        default=None,
+        title="UUID da contraparte",
+        description="Cartão de origem ou destino, em transferências."
+    )
+    data_criacao: str = Field(
+        title="Data da movimentação",
+        description="Data e hora em que a movimentação foi registrada."
+    )
+
+    @classmethod
+    def from_model(cls, movimentacao: MovimentacaoModel) -> "MovimentacaoResponse":
+        return cls.model_construct(
+            tipo=movimentacao.tipo,
+            operacao=movimentacao.operacao,
+            valor=de_centavos(movimentacao.valor_centavos),
+            saldo=de_centavos(movimentacao.saldo_centavos),
+            contraparte_uuid=movimentacao.contraparte_uuid,
+            data_criacao=movimentacao.data_criacao.astimezone(FUSO_HORARIO).strftime('%d/%m/%Y %H:%M:%S')
+        )
+
+
+class ExtratoResponse(BaseModel):
+    movimentacoes: List[MovimentacaoResponse] = Field(
+        title="Movimentações",
+        description="Movimentações do cartão, da mais recente para a mais antiga."
+    )
+    proximo_cursor: Optional[str] = Field(
+        default=None,
+        title="Cursor da próxima página",
+        description="Valor a ser enviado no parâmetro cursor para obter a próxima página, ou nulo na última página."
+    )
+
+
+class ExtratoWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: ExtratoResponse = Field(
+        title="Extrato do cartão",
+        description="Página do extrato do cartão."
+    )
@@ -0,0 +1,58 @@
+from uuid import UUID
+from typing import Annotated, ClassVar, Dict, List
+
+from pydantic import AfterValidator, BaseModel, Field
+
+from app.models.cartao_model import StatusEnum
+
+LIMITE_TRANSICAO_STATUS = 5000
+
+
+class TransicaoStatusRequest(BaseModel):
+    uuids: Annotated[
+        List[UUID],
+        Field(min_length=1, max_length=LIMITE_TRANSICAO_STATUS),
+        AfterValidator(lambda uuids: list(dict.fromkeys(uuids)))
+    ] = Field(
+        title="UUIDs dos cartões",
+        description=f"UUIDs dos cartões que terão o status alterado (até {LIMITE_TRANSICAO_STATUS}).",
+        examples=[["fb1d729b-46f7-4b2d-8b29-73eedc149e24"]]
+    )
+    status: StatusEnum = Field(
+        title="Novo status",
+        description="Status de destino dos cartões.",
+        examples=["BLOQUEADO"]
+    )
+
+    mensagens_erro: ClassVar[Dict[str, Dict[str, str]]] = {
+        "uuids": {
+            "too_short": f"A lista de UUIDs deve conter entre 1 e {LIMITE_TRANSICAO_STATUS} cartões.",
+            "too_long": f"A lista de UUIDs deve conter entre 1 e {LIMITE_TRANSICAO_STATUS} cartões."
+        }
+    }
+
+
+class TransicaoStatusResponse(BaseModel):
+    atualizados: List[UUID] = Field(
+        title="Cartões atualizados",
+        description="UUIDs dos cartões que passaram para o novo status."
+    )
+    ignorados: List[UUID] = Field(
+        title="Cartões ignorados",
+        description="UUIDs não encontrados ou cujo status atual não permite a transição solicitada."
+    )
+
+
+class TransicaoStatusWrapper(BaseModel):
+    status_code: int = Field(
+        title="Código HTTP",
+        description="Código HTTP indicando o status da operação."
+    )
+    message: str = Field(
+        title="Mensagem de resposta",
+        description="Mensagem que descreve o resultado da operação."
+    )
+    data: TransicaoStatusResponse = Field(
+        title="Resultado da transição",
+        description="Cartões atualizados e ignorados."
+    )
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+from datetime import date, datetime, timezone
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.database.base import engine
+from app.database.particoes import meses_a_partir_de, ddls_particao_mensal_com_padrao
+
+load_dotenv()
+
+
+async def garantir_particao(conn: AsyncConnection, tabela: str, mes: date) -> bool:
+    if await conn.scalar(text("SELECT to_regclass(:nome)"), {"nome": f"{tabela}_{mes:%Y_%m}"}) is not None:
+        return False
+
+    for ddl in ddls_particao_mensal_com_padrao(tabela, mes):
+        await conn.execute(text(ddl))
+
+    return True
+
+
+async def criar_particoes(meses: int) -> int:
+    async with engine.begin() as conn:
+        for mes in meses_a_partir_de(datetime.now(timezone.utc).date(), meses):
+            if await garantir_particao(conn, "movimentacoes", mes):
+                print(f"Partição movimentacoes_{mes:%Y_%m} criada.")
+            else:
+                print(f"Partição movimentacoes_{mes:%Y_%m} já existe.")
+
+    return meses
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--meses", type=int, default=3)
+    asyncio.run(criar_particoes(parser.parse_args().meses))
@@ -0,0 +1,25 @@
+import argparse
+import json
+from pathlib import Path
+
+from dotenv import load_dotenv
+from fastapi import FastAPI
+
+from app.main import CAMINHO_OPENAPI, app
+
+load_dotenv()
+
+
+def gerar_openapi(destino: Path) -> dict:
+    app.openapi_schema = None
+    documento = FastAPI.openapi(app)
+    destino.write_text(json.dumps(documento, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    print(f"Documento OpenAPI gerado em {destino}.")
+
+    return documento
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--destino", type=Path, default=CAMINHO_OPENAPI)
+    gerar_openapi(parser.parse_args().destino)
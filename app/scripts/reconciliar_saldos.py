@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+
+from dotenv import load_dotenv
+from sqlalchemy import bindparam, case, func, update
+from sqlalchemy.future import select
+
+from app.database.base import async_session
+from app.models.cartao_model import CartaoModel
+from app.models.movimentacao_model import MovimentacaoModel, TipoMovimentacaoEnum
+
+load_dotenv()
+
+TAMANHO_LOTE = 1000
+
+
+def consulta_divergencias():
+    saldo_ledger = (
+        select(
+            MovimentacaoModel.cartao_id,
+            func.sum(
+                case(
+                    (MovimentacaoModel.tipo == TipoMovimentacaoEnum.CREDITO, MovimentacaoModel.valor_centavos),
+                    else_=-MovimentacaoModel.valor_centavos
+                )
+            ).label("saldo_centavos")
+        )
+        .group_by(MovimentacaoModel.cartao_id)
+        .subquery()
+    )
+    esperado = func.coalesce(saldo_ledger.c.saldo_centavos, 0)
+
+    return (
+        select(CartaoModel.id, CartaoModel.saldo_centavos, esperado.label("esperado"))
+        .outerjoin(saldo_ledger, saldo_ledger.c.cartao_id == CartaoModel.id)
+        .where(CartaoModel.saldo_centavos != esperado)
+        .order_by(CartaoModel.id)
+    )
+
+
+async def corrigir(divergencias) -> int:
+    tabela = CartaoModel.__table__
+
+    async with async_session() as session:
+        resultado = await session.execute(
+            update(tabela)
+            .where(tabela.c.id == bindparam("b_id"), tabela.c.saldo_centavos == bindparam("b_observado"))
+            .values(saldo_centavos=bindparam("b_esperado")),
+            [
+                {"b_id": id_cartao, "b_observado": observado, "b_esperado": esperado}
+                for id_cartao, observado, esperado in divergencias
+            ]
+        )
+        await session.commit()
+
+        return resultado.rowcount
+
+
+async def reconciliar_saldos(aplicar_correcoes: bool = False) -> int:
+    total = 0
+    corrigidos = 0
+    lote = []
+
+    async with async_session() as session:
+        await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        resultado = await session.stream(
+            consulta_divergencias().execution_options(yield_per=TAMANHO_LOTE)
+        )
+
+        async for linha in resultado:
+            total += 1
+            print(
+                f"Cartão {linha.id}: saldo {linha.saldo_centavos} centavos, "
+                f"ledger {linha.esperado} centavos."
+            )
+
+            if aplicar_correcoes:
+                lote.append((linha.id, linha.saldo_centavos, linha.esperado))
+
+                if len(lote) >= TAMANHO_LOTE:
+                    corrigidos += await corrigir(lote)
+                    lote = []
+
+    if lote:
+        corrigidos += await corrigir(lote)
+
+    print(f"{total} divergência(s) encontrada(s), {corrigidos} corrigida(s).")
+
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corrigir", action="store_true")
+    asyncio.run(reconciliar_saldos(parser.parse_args().corrigir))
@@ -0,0 +1,56 @@
+import asyncio
+
+from dotenv import load_dotenv
+from sqlalchemy import String, or_, not_, type_coerce
+from sqlalchemy.future import select
+from sqlalchemy.orm.attributes import flag_modified
+
+from app.core.crypto import field_cipher
+from app.database.base import async_session
+from app.models.cartao_model import CartaoModel
+
+load_dotenv()
+
+TAMANHO_LOTE = 500
+CAMPOS = ("numero_cartao", "cvv", "token")
+
+
+async def rotacionar_chaves() -> int:
+    prefixo = f"{field_cipher.chave_ativa}:"
+    total = 0
+    ultimo_id = 0
+
+    async with async_session() as session:
+        while True:
+            query = await session.execute(
+                select(CartaoModel)
+                .where(
+                    CartaoModel.id > ultimo_id,
+                    or_(*(
+                        not_(type_coerce(getattr(CartaoModel, campo), String).startswith(prefixo))
+                        for campo in CAMPOS
+                    ))
+                )
+                .order_by(CartaoModel.id)
+                .limit(TAMANHO_LOTE)
+            )
+            cartoes = query.scalars().all()
+
+            if not cartoes:
+                break
+
+            for cartao in cartoes:
+                for campo in CAMPOS:
+                    flag_modified(cartao, campo)
+
+            await session.commit()
+
+            total += len(cartoes)
+            ultimo_id = cartoes[-1].id
+            print(f"{total} cartões recriptografados com a chave '{field_cipher.chave_ativa}'.")
+
+    return total
+
+
+if __name__ == '__main__':
+    asyncio.run(rotacionar_chaves())
@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import sys
+from typing import Iterable, List
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from app.database.base import async_session
+from app.database.unit_of_work import UnitOfWork
+from app.models.cartao_model import StatusEnum
+from app.schemas.status_schema import LIMITE_TRANSICAO_STATUS
+from app.services.status_services import StatusServices
+
+load_dotenv()
+
+
+def ler_uuids(linhas: Iterable[str]) -> List[UUID]:
+    return list(dict.fromkeys(UUID(linha.strip()) for linha in linhas if linha.strip()))
+
+
+async def transicionar_status(uuids: List[UUID], destino: StatusEnum) -> int:
+    atualizados = 0
+
+    for inicio in range(0, len(uuids), LIMITE_TRANSICAO_STATUS):
+        async with async_session() as session:
+            resposta = await StatusServices(UnitOfWork(session)).transicionar(
+                uuids[inicio:inicio + LIMITE_TRANSICAO_STATUS],
+                destino,
+                exchange="card_exchange",
+                routing_key="activation_rk"
+            )
+
+        atualizados += len(resposta["data"].atualizados)
+        for uuid in resposta["data"].ignorados:
+            print(f"Cartão {uuid} ignorado: não encontrado ou transição não permitida.")
+
+    print(f"{atualizados} de {len(uuids)} cartão(ões) alterado(s) para {destino.value}.")
+
+    return atualizados
+
+
+async def expirar_cartoes(lote: int) -> int:
+    total = 0
+
+    while True:
+        async with async_session() as session:
+            expirados = await StatusServices(UnitOfWork(session)).expirar_cartoes(lote)
+
+        total += expirados
+        if expirados < lote:
+            break
+
+    print(f"{total} cartão(ões) vencido(s) alterado(s) para {StatusEnum.EXPIRADO.value}.")
+
+    return total
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--status", choices=[s.value for s in StatusEnum])
+    parser.add_argument("--uuids", nargs="+", default=[])
+    parser.add_argument("--arquivo", help="Arquivo com um UUID por linha ('-' para a entrada padrão).")
+    parser.add_argument("--expirar", action="store_true")
+    parser.add_argument("--lote", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.expirar:
+        asyncio.run(expirar_cartoes(args.lote))
+    else:
+        if not args.status:
+            parser.error("Informe --status ou --expirar.")
+
+        linhas = list(args.uuids)
+        if args.arquivo:
+            with (sys.stdin if args.arquivo == "-" else open(args.arquivo)) as arquivo:
+                linhas.extend(arquivo)
+
+        asyncio.run(transicionar_status(ler_uuids(linhas), StatusEnum(args.status)))
@@ -1,63 +1,81 @@
+from datetime import datetime, timezone
 from uuid import UUID
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import status, Depends, HTTPException
-from sqlalchemy import and_
+from pydantic import ValidationError
+from sqlalchemy import and_, or_, case, update, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.future import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.rabbitmq_consumer import RabbitmqConsumer
-from app.services.rabbitmq_publisher import RabbitmqPublisher
 from app.models.cartao_model import CartaoModel, StatusEnum
-from app.database.base import get_session
+from app.models.outbox_model import OutboxModel
+from app.models.movimentacao_model import MovimentacaoModel, TipoMovimentacaoEnum, OperacaoEnum
+from app.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.core.cache import cache_autenticacao
+from app.core.dinheiro import LIMITE_SALDO_CENTAVOS, para_centavos, de_centavos
+from app.core.paginacao import codificar_cursor, decodificar_cursor
+from app.core.validacao import mensagem_validacao
+from app.services.token_services import TokenServices
+from app.services.status_services import StatusServices, payload_ativacao
+from app.schemas.movimentacao_schema import MovimentacaoResponse, ExtratoResponse
 from app.schemas.cartao_schema import (
     CartaoRequest,
     CartaoResponse,
     CartaoRequestResponse,
+    CartaoLoteItemResponse,
+    CartaoLoteResponse,
     CartaoUpdate,
     CartoesPorCpfResponse,
+    CartaoParcialResponse,
     CartaoTransferir,
     CartaoRecarga
 )
 
 
-class CartaoServices:
+MAX_TENTATIVAS_NUMERO_CARTAO = 5
+TAMANHO_LOTE_INSERT = 1000
 
-    def __init__(self, db: AsyncSession = Depends(get_session)):
-        self.db = db
 
-    @staticmethod
-    def rabbitmq_consumer(queue_name: str):
-        queue = queue_name
-        if not queue:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Configuração do RabbitMQ inválida. Verifique as variáveis de ambiente."
-            )
-        rabbitmq_consumer = RabbitmqConsumer(queue)
+class CartaoServices:
 
-        return rabbitmq_consumer
+    def __init__(self, uow: UnitOfWork = Depends(get_unit_of_work)):
+        self.uow = uow
+        self.db = uow.session
+        self.token_services = TokenServices(self.db)
 
     @staticmethod
-    def rabbitmq_publisher(exchange: str, routing_key: str):
-        exchange, routing_key = exchange, routing_key
+    def mensagem_outbox(exchange: str, routing_key: str, body: dict) -> OutboxModel:
         if not exchange or not routing_key:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Configuração do RabbitMQ inválida. Verifique as variáveis de ambiente."
             )
-        rabbitmq_publisher = RabbitmqPublisher(exchange, routing_key)
 
-        return rabbitmq_publisher
+        return OutboxModel(exchange=exchange, routing_key=routing_key, payload=body)
 
-    async def solicitar_cartao(self, dados_cartao: CartaoRequest, exchange: str, routing_key: str) -> dict:
-        query = await self.db.execute(
-            select(CartaoModel).where(
-                and_(
-                    CartaoModel.cpf_titular == dados_cartao.cpf_titular
-                )
+    async def _inserir_cartao(self, cartao: CartaoModel) -> CartaoModel:
+        for _ in range(MAX_TENTATIVAS_NUMERO_CARTAO):
+            query = await self.db.execute(
+                insert(CartaoModel)
+                .values(**cartao.valores())
+                .on_conflict_do_nothing(index_elements=[CartaoModel.numero_cartao_fingerprint])
+                .returning(CartaoModel)
             )
+            cartao_inserido = query.scalars().first()
+
+            if cartao_inserido is not None:
+                return cartao_inserido
+
+            cartao.gerar_numero_cartao()
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Erro ao criar cartão. Tente novamente mais tarde."
         )
-        usuario_existente = query.scalars().all()
+
+    async def solicitar_cartao(self, dados_cartao: CartaoRequest, exchange: str, routing_key: str) -> dict:
+        usuario_existente = await self.uow.cartoes_do_titular(dados_cartao.cpf_titular)
 
         for usuario in usuario_existente:
             if usuario.titular_cartao.upper() != dados_cartao.titular_cartao.upper():
@@ -78,23 +96,26 @@ class CartaoServices:
             email=dados_cartao.email.upper()
         )
 
-        await cartao.initialize()
+        cartao.gerar_dados()
+
+        mensagem = self.mensagem_outbox(exchange, routing_key, {
+            "action": "send_card_to_approval",
+            "data": {
+                "uuid": str(cartao.uuid),
+                "titular_cartao": cartao.titular_cartao,
+                "cpf_titular": cartao.cpf_titular,
+                "email": cartao.email
+            }
+        })
 
         try:
-            self.db.add(cartao)
+            cartao.token, cartao.token_expiracao = await self.token_services.resolver_token(
+                dados_cartao.cpf_titular,
+                usuario_existente
+            )
+            cartao = await self._inserir_cartao(cartao)
+            self.db.add(mensagem)
             await self.db.commit()
-            await self.db.refresh(cartao)
-
-            rabbitmq_publisher = self.rabbitmq_publisher(exchange, routing_key)
-            await rabbitmq_publisher.send_message({
-                "action": "send_card_to_approval",
-                "data": {
-                    "uuid": str(cartao.uuid),
-                    "titular_cartao": cartao.titular_cartao,
-                    "cpf_titular": cartao.cpf_titular,
-                    "email": cartao.email
-                }
-            })
         except Exception:
             await self.db.rollback()
             raise HTTPException(
@@ -102,49 +123,276 @@ class CartaoServices:
                 detail="Erro ao criar cartão. Tente novamente mais tarde."
             )
 
+        await cache_autenticacao.invalidar([cartao.cpf_titular])
+
         return {
             "status_code": status.HTTP_201_CREATED,
             "message": "Cartão criado com sucesso.",
             "data": CartaoRequestResponse.from_model(cartao)
         }
 
-    async def cartoes_por_cpf(self, cpf_titular: str) -> dict:
-        query = await self.db.execute(
-            select(CartaoModel).where(
-                and_(CartaoModel.cpf_titular == cpf_titular)
+    async def solicitar_cartoes_lote(self, itens: List[dict], exchange: str, routing_key: str) -> dict:
+        resultados: List[Optional[CartaoLoteItemResponse]] = [None] * len(itens)
+        solicitacoes: Dict[int, CartaoRequest] = {}
+
+        for indice, item in enumerate(itens):
+            try:
+                solicitacoes[indice] = CartaoRequest.model_validate(item)
+            except ValidationError as e:
+                erro = e.errors()[0]
+                mensagem = mensagem_validacao(CartaoRequest, erro["loc"][0] if erro["loc"] else None, erro)
+                resultados[indice] = CartaoLoteItemResponse(
+                    indice=indice,
+                    status_code=status.HTTP_400_BAD_REQUEST if mensagem else status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail=mensagem or erro["msg"]
+                )
+
+        titulares: Dict[str, Tuple[str, str]] = {}
+        tokens: Dict[str, Tuple[str, datetime]] = {}
+
+        if solicitacoes:
+            query = await self.db.execute(
+                select(
+                    CartaoModel.cpf_titular,
+                    CartaoModel.titular_cartao,
+                    CartaoModel.email,
+                    CartaoModel.token,
+                    CartaoModel.token_expiracao
+                )
+                .where(CartaoModel.cpf_titular.in_({s.cpf_titular for s in solicitacoes.values()}))
+                .distinct(CartaoModel.cpf_titular)
+                .order_by(CartaoModel.cpf_titular, CartaoModel.token_expiracao.desc())
+            )
+            agora = datetime.now(timezone.utc)
+
+            for linha in query.all():
+                titulares[linha.cpf_titular] = (linha.titular_cartao.upper(), linha.email.upper())
+                if linha.token_expiracao > agora:
+                    tokens[linha.cpf_titular] = (linha.token, linha.token_expiracao)
+
+        cpfs_existentes = set(titulares)
+        tokens_renovados: Dict[str, Tuple[str, datetime]] = {}
+        cartoes: Dict[int, CartaoModel] = {}
+
+        for indice, solicitacao in solicitacoes.items():
+            cpf = solicitacao.cpf_titular
+            titular, email = solicitacao.titular_cartao.upper(), solicitacao.email.upper()
+            titular_existente, email_existente = titulares.setdefault(cpf, (titular, email))
+
+            if titular_existente != titular or email_existente != email:
+                resultados[indice] = CartaoLoteItemResponse(
+                    indice=indice,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="CPF já cadastrado para um titular diferente."
+                    if titular_existente != titular
+                    else "E-mail já cadastrado para um titular diferente."
+                )
+                continue
+
+            if cpf not in tokens:
+                tokens[cpf] = self.token_services.gerar_token(cpf)
+                if cpf in cpfs_existentes:
+                    tokens_renovados[cpf] = tokens[cpf]
+
+            cartao = CartaoModel(
+                titular_cartao=titular,
+                cpf_titular=cpf,
+                endereco=solicitacao.endereco.upper(),
+                email=email
+            )
+            cartao.gerar_dados()
+            cartao.token, cartao.token_expiracao = tokens[cpf]
+            cartoes[indice] = cartao
+
+        inseridos: Dict[UUID, CartaoModel] = {}
+
+        try:
+            if tokens_renovados:
+                await self.token_services.rotacionar_tokens(tokens_renovados)
+
+            pendentes = list(cartoes.values())
+            for _ in range(MAX_TENTATIVAS_NUMERO_CARTAO):
+                for inicio in range(0, len(pendentes), TAMANHO_LOTE_INSERT):
+                    query = await self.db.execute(
+                        insert(CartaoModel)
+                        .values([cartao.valores() for cartao in pendentes[inicio:inicio + TAMANHO_LOTE_INSERT]])
+                        .on_conflict_do_nothing(index_elements=[CartaoModel.numero_cartao_fingerprint])
+                        .returning(CartaoModel)
+                    )
+                    inseridos.update((cartao.uuid, cartao) for cartao in query.scalars())
+
+                pendentes = [cartao for cartao in pendentes if cartao.uuid not in inseridos]
+                if not pendentes:
+                    break
+
+                for cartao in pendentes:
+                    cartao.gerar_numero_cartao()
+
+            mensagens = [
+                self.mensagem_outbox(exchange, routing_key, {
+                    "action": "send_card_to_approval",
+                    "data": {
+                        "uuid": str(cartao.uuid),
+                        "titular_cartao": cartao.titular_cartao,
+                        "cpf_titular": cartao.cpf_titular,
+                        "email": cartao.email
+                    }
+                })
+                for cartao in inseridos.values()
+            ]
+            for inicio in range(0, len(mensagens), TAMANHO_LOTE_INSERT):
+                await self.db.execute(
+                    insert(OutboxModel).values([
+                        {
+                            "exchange": mensagem.exchange,
+                            "routing_key": mensagem.routing_key,
+                            "payload": mensagem.payload
+                        }
+                        for mensagem in mensagens[inicio:inicio + TAMANHO_LOTE_INSERT]
+                    ])
+                )
+
+            await self.db.commit()
+        except HTTPException:
+            await self.db.rollback()
+            raise
+        except Exception:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Erro ao criar os cartões do lote. Tente novamente mais tarde."
             )
+
+        await cache_autenticacao.invalidar(cartao.cpf_titular for cartao in inseridos.values())
+
+        for indice, cartao in cartoes.items():
+            cartao_inserido = inseridos.get(cartao.uuid)
+            resultados[indice] = (
+                CartaoLoteItemResponse(
+                    indice=indice,
+                    status_code=status.HTTP_201_CREATED,
+                    data=CartaoRequestResponse.from_model(cartao_inserido)
+                )
+                if cartao_inserido is not None
+                else CartaoLoteItemResponse(
+                    indice=indice,
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Erro ao criar cartão. Tente novamente mais tarde."
+                )
+            )
+
+        criados = len(inseridos)
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": f"Lote processado: {criados} cartão(ões) criado(s), {len(itens) - criados} rejeitado(s).",
+            "data": CartaoLoteResponse(itens=resultados)
+        }
+
+    async def cartoes_por_cpf(
+            self,
+            cpf_titular: str,
+            limite: int,
+            cursor: Optional[str] = None,
+            fields: Optional[str] = None
+    ) -> dict:
+        campos = CartaoParcialResponse.campos(fields)
+        query = (
+            select(CartaoModel.id, *CartaoParcialResponse.colunas(campos))
+            .where(CartaoModel.cpf_titular == cpf_titular)
+            .order_by(CartaoModel.id)
+            .limit(limite + 1)
         )
-        cartoes = query.scalars().all()
 
-        if not cartoes:
+        if cursor:
+            id_cartao, = decodificar_cursor(cursor, 1)
+            if type(id_cartao) is not int:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor de paginação inválido."
+                )
+
+            query = query.where(CartaoModel.id > id_cartao)
+
+        resultado = await self.db.execute(query)
+        linhas = resultado.all()
+
+        if not linhas and not cursor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="O CPF informado não foi encontrado."
             )
 
-        cartoes_response = [CartaoResponse.from_model(cartao) for cartao in cartoes]
+        proximo_cursor = codificar_cursor(linhas[limite - 1].id) if len(linhas) > limite else None
 
         return {
             "status_code": status.HTTP_200_OK,
-            "message": "Todos os cartões foram listados com sucesso.",
-            "data": CartoesPorCpfResponse(cartoes=cartoes_response),
+            "message": "Os cartões foram listados com sucesso.",
+            "data": CartoesPorCpfResponse(
+                cartoes=[CartaoParcialResponse.from_row(linha, campos) for linha in linhas[:limite]],
+                proximo_cursor=proximo_cursor
+            ),
+        }
+
+    async def extrato(self, uuid: UUID, limite: int, cursor: Optional[str] = None) -> dict:
+        query = (
+            select(MovimentacaoModel)
+            .where(
+                MovimentacaoModel.cartao_id == select(CartaoModel.id).where(CartaoModel.uuid == uuid).scalar_subquery()
+            )
+            .order_by(MovimentacaoModel.data_criacao.desc(), MovimentacaoModel.id.desc())
+            .limit(limite + 1)
+        )
+
+        if cursor:
+            data_criacao, id_movimentacao = decodificar_cursor(cursor, 2)
+            try:
+                data_criacao = datetime.fromisoformat(data_criacao)
+                id_movimentacao = int(id_movimentacao)
+            except (TypeError, ValueError):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cursor de paginação inválido."
+                )
+
+            query = query.where(
+                MovimentacaoModel.data_criacao <= data_criacao,
+                tuple_(MovimentacaoModel.data_criacao, MovimentacaoModel.id) < tuple_(data_criacao, id_movimentacao)
+            )
+
+        movimentacoes = (await self.db.execute(query)).scalars().all()
+        proximo_cursor = None
+
+        if len(movimentacoes) > limite:
+            movimentacoes = movimentacoes[:limite]
+            proximo_cursor = codificar_cursor(movimentacoes[-1].data_criacao.isoformat(), movimentacoes[-1].id)
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": "Extrato obtido com sucesso.",
+            "data": ExtratoResponse(
+                movimentacoes=[MovimentacaoResponse.from_model(movimentacao) for movimentacao in movimentacoes],
+                proximo_cursor=proximo_cursor
+            )
         }
 
-    async def atualizar_dados(self, dados_atualizados: CartaoUpdate, uuid: UUID, queue: str) -> dict:
+    async def atualizar_dados(
+            self,
+            dados_atualizados: CartaoUpdate,
+            uuid: UUID,
+            exchange: str,
+            routing_key: str
+    ) -> dict:
         if not dados_atualizados.model_dump(exclude_unset=True):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Nenhum campo para atualizar foi fornecido."
             )
 
-        query1 = await self.db.execute(
-            select(CartaoModel).where(
-                and_(
-                    CartaoModel.uuid == uuid
-                )
-            )
-        )
-        cartao = query1.scalars().first()
+        cartao = await self.uow.cartao(uuid)
+
+        if dados_atualizados.status is not None:
+            StatusServices.validar_transicao(cartao.status, dados_atualizados.status)
 
         if dados_atualizados.titular_cartao is not None or dados_atualizados.endereco is not None:
             query2 = await self.db.execute(
@@ -165,12 +413,15 @@ class CartaoServices:
                 for cartao_atualizar in cartoes_para_atualizar:
                     cartao_atualizar.endereco = dados_atualizados.endereco
 
-        if dados_atualizados.status is not None:
+        if dados_atualizados.status is not None and dados_atualizados.status != cartao.status:
             cartao.status = dados_atualizados.status
 
             if dados_atualizados.status == StatusEnum.ATIVO:
-                consumer = self.rabbitmq_consumer(queue)
-                await consumer.consume_messages(cartao.uuid)
+                self.db.add(self.mensagem_outbox(
+                    exchange,
+                    routing_key,
+                    payload_ativacao(cartao.uuid, cartao.titular_cartao, cartao.email)
+                ))
 
         try:
             await self.db.commit()
@@ -187,26 +438,43 @@ class CartaoServices:
             "data": CartaoResponse.from_model(cartao)
         }
 
-    async def recarregar_cartao(self, recarga: CartaoRecarga, uuid: UUID) -> dict:
-        query = await self.db.execute(
-            select(CartaoModel).where(
-                and_(
-                    CartaoModel.uuid == uuid,
+    async def recarregar_cartao(
+            self,
+            recarga: CartaoRecarga,
+            uuid: UUID,
+            chave_idempotencia: Optional[str] = None
+    ) -> dict:
+        try:
+            query = await self.db.execute(
+                update(CartaoModel)
+                .where(
+                    and_(
+                        CartaoModel.uuid == uuid,
+                        CartaoModel.status == StatusEnum.ATIVO,
+                        CartaoModel.saldo_centavos <= LIMITE_SALDO_CENTAVOS - para_centavos(recarga.valor)
+                    )
                 )
+                .values(saldo_centavos=CartaoModel.saldo_centavos + para_centavos(recarga.valor))
+                .returning(CartaoModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
-        )
-        cartao = query.scalars().first()
-
-        if cartao.status != StatusEnum.ATIVO:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="O cartão informado não está ativo."
-            )
-
-        cartao.saldo += recarga.valor
+            cartao = query.scalars().first()
 
-        try:
-            await self.db.commit()
+            if cartao is None:
+                await self.db.rollback()
+                await self.__erro_recarga(uuid)
+
+            self.db.add(MovimentacaoModel(
+                cartao_id=cartao.id,
+                tipo=TipoMovimentacaoEnum.CREDITO,
+                operacao=OperacaoEnum.RECARGA,
+                valor_centavos=para_centavos(recarga.valor),
+                saldo_centavos=cartao.saldo_centavos,
+                chave_idempotencia=chave_idempotencia
+            ))
+            await self.uow.confirmar()
+        except HTTPException:
+            raise
         except Exception:
             await self.db.rollback()
             raise HTTPException(
@@ -220,66 +488,142 @@ class CartaoServices:
             "data": CartaoResponse.from_model(cartao)
         }
 
-    async def transferir_saldo(self, transferencia: CartaoTransferir) -> dict:
+    async def transferir_saldo(
+            self,
+            transferencia: CartaoTransferir,
+            chave_idempotencia: Optional[str] = None
+    ) -> dict:
+        if transferencia.uuid_pagante == transferencia.uuid_recebente:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O cartão do recebedor deve ser diferente do cartão do pagante."
+            )
+
+        centavos = para_centavos(transferencia.valor)
+
+        try:
             query = await self.db.execute(
-                select(CartaoModel).where(
+                update(CartaoModel)
+                .where(
                     and_(
-                        CartaoModel.uuid == transferencia.uuid_pagante,
+                        CartaoModel.uuid.in_([transferencia.uuid_pagante, transferencia.uuid_recebente]),
+                        CartaoModel.status == StatusEnum.ATIVO,
+                        or_(
+                            and_(
+                                CartaoModel.uuid == transferencia.uuid_recebente,
+                                CartaoModel.saldo_centavos <= LIMITE_SALDO_CENTAVOS - centavos
+                            ),
+                            and_(
+                                CartaoModel.uuid == transferencia.uuid_pagante,
+                                CartaoModel.saldo_centavos >= centavos
+                            )
+                        )
                     )
                 )
+                .values(
+                    saldo_centavos=CartaoModel.saldo_centavos + case(
+                        (CartaoModel.uuid == transferencia.uuid_recebente, centavos),
+                        else_=-centavos
+                    )
+                )
+                .returning(CartaoModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
-            cartao = query.scalars().first()
+            cartoes = {cartao.uuid: cartao for cartao in query.scalars().all()}
 
-            if cartao.status != StatusEnum.ATIVO:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O cartão do pagante não está ativo."
+            if len(cartoes) != 2:
+                await self.db.rollback()
+                await self.__erro_transferencia(transferencia)
+
+            pagante = cartoes[transferencia.uuid_pagante]
+            recebente = cartoes[transferencia.uuid_recebente]
+            self.db.add_all([
+                MovimentacaoModel(
+                    cartao_id=pagante.id,
+                    tipo=TipoMovimentacaoEnum.DEBITO,
+                    operacao=OperacaoEnum.TRANSFERENCIA,
+                    valor_centavos=centavos,
+                    saldo_centavos=pagante.saldo_centavos,
+                    contraparte_uuid=recebente.uuid,
+                    chave_idempotencia=chave_idempotencia
+                ),
+                MovimentacaoModel(
+                    cartao_id=recebente.id,
+                    tipo=TipoMovimentacaoEnum.CREDITO,
+                    operacao=OperacaoEnum.TRANSFERENCIA,
+                    valor_centavos=centavos,
+                    saldo_centavos=recebente.saldo_centavos,
+                    contraparte_uuid=pagante.uuid,
+                    chave_idempotencia=chave_idempotencia
                 )
+            ])
+            await self.uow.confirmar()
+        except HTTPException:
+            raise
+        except Exception:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Erro ao atualizar o cartão. Tente novamente mais tarde."
+            )
 
-            if transferencia.valor > cartao.saldo:
-                raise HTTPException(
-                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                    detail=f"Saldo insuficiente. Saldo atual: R${cartao.saldo:.2f} | "
-                           f"Transferência solicitada: R${transferencia.valor:.2f}."
-                )
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": f"Foi transferido o valor de R${transferencia.valor:.2f} "
+                       f"para o cartão do UUID ({transferencia.uuid_recebente}).",
+            "data": CartaoResponse.from_model(pagante)
+        }
 
-            cartao.saldo -= transferencia.valor
+    async def __erro_recarga(self, uuid: UUID):
+        query = await self.db.execute(select(CartaoModel.status).where(CartaoModel.uuid == uuid))
 
-            query2 = await self.db.execute(
-                select(CartaoModel).where(
-                    and_(
-                        CartaoModel.uuid == transferencia.uuid_recebente
-                    )
-                )
+        if query.scalar() != StatusEnum.ATIVO:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O cartão informado não está ativo."
             )
-            cartao2 = query2.scalars().first()
 
-            if cartao2 is None:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Cartão não encontrado, verifique o UUID do recebedor."
-                )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"O saldo do cartão não pode ultrapassar R${de_centavos(LIMITE_SALDO_CENTAVOS):.2f}."
+        )
 
-            if cartao2.status != StatusEnum.ATIVO:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="O cartão do recebedor não está ativo."
-                )
+    async def __erro_transferencia(self, transferencia: CartaoTransferir):
+        query = await self.db.execute(
+            select(CartaoModel.uuid, CartaoModel.status, CartaoModel.saldo_centavos).where(
+                CartaoModel.uuid.in_([transferencia.uuid_pagante, transferencia.uuid_recebente])
+            )
+        )
+        cartoes = {cartao.uuid: cartao for cartao in query.all()}
+        pagante = cartoes.get(transferencia.uuid_pagante)
+        recebente = cartoes.get(transferencia.uuid_recebente)
 
-            cartao2.saldo += transferencia.valor
+        if pagante is None or pagante.status != StatusEnum.ATIVO:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O cartão do pagante não está ativo."
+            )
 
-            try:
-                await self.db.commit()
-            except Exception:
-                await self.db.rollback()
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail="Erro ao atualizar o cartão. Tente novamente mais tarde."
-                )
+        if recebente is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Cartão não encontrado, verifique o UUID do recebedor."
+            )
 
-            return {
-                "status_code": status.HTTP_200_OK,
-                "message": f"Foi transferido o valor de R${transferencia.valor:.2f} "
-                           f"para o cartão do UUID ({cartao2.uuid}).",
-                "data": CartaoResponse.from_model(cartao)
-            }
+        if recebente.status != StatusEnum.ATIVO:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O cartão do recebedor não está ativo."
+            )
+
+        if recebente.saldo_centavos > LIMITE_SALDO_CENTAVOS - para_centavos(transferencia.valor):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"O saldo do cartão do recebedor não pode ultrapassar R${de_centavos(LIMITE_SALDO_CENTAVOS):.2f}."
+            )
+
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Saldo insuficiente. Saldo atual: R${de_centavos(pagante.saldo_centavos):.2f} | "
+                   f"Transferência solicitada: R${transferencia.valor:.2f}."
+        )
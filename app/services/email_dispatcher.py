@@ -0,0 +1,134 @@
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+from os import environ
+from typing import AsyncIterator, List, Optional
+from uuid import UUID
+
+import aiosmtplib
+
+from app.core.metricas import smtp_envio_duracao
+
+
+class EmailDispatchError(Exception):
+    pass
+
+
+class SmtpPool:
+    def __init__(self, tamanho: Optional[int] = None):
+        self.__host = environ.get("SMTP_HOST", "smtp.mailgun.org")
+        self.__port = int(environ.get("SMTP_PORT"))
+        self.__user = environ.get("SMTP_USER")
+        self.__password = environ.get("SMTP_PASSWORD")
+        self.__tamanho = tamanho or int(environ.get("SMTP_POOL_SIZE", 5))
+        self.__sessoes: asyncio.Queue = asyncio.Queue()
+        self.__vagas = asyncio.Semaphore(self.__tamanho)
+
+    @property
+    def remetente(self) -> str:
+        return self.__user
+
+    async def __criar_sessao(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(hostname=self.__host, port=self.__port, timeout=10)
+        await client.connect()
+        if self.__user:
+            await client.login(self.__user, self.__password)
+
+        return client
+
+    async def __obter(self) -> aiosmtplib.SMTP:
+        while not self.__sessoes.empty():
+            client = self.__sessoes.get_nowait()
+            if client.is_connected:
+                return client
+            self.__fechar(client)
+
+        return await self.__criar_sessao()
+
+    @staticmethod
+    def __fechar(client: aiosmtplib.SMTP):
+        try:
+            client.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def sessao(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self.__vagas:
+            client = await self.__obter()
+            try:
+                yield client
+            except Exception:
+                self.__fechar(client)
+                raise
+            else:
+                self.__sessoes.put_nowait(client)
+
+    async def close(self):
+        while not self.__sessoes.empty():
+            client = self.__sessoes.get_nowait()
+            try:
+                await client.quit()
+            except Exception:
+                client.close()
+
+
+class EmailDispatcher:
+    def __init__(
+            self,
+            pool: SmtpPool,
+            concorrencia: Optional[int] = None,
+            max_tentativas: Optional[int] = None,
+            backoff_base: Optional[float] = None,
+            backoff_max: Optional[float] = None
+    ):
+        self.__pool = pool
+        self.__semaforo = asyncio.Semaphore(concorrencia or int(environ.get("SMTP_CONCORRENCIA", 5)))
+        self.__max_tentativas = max_tentativas or int(environ.get("SMTP_MAX_TENTATIVAS", 3))
+        self.__backoff_base = backoff_base or float(environ.get("SMTP_BACKOFF_BASE", 0.5))
+        self.__backoff_max = backoff_max or float(environ.get("SMTP_BACKOFF_MAX", 10))
+
+    def mensagem_ativacao(self, uuid: UUID, titular_cartao: str, email: str) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = self.__pool.remetente
+        message["To"] = email
+        message["Subject"] = "Confirmação de Ativação do Cartão"
+        message.set_content(
+            f"Olá {titular_cartao},\n\n"
+            f"Seu cartão com o UUID ({uuid}) foi ativado com sucesso!\n\n"
+            "Obrigado por utilizar nossos serviços.\n\n"
+            "Atenciosamente,\nEquipe de Suporte"
+        )
+
+        return message
+
+    async def enviar(self, message: EmailMessage):
+        async with self.__semaforo:
+            for tentativa in range(1, self.__max_tentativas + 1):
+                inicio = time.perf_counter()
+                try:
+                    async with self.__pool.sessao() as client:
+                        await client.send_message(message)
+                    smtp_envio_duracao.observar(time.perf_counter() - inicio, "ok")
+                    return
+                except Exception as e:
+                    smtp_envio_duracao.observar(time.perf_counter() - inicio, "erro")
+                    print(f"Falha ao enviar e-mail (Tentativa {tentativa}/{self.__max_tentativas}): {e}")
+
+                    if tentativa == self.__max_tentativas:
+                        raise EmailDispatchError(
+                            f"Máximo de tentativas alcançado. O envio do e-mail para {message['To']} falhou."
+                        ) from e
+
+                    espera = min(self.__backoff_max, self.__backoff_base * 2 ** (tentativa - 1))
+                    await asyncio.sleep(random.uniform(0, espera))
+
+    async def enviar_lote(self, messages: List[EmailMessage]) -> List[Optional[Exception]]:
+        resultados = await asyncio.gather(
+            *(self.enviar(message) for message in messages),
+            return_exceptions=True
+        )
+
+        return [resultado if isinstance(resultado, Exception) else None for resultado in resultados]
@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from fastapi import HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.future import select
+
+from app.database.base import async_session
+from app.models.cartao_model import CartaoModel, StatusEnum
+from app.schemas.cartao_schema import CartaoParcialResponse
+
+CAMPOS_EXPORTACAO: List[str] = [
+    "uuid",
+    "titular_cartao",
+    "cpf_titular",
+    "status",
+    "email",
+    "endereco",
+    "saldo",
+    "expiracao",
+    "data_criacao"
+]
+TAMANHO_LOTE_EXPORTACAO = 1000
+
+TIPOS_CONTEUDO = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8"
+}
+
+
+class ExportacaoServices:
+
+    @staticmethod
+    def consulta(
+            status_cartao: Optional[StatusEnum] = None,
+            data_criacao_inicio: Optional[datetime] = None,
+            data_criacao_fim: Optional[datetime] = None,
+            prefixo_cpf: Optional[str] = None
+    ):
+        query = (
+            select(*CartaoParcialResponse.colunas(CAMPOS_EXPORTACAO))
+            .order_by(CartaoModel.id)
+            .execution_options(yield_per=TAMANHO_LOTE_EXPORTACAO)
+        )
+
+        if status_cartao is not None:
+            query = query.where(CartaoModel.status == status_cartao)
+
+        if data_criacao_inicio is not None:
+            query = query.where(CartaoModel.data_criacao >= data_criacao_inicio)
+
+        if data_criacao_fim is not None:
+            query = query.where(CartaoModel.data_criacao < data_criacao_fim)
+
+        if prefixo_cpf:
+            if not prefixo_cpf.isdigit() or len(prefixo_cpf) > 11:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="O prefixo do CPF deve conter apenas números, com no máximo 11 dígitos."
+                )
+
+            query = query.where(CartaoModel.cpf_titular.startswith(prefixo_cpf, autoescape=True))
+
+        return query
+
+    async def exportar_cartoes(
+            self,
+            formato: str,
+            status_cartao: Optional[StatusEnum] = None,
+            data_criacao_inicio: Optional[datetime] = None,
+            data_criacao_fim: Optional[datetime] = None,
+            prefixo_cpf: Optional[str] = None
+    ) -> StreamingResponse:
+        query = self.consulta(status_cartao, data_criacao_inicio, data_criacao_fim, prefixo_cpf)
+        serializar = self.__lotes_csv if formato == "csv" else self.__lotes_ndjson
+
+        return StreamingResponse(
+            serializar(self.__linhas(query)),
+            media_type=TIPOS_CONTEUDO[formato],
+            headers={"Content-Disposition": f'attachment; filename="cartoes.{formato}"'}
+        )
+
+    @staticmethod
+    async def __linhas(query) -> AsyncIterator[List[dict]]:
+        async with async_session() as session:
+            resultado = await session.stream(query)
+
+            async for lote in resultado.partitions():
+                yield [
+                    CartaoParcialResponse.from_row(linha, CAMPOS_EXPORTACAO).model_dump(
+                        mode="json",
+                        exclude_unset=True
+                    )
+                    for linha in lote
+                ]
+
+    @staticmethod
+    async def __lotes_ndjson(lotes: AsyncIterator[List[dict]]) -> AsyncIterator[str]:
+        async for lote in lotes:
+            yield "".join(json.dumps(linha, ensure_ascii=False) + "\n" for linha in lote)
+
+    @staticmethod
+    async def __lotes_csv(lotes: AsyncIterator[List[dict]]) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        escritor = csv.DictWriter(buffer, fieldnames=CAMPOS_EXPORTACAO, lineterminator="\n")
+        escritor.writeheader()
+
+        async for lote in lotes:
+            escritor.writerows(lote)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
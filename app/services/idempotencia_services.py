@@ -0,0 +1,323 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from os import environ
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Depends, HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy import delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.future import select
+
+from app.core.respostas import RespostaModelo
+from app.database.base import async_session
+from app.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.models.idempotencia_model import IdempotenciaModel
+
+TAMANHO_MAXIMO_CHAVE = 255
+
+
+@dataclass(frozen=True)
+class RespostaIdempotente:
+    hash_requisicao: str
+    status_code: int
+    conteudo: dict
+    expiracao: float
+
+
+class CacheRespostas:
+    def __init__(self, max_entradas: int):
+        self.__max_entradas = max_entradas
+        self.__entradas: "OrderedDict[Tuple[str, str], RespostaIdempotente]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entradas)
+
+    def obter(self, chave: Tuple[str, str]) -> Optional[RespostaIdempotente]:
+        resposta = self.__entradas.get(chave)
+
+        if resposta is None:
+            return None
+
+        if resposta.expiracao <= time.time():
+            del self.__entradas[chave]
+            return None
+
+        self.__entradas.move_to_end(chave)
+        return resposta
+
+    def salvar(self, chave: Tuple[str, str], resposta: RespostaIdempotente):
+        self.__entradas[chave] = resposta
+        self.__entradas.move_to_end(chave)
+
+        while len(self.__entradas) > self.__max_entradas:
+            self.__entradas.popitem(last=False)
+
+    def limpar(self):
+        self.__entradas.clear()
+
+
+ttl_idempotencia = timedelta(hours=float(environ.get("IDEMPOTENCIA_TTL_HORAS", 24)))
+cache_respostas: CacheRespostas = CacheRespostas(int(environ.get("IDEMPOTENCIA_CACHE_MAX_ENTRADAS", 10000)))
+em_andamento: Dict[Tuple[str, str], asyncio.Future] = {}
+
+
+class IdempotenciaServices:
+    def __init__(self, uow: UnitOfWork = Depends(get_unit_of_work)):
+        self.uow = uow
+        self.db = uow.session
+
+    @staticmethod
+    def hash_requisicao(requisicao: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(requisicao, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    async def executar(
+            self,
+            chave: Optional[str],
+            escopo: str,
+            requisicao: dict,
+            operacao: Callable[[], Awaitable[BaseModel]]
+    ) -> RespostaModelo:
+        if chave is None:
+            return RespostaModelo(await operacao())
+
+        if not chave or len(chave) > TAMANHO_MAXIMO_CHAVE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"O header Idempotency-Key deve ter entre 1 e {TAMANHO_MAXIMO_CHAVE} caracteres."
+            )
+
+        hash_requisicao = self.hash_requisicao(requisicao)
+        identificador = (escopo, chave)
+
+        resposta = cache_respostas.obter(identificador)
+        if resposta is not None:
+            return self.__responder(resposta, hash_requisicao, repetida=True)
+
+        futuro = em_andamento.get(identificador)
+        if futuro is not None:
+            resposta = await asyncio.shield(futuro)
+            return self.__responder(resposta, hash_requisicao, repetida=True)
+
+        futuro = asyncio.get_running_loop().create_future()
+        em_andamento[identificador] = futuro
+
+        try:
+            resposta, repetida = await self.__executar_unica(identificador, hash_requisicao, operacao)
+            futuro.set_result(resposta)
+        except asyncio.CancelledError:
+            futuro.cancel()
+            raise
+        except Exception as e:
+            futuro.set_exception(e)
+            futuro.exception()
+            raise
+        finally:
+            del em_andamento[identificador]
+
+        return self.__responder(resposta, hash_requisicao, repetida=repetida)
+
+    async def __executar_unica(
+            self,
+            identificador: Tuple[str, str],
+            hash_requisicao: str,
+            operacao: Callable[[], Awaitable[BaseModel]]
+    ) -> Tuple[RespostaIdempotente, bool]:
+        escopo, chave = identificador
+        expiracao = datetime.now(timezone.utc) + ttl_idempotencia
+
+        registro = await self.__reservar(escopo, chave, hash_requisicao, expiracao)
+
+        if registro is not None:
+            if registro.status_code is None:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Uma requisição com esta Idempotency-Key ainda está em processamento."
+                )
+
+            resposta = RespostaIdempotente(
+                hash_requisicao=registro.hash_requisicao,
+                status_code=registro.status_code,
+                conteudo=registro.resposta,
+                expiracao=registro.expiracao.timestamp()
+            )
+            cache_respostas.salvar(identificador, resposta)
+
+            return resposta, True
+
+        try:
+            async with self.uow.adiar_confirmacao():
+                modelo = await operacao()
+            status_code, conteudo = modelo.status_code, modelo.model_dump(mode="json")
+        except HTTPException as e:
+            if e.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                await self.__liberar(escopo, chave)
+                raise
+
+            status_code, conteudo = e.status_code, {"detail": e.detail}
+            await self.__gravar(escopo, chave, hash_requisicao, status_code, conteudo, expiracao)
+        else:
+            if not await self.__gravar(escopo, chave, hash_requisicao, status_code, conteudo, expiracao):
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Erro ao confirmar a operação. Tente novamente mais tarde."
+                )
+
+        resposta = RespostaIdempotente(
+            hash_requisicao=hash_requisicao,
+            status_code=status_code,
+            conteudo=conteudo,
+            expiracao=expiracao.timestamp()
+        )
+        cache_respostas.salvar(identificador, resposta)
+
+        return resposta, False
+
+    async def __reservar(
+            self,
+            escopo: str,
+            chave: str,
+            hash_requisicao: str,
+            expiracao: datetime
+    ) -> Optional[IdempotenciaModel]:
+        tabela = IdempotenciaModel.__table__
+        valores = {
+            "hash_requisicao": hash_requisicao,
+            "status_code": None,
+            "resposta": None,
+            "data_criacao": func.now(),
+            "expiracao": expiracao
+        }
+        instrucao = insert(tabela).values(escopo=escopo, chave=chave, **valores)
+        query = await self.db.execute(
+            instrucao.on_conflict_do_update(
+                index_elements=[tabela.c.escopo, tabela.c.chave],
+                set_=valores,
+                where=tabela.c.expiracao <= func.now()
+            ).returning(tabela.c.escopo)
+        )
+
+        if query.first() is not None:
+            return None
+
+        query = await self.db.execute(
+            select(IdempotenciaModel)
+            .where(IdempotenciaModel.escopo == escopo, IdempotenciaModel.chave == chave)
+            .execution_options(populate_existing=True)
+        )
+        return query.scalars().first()
+
+    async def __gravar(
+            self,
+            escopo: str,
+            chave: str,
+            hash_requisicao: str,
+            status_code: int,
+            conteudo: dict,
+            expiracao: datetime
+    ) -> bool:
+        tabela = IdempotenciaModel.__table__
+        valores = {
+            "hash_requisicao": hash_requisicao,
+            "status_code": status_code,
+            "resposta": conteudo,
+            "expiracao": expiracao
+        }
+
+        try:
+            await self.db.execute(
+                insert(tabela)
+                .values(escopo=escopo, chave=chave, data_criacao=func.now(), **valores)
+                .on_conflict_do_update(index_elements=[tabela.c.escopo, tabela.c.chave], set_=valores)
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            print(f"Falha ao gravar a resposta da Idempotency-Key {chave}: {e}")
+            return False
+
+        return True
+
+    async def __liberar(self, escopo: str, chave: str):
+        try:
+            await self.db.execute(
+                delete(IdempotenciaModel).where(
+                    IdempotenciaModel.escopo == escopo,
+                    IdempotenciaModel.chave == chave,
+                    IdempotenciaModel.status_code.is_(None)
+                )
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            print(f"Falha ao liberar a Idempotency-Key {chave}: {e}")
+
+    @staticmethod
+    def __responder(resposta: RespostaIdempotente, hash_requisicao: str, repetida: bool) -> RespostaModelo:
+        if resposta.hash_requisicao != hash_requisicao:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="A Idempotency-Key informada já foi utilizada com uma requisição diferente."
+            )
+
+        return RespostaModelo(
+            resposta.conteudo,
+            status_code=resposta.status_code,
+            headers={"Idempotent-Replayed": "true"} if repetida else None
+        )
+
+
+class LimpezaIdempotencia:
+    def __init__(self, batch_size: Optional[int] = None, intervalo: Optional[float] = None):
+        self.__batch_size = batch_size or int(environ.get("IDEMPOTENCIA_BATCH_LIMPEZA", 1000))
+        self.__intervalo = intervalo or float(environ.get("IDEMPOTENCIA_INTERVALO_LIMPEZA", 300))
+        self.__parar = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.__task is None:
+            self.__parar.clear()
+            self.__task = asyncio.create_task(self.__executar())
+
+    async def stop(self):
+        if self.__task is not None:
+            self.__parar.set()
+            await self.__task
+            self.__task = None
+
+    async def limpar_lote(self) -> int:
+        expiradas = (
+            select(IdempotenciaModel.escopo, IdempotenciaModel.chave)
+            .where(IdempotenciaModel.expiracao <= func.now())
+            .limit(self.__batch_size)
+        )
+
+        async with async_session() as session:
+            resultado = await session.execute(
+                delete(IdempotenciaModel)
+                .where(tuple_(IdempotenciaModel.escopo, IdempotenciaModel.chave).in_(expiradas))
+            )
+            await session.commit()
+
+            return resultado.rowcount
+
+    async def __executar(self):
+        while not self.__parar.is_set():
+            try:
+                removidas = await self.limpar_lote()
+            except Exception as e:
+                print(f"Falha ao limpar as chaves de idempotência expiradas: {e}")
+                removidas = 0
+
+            if removidas < self.__batch_size:
+                try:
+                    await asyncio.wait_for(self.__parar.wait(), timeout=self.__intervalo)
+                except asyncio.TimeoutError:
+                    pass
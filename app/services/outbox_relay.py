@@ -0,0 +1,76 @@
+import asyncio
+from os import environ
+from typing import Optional
+
+from sqlalchemy import delete
+from sqlalchemy.future import select
+
+from app.database.base import async_session
+from app.models.outbox_model import OutboxModel
+from app.services.rabbitmq_publisher import RabbitmqPublisher
+
+
+class OutboxRelay:
+    def __init__(
+            self,
+            publisher: RabbitmqPublisher,
+            batch_size: Optional[int] = None,
+            intervalo: Optional[float] = None
+    ):
+        self.__publisher = publisher
+        self.__batch_size = batch_size or int(environ.get('OUTBOX_BATCH_SIZE', 500))
+        self.__intervalo = intervalo or float(environ.get('OUTBOX_INTERVALO', 0.5))
+        self.__parar = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.__task is None:
+            self.__parar.clear()
+            self.__task = asyncio.create_task(self.__executar())
+
+    async def stop(self):
+        if self.__task is not None:
+            self.__parar.set()
+            await self.__task
+            self.__task = None
+
+    async def drenar_lote(self) -> int:
+        async with async_session() as session:
+            query = await session.execute(
+                select(OutboxModel)
+                .order_by(OutboxModel.id)
+                .limit(self.__batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            mensagens = query.scalars().all()
+
+            if not mensagens:
+                return 0
+
+            await self.__publisher.send_batch([
+                (mensagem.payload, mensagem.exchange, mensagem.routing_key)
+                for mensagem in mensagens
+            ])
+
+            await session.execute(
+                delete(OutboxModel).where(
+                    OutboxModel.id.in_([mensagem.id for mensagem in mensagens])
+                )
+            )
+            await session.commit()
+
+            return len(mensagens)
+
+    async def __executar(self):
+        while not self.__parar.is_set():
+            try:
+                enviadas = await self.drenar_lote()
+            except Exception as e:
+                print(f"Falha ao drenar a outbox, nova tentativa em {self.__intervalo}s: {e}")
+                enviadas = 0
+
+            if enviadas < self.__batch_size:
+                try:
+                    await asyncio.wait_for(self.__parar.wait(), timeout=self.__intervalo)
+                except asyncio.TimeoutError:
+                    pass
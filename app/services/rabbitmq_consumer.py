@@ -1,107 +1,208 @@
+import asyncio
 import json
+import time
+from collections import OrderedDict
 from os import environ
 from uuid import UUID
-from email.message import EmailMessage
+from typing import Optional, Tuple
 
-import aiosmtplib
 import aio_pika
-from fastapi import HTTPException, status
+from aio_pika.abc import AbstractIncomingMessage
+
+from app.core.metricas import amqp_consumo_duracao
+from app.services.email_dispatcher import EmailDispatcher, EmailDispatchError
 
 
 class RabbitmqConsumer:
-    def __init__(self, queue: str):
+    def __init__(self, email_dispatcher: EmailDispatcher):
+        self.__email_dispatcher = email_dispatcher
         self.__host = environ.get('RABBITMQ_HOST')
         self.__port = int(environ.get('RABBITMQ_PORT'))
         self.__username = environ.get('RABBITMQ_DEFAULT_USER')
         self.__password = environ.get('RABBITMQ_DEFAULT_PASS')
-        self.__queue = queue
+        self.__exchange = environ.get('RABBITMQ_CARD_EXCHANGE', 'card_exchange')
+        self.__approval_queue = environ.get('RABBITMQ_APPROVAL_QUEUE', 'approval_queue')
+        self.__approval_rk = environ.get('RABBITMQ_APPROVAL_RK', 'approval_rk')
+        self.__activation_queue = environ.get('RABBITMQ_ACTIVATION_QUEUE', 'activation_queue')
+        self.__activation_rk = environ.get('RABBITMQ_ACTIVATION_RK', 'activation_rk')
+        self.__dead_letter_exchange = environ.get('RABBITMQ_DEAD_LETTER_EXCHANGE', 'card_dlx')
+        self.__activation_dlq = environ.get('RABBITMQ_ACTIVATION_DLQ', 'activation_dlq')
+        self.__approval_prefetch = int(environ.get('RABBITMQ_APPROVAL_PREFETCH', 5000))
+        self.__activation_prefetch = int(environ.get('RABBITMQ_ACTIVATION_PREFETCH', 100))
+        self.__max_ativados = int(environ.get('RABBITMQ_MAX_ATIVADOS', 100000))
+        self.__aprovacao_max_idade = float(environ.get('RABBITMQ_APROVACAO_MAX_IDADE', 7 * 24 * 3600))
+        self.__aprovacao_varredura = float(environ.get('RABBITMQ_APROVACAO_VARREDURA', 60))
         self.__connection = None
-        self.__channel = None
-
-    async def __connect(self):
-        try:
-            url = f"amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/"
-            self.__connection = await aio_pika.connect_robust(url)
-            self.__channel = await self.__connection.channel()
-        except Exception:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Erro interno do servidor."
-            )
-
-    async def consume_messages(self, uuid: UUID):
-        if not self.__connection or self.__connection.is_closed:
-            await self.__connect()
+        self.__aprovacoes_pendentes: "OrderedDict[UUID, Tuple[AbstractIncomingMessage, float]]" = OrderedDict()
+        self.__ativados: "OrderedDict[UUID, None]" = OrderedDict()
+        self.__parar = asyncio.Event()
+
+    async def connect(self):
+        url = f"amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/"
+        self.__connection = await aio_pika.connect_robust(url)
+
+        approval_channel = await self.__connection.channel()
+        await approval_channel.set_qos(prefetch_count=self.__approval_prefetch)
+        activation_channel = await self.__connection.channel()
+        await activation_channel.set_qos(prefetch_count=self.__activation_prefetch)
+
+        exchange = await approval_channel.declare_exchange(
+            self.__exchange,
+            aio_pika.ExchangeType.DIRECT,
+            durable=True
+        )
 
-        queue = await self.__channel.declare_queue(
-            self.__queue,
+        approval_queue = await approval_channel.declare_queue(
+            self.__approval_queue,
             durable=True,
             arguments={
                 "x-overflow": "reject-publish"
             }
         )
+        await approval_queue.bind(exchange, routing_key=self.__approval_rk)
 
-        async for message in queue:
-            message_body = message.body.decode()
+        dead_letter_exchange = await activation_channel.declare_exchange(
+            self.__dead_letter_exchange,
+            aio_pika.ExchangeType.DIRECT,
+            durable=True
+        )
+        activation_dlq = await activation_channel.declare_queue(
+            self.__activation_dlq,
+            durable=True
+        )
+        await activation_dlq.bind(dead_letter_exchange, routing_key=self.__activation_rk)
 
-            data = json.loads(message_body)
-            uuid_msg = UUID(data["data"]["uuid"])
+        activation_queue = await activation_channel.declare_queue(
+            self.__activation_queue,
+            durable=True,
+            arguments={
+                "x-dead-letter-exchange": self.__dead_letter_exchange,
+                "x-dead-letter-routing-key": self.__activation_rk
+            }
+        )
+        await activation_queue.bind(self.__exchange, routing_key=self.__activation_rk)
 
-            if uuid_msg == uuid:
-                titular_cartao = data["data"]["titular_cartao"]
-                email = data["data"]["email"]
+        await approval_queue.consume(self.__on_approval)
+        await activation_queue.consume(self.__on_activation)
 
-                await self.__send_email(uuid_msg, titular_cartao, email)
+    async def consume_messages(self):
+        if not self.__connection or self.__connection.is_closed:
+            await self.connect()
 
-                await message.ack()
+        while not self.__parar.is_set():
+            try:
+                await asyncio.wait_for(self.__parar.wait(), timeout=self.__aprovacao_varredura)
+            except asyncio.TimeoutError:
+                await self.__descartar_aprovacoes_antigas()
 
-                await self.__close_connection()
+    def stop(self):
+        self.__parar.set()
 
-                break
+    async def __on_approval(self, message: AbstractIncomingMessage):
+        inicio = time.perf_counter()
+        resultado = "erro"
+        try:
+            resultado = await self.__processar_aprovacao(message)
+        finally:
+            amqp_consumo_duracao.observar(time.perf_counter() - inicio, self.__approval_queue, resultado)
+
+    async def __on_activation(self, message: AbstractIncomingMessage):
+        inicio = time.perf_counter()
+        resultado = "erro"
+        try:
+            resultado = await self.__processar_ativacao(message)
+        finally:
+            amqp_consumo_duracao.observar(time.perf_counter() - inicio, self.__activation_queue, resultado)
 
     @staticmethod
-    async def __send_email(uuid: UUID, titular_cartao: str, email: str):
-        smtp_user = environ.get("SMTP_USER")
-        smtp_password = environ.get("SMTP_PASSWORD")
-        smtp_host = environ.get("SMTP_HOST", "smtp.mailgun.org")
-        smtp_port = int(environ.get("SMTP_PORT"))
-
-        message = EmailMessage()
-        message["From"] = smtp_user
-        message["To"] = email
-        message["Subject"] = "Confirmação de Ativação do Cartão"
-        message.set_content(
-            f"Olá {titular_cartao},\n\n"
-            f"Seu cartão com o UUID ({uuid}) foi ativado com sucesso!\n\n"
-            "Obrigado por utilizar nossos serviços.\n\n"
-            "Atenciosamente,\nEquipe de Suporte"
-        )
+    async def __decodificar(message: AbstractIncomingMessage, *campos: str) -> Optional[dict]:
+        try:
+            data = json.loads(message.body.decode())["data"]
+            valores = {campo: data[campo] for campo in ("uuid", *campos)}
+            valores["uuid"] = UUID(valores["uuid"])
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Mensagem inválida descartada da fila {message.routing_key}: {e!r}")
+            await message.reject(requeue=False)
+            return None
 
-        max_retries = 3
-        attempt = 1
+        return valores
 
-        while attempt <= max_retries:
-            try:
-                print(f"Tentando enviar o e-mail... Tentativa {attempt}/{max_retries}")
+    async def __processar_aprovacao(self, message: AbstractIncomingMessage) -> str:
+        data = await self.__decodificar(message)
+        if data is None:
+            return "invalida"
+
+        uuid_msg = data["uuid"]
+
+        if uuid_msg in self.__ativados:
+            del self.__ativados[uuid_msg]
+            await message.ack()
+            return "ok"
+
+        anterior = self.__aprovacoes_pendentes.pop(uuid_msg, None)
+        if anterior is not None:
+            await anterior[0].ack()
+
+        self.__aprovacoes_pendentes[uuid_msg] = (message, time.monotonic())
+        return "ok"
 
-                async with aiosmtplib.SMTP(hostname=smtp_host, port=smtp_port, timeout=10) as client:
-                    await client.login(smtp_user, smtp_password)
-                    await client.send_message(message)
+    async def __processar_ativacao(self, message: AbstractIncomingMessage) -> str:
+        data = await self.__decodificar(message, "titular_cartao", "email")
+        if data is None:
+            return "invalida"
 
-                    print("E-mail enviado com sucesso!")
-                    break
+        uuid_msg = data["uuid"]
 
-            except aiosmtplib.SMTPException as e:
-                print(f"Falha ao enviar e-mail (Tentativa {attempt}/{max_retries}): {e}")
+        try:
+            await self.__email_dispatcher.enviar(
+                self.__email_dispatcher.mensagem_ativacao(uuid_msg, data["titular_cartao"], data["email"])
+            )
+        except EmailDispatchError as e:
+            print(f"{e} Mensagem enviada para a fila {self.__activation_dlq}.")
+            await message.reject(requeue=False)
+            return "rejeitada"
+
+        aprovacao = self.__aprovacoes_pendentes.pop(uuid_msg, None)
+        if aprovacao is not None:
+            await aprovacao[0].ack()
+        else:
+            self.__marcar_ativado(uuid_msg)
+
+        await message.ack()
+        return "ok"
+
+    async def __descartar_aprovacoes_antigas(self) -> int:
+        # Cartões bloqueados, cancelados ou expirados nunca recebem a ativação; sem este
+        # descarte as aprovações ocupariam o prefetch e o consumo da fila pararia.
+        limite = time.monotonic() - self.__aprovacao_max_idade
+        descartadas = 0
+
+        while self.__aprovacoes_pendentes:
+            uuid_msg, (message, recebida_em) = next(iter(self.__aprovacoes_pendentes.items()))
+            if recebida_em > limite:
+                break
+
+            del self.__aprovacoes_pendentes[uuid_msg]
+            try:
+                await message.ack()
+                descartadas += 1
             except Exception as e:
-                print(f"Ocorreu um erro inesperado (Tentativa {attempt}/{max_retries}): {e}")
+                print(f"Erro ao confirmar a aprovação pendente do cartão {uuid_msg}: {e!r}")
+
+        if descartadas:
+            print(f"{descartadas} aprovação(ões) pendente(s) sem ativação descartada(s) da fila {self.__approval_queue}.")
 
-            attempt += 1
+        return descartadas
 
-        if attempt > max_retries:
-            print("Máximo de tentativas alcançado. O envio do e-mail falhou.")
+    def __marcar_ativado(self, uuid: UUID):
+        self.__ativados[uuid] = None
+        if len(self.__ativados) > self.__max_ativados:
+            self.__ativados.popitem(last=False)
 
-    async def __close_connection(self):
+    async def close(self):
         if self.__connection:
             await self.__connection.close()
             print("Conexão com RabbitMQ encerrada.")
+
+        self.__connection = None
+        self.__aprovacoes_pendentes.clear()
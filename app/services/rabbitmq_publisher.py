@@ -1,59 +1,136 @@
 from os import environ
+import asyncio
 import json
-from typing import Dict
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
-import aio_pika
 from fastapi import HTTPException, status
 
+from app.core.metricas import amqp_publicacao_duracao, amqp_publicacoes
+
+if TYPE_CHECKING:
+    from aio_pika.abc import AbstractChannel, AbstractExchange, AbstractRobustConnection
+    from aio_pika.pool import Pool
+
 
 class RabbitmqPublisher:
-    def __init__(self, exchange: str, routing_key: str):
+    def __init__(self, pool_size: Optional[int] = None):
         self.__host = environ.get('RABBITMQ_HOST')
         self.__port = int(environ.get('RABBITMQ_PORT'))
         self.__username = environ.get('RABBITMQ_DEFAULT_USER')
         self.__password = environ.get('RABBITMQ_DEFAULT_PASS')
-        self.__exchange = exchange
-        self.__routing_key = routing_key
-        self.__connection = None
-        self.__channel = None
+        self.__pool_size = pool_size or int(environ.get('RABBITMQ_CHANNEL_POOL_SIZE', 10))
+        self.__connection: Optional["AbstractRobustConnection"] = None
+        self.__channel_pool: Optional["Pool"] = None
+        self.__exchanges_declaradas: Set[str] = set()
+        self.__lock = asyncio.Lock()
 
-    async def __connect(self):
-        try:
-            url = f'amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/'
-            self.__connection = await aio_pika.connect_robust(url)
-            self.__channel = await self.__connection.channel()
+    async def connect(self):
+        async with self.__lock:
+            if self.__connection and not self.__connection.is_closed:
+                return
+
+            import aio_pika
+            from aio_pika.pool import Pool
+
+            try:
+                url = f'amqp://{self.__username}:{self.__password}@{self.__host}:{self.__port}/'
+                self.__connection = await aio_pika.connect_robust(url)
+                self.__channel_pool = Pool(self.__get_channel, max_size=self.__pool_size)
+            except Exception:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Erro interno do servidor ao conectar ao RabbitMQ."
+                )
 
-            await self.__channel.declare_exchange(
-                self.__exchange,
+    async def __get_channel(self) -> "AbstractChannel":
+        return await self.__connection.channel(publisher_confirms=True)
+
+    async def __get_exchange(self, channel: "AbstractChannel", exchange: str) -> "AbstractExchange":
+        import aio_pika
+
+        if exchange not in self.__exchanges_declaradas:
+            await channel.declare_exchange(
+                exchange,
                 aio_pika.ExchangeType.DIRECT,
                 durable=True
             )
+            self.__exchanges_declaradas.add(exchange)
+
+        return await channel.get_exchange(exchange, ensure=False)
+
+    async def send_message(self, body: Dict, exchange: str, routing_key: str):
+        if not self.__connection or self.__connection.is_closed:
+            await self.connect()
+
+        import aio_pika
+
+        inicio = time.perf_counter()
+        try:
+            async with self.__channel_pool.acquire() as channel:
+                exchange_obj = await self.__get_exchange(channel, exchange)
+
+                message_body = aio_pika.Message(
+                    body=json.dumps(body).encode(),
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+                )
+
+                await exchange_obj.publish(
+                    message_body,
+                    routing_key=routing_key
+                )
         except Exception:
+            amqp_publicacoes.inc(exchange, "erro")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Erro interno do servidor ao conectar ao RabbitMQ."
+                detail="Erro interno do servidor ao enviar mensagem para RabbitMQ."
             )
 
-    async def send_message(self, body: Dict):
-        await self.__connect()
+        amqp_publicacao_duracao.observar(time.perf_counter() - inicio, "mensagem")
+        amqp_publicacoes.inc(exchange, "ok")
+
+    async def send_batch(self, messages: List[Tuple[Dict, str, str]]):
+        if not self.__connection or self.__connection.is_closed:
+            await self.connect()
+
+        import aio_pika
 
+        inicio = time.perf_counter()
         try:
-            exchange = await self.__channel.get_exchange(self.__exchange)
+            async with self.__channel_pool.acquire() as channel:
+                publicacoes = []
 
-            message_body = aio_pika.Message(
-                body=json.dumps(body).encode(),
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-            )
+                for body, exchange, routing_key in messages:
+                    exchange_obj = await self.__get_exchange(channel, exchange)
+                    publicacoes.append(
+                        exchange_obj.publish(
+                            aio_pika.Message(
+                                body=json.dumps(body).encode(),
+                                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+                            ),
+                            routing_key=routing_key
+                        )
+                    )
 
-            await exchange.publish(
-                message_body,
-                routing_key=self.__routing_key
-            )
+                await asyncio.gather(*publicacoes)
         except Exception:
+            for _, exchange, _ in messages:
+                amqp_publicacoes.inc(exchange, "erro")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Erro interno do servidor ao enviar mensagem para RabbitMQ."
             )
-        finally:
-            if self.__connection:
-                await self.__connection.close()
+
+        amqp_publicacao_duracao.observar(time.perf_counter() - inicio, "lote")
+        for _, exchange, _ in messages:
+            amqp_publicacoes.inc(exchange, "ok")
+
+    async def close(self):
+        if self.__channel_pool:
+            await self.__channel_pool.close()
+        if self.__connection:
+            await self.__connection.close()
+
+        self.__channel_pool = None
+        self.__connection = None
+        self.__exchanges_declaradas.clear()
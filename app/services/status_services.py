@@ -0,0 +1,171 @@
+import asyncio
+from os import environ
+from typing import Dict, FrozenSet, List, Optional
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, status
+from sqlalchemy import func, update
+from sqlalchemy.future import select
+
+from app.database.base import async_session
+from app.database.unit_of_work import UnitOfWork, get_unit_of_work
+from app.models.cartao_model import CartaoModel, StatusEnum
+from app.models.outbox_model import OutboxModel
+from app.schemas.status_schema import TransicaoStatusResponse
+
+TRANSICOES_PERMITIDAS: Dict[StatusEnum, FrozenSet[StatusEnum]] = {
+    StatusEnum.EM_ANALISE: frozenset({
+        StatusEnum.ENVIADO, StatusEnum.ATIVO, StatusEnum.CANCELADO, StatusEnum.EXPIRADO, StatusEnum.BLACKLISTED
+    }),
+    StatusEnum.ENVIADO: frozenset({
+        StatusEnum.ATIVO, StatusEnum.BLOQUEADO, StatusEnum.CANCELADO, StatusEnum.EXPIRADO, StatusEnum.BLACKLISTED
+    }),
+    StatusEnum.ATIVO: frozenset({
+        StatusEnum.INATIVO, StatusEnum.BLOQUEADO, StatusEnum.CANCELADO, StatusEnum.EXPIRADO, StatusEnum.BLACKLISTED
+    }),
+    StatusEnum.INATIVO: frozenset({
+        StatusEnum.ATIVO, StatusEnum.BLOQUEADO, StatusEnum.CANCELADO, StatusEnum.EXPIRADO, StatusEnum.BLACKLISTED
+    }),
+    StatusEnum.BLOQUEADO: frozenset({
+        StatusEnum.ATIVO, StatusEnum.CANCELADO, StatusEnum.EXPIRADO, StatusEnum.BLACKLISTED
+    }),
+    StatusEnum.EXPIRADO: frozenset({StatusEnum.CANCELADO}),
+    StatusEnum.CANCELADO: frozenset(),
+    StatusEnum.BLACKLISTED: frozenset(),
+}
+
+
+def origens_permitidas(destino: StatusEnum) -> List[StatusEnum]:
+    return [origem for origem, destinos in TRANSICOES_PERMITIDAS.items() if destino in destinos]
+
+
+def payload_ativacao(uuid: UUID, titular_cartao: str, email: str) -> dict:
+    return {
+        "action": "card_activated",
+        "data": {
+            "uuid": str(uuid),
+            "titular_cartao": titular_cartao,
+            "email": email
+        }
+    }
+
+
+class StatusServices:
+    def __init__(self, uow: UnitOfWork = Depends(get_unit_of_work)):
+        self.db = uow.session
+
+    @staticmethod
+    def validar_transicao(atual: StatusEnum, destino: StatusEnum):
+        if atual != destino and destino not in TRANSICOES_PERMITIDAS[atual]:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Transição de status não permitida: {atual.value} para {destino.value}."
+            )
+
+    async def transicionar(
+            self,
+            uuids: List[UUID],
+            destino: StatusEnum,
+            exchange: str,
+            routing_key: str
+    ) -> dict:
+        try:
+            query = await self.db.execute(
+                update(CartaoModel)
+                .where(
+                    CartaoModel.uuid.in_(uuids),
+                    CartaoModel.status.in_(origens_permitidas(destino))
+                )
+                .values(status=destino)
+                .returning(CartaoModel.uuid, CartaoModel.titular_cartao, CartaoModel.email)
+                .execution_options(synchronize_session=False)
+            )
+            atualizados = query.all()
+
+            if destino == StatusEnum.ATIVO:
+                self.db.add_all([
+                    OutboxModel(
+                        exchange=exchange,
+                        routing_key=routing_key,
+                        payload=payload_ativacao(linha.uuid, linha.titular_cartao, linha.email)
+                    )
+                    for linha in atualizados
+                ])
+
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Erro ao alterar o status dos cartões. Tente novamente mais tarde."
+            )
+
+        uuids_atualizados = {linha.uuid for linha in atualizados}
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "message": f"{len(uuids_atualizados)} cartão(ões) alterado(s) para {destino.value}.",
+            "data": TransicaoStatusResponse(
+                atualizados=[uuid for uuid in uuids if uuid in uuids_atualizados],
+                ignorados=[uuid for uuid in uuids if uuid not in uuids_atualizados]
+            )
+        }
+
+    async def expirar_cartoes(self, lote: int) -> int:
+        vencidos = (
+            select(CartaoModel.id)
+            .where(
+                CartaoModel.expiracao < func.current_date(),
+                CartaoModel.status.in_(origens_permitidas(StatusEnum.EXPIRADO))
+            )
+            .order_by(CartaoModel.expiracao)
+            .limit(lote)
+            .with_for_update(skip_locked=True)
+        )
+
+        resultado = await self.db.execute(
+            update(CartaoModel)
+            .where(CartaoModel.id.in_(vencidos.scalar_subquery()))
+            .values(status=StatusEnum.EXPIRADO)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+        return resultado.rowcount
+
+
+class VarreduraExpiracao:
+    def __init__(self, batch_size: Optional[int] = None, intervalo: Optional[float] = None):
+        self.__batch_size = batch_size or int(environ.get("EXPIRACAO_BATCH_SIZE", 1000))
+        self.__intervalo = intervalo or float(environ.get("EXPIRACAO_INTERVALO", 3600))
+        self.__parar = asyncio.Event()
+        self.__task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.__task is None:
+            self.__parar.clear()
+            self.__task = asyncio.create_task(self.__executar())
+
+    async def stop(self):
+        if self.__task is not None:
+            self.__parar.set()
+            await self.__task
+            self.__task = None
+
+    async def expirar_lote(self) -> int:
+        async with async_session() as session:
+            return await StatusServices(UnitOfWork(session)).expirar_cartoes(self.__batch_size)
+
+    async def __executar(self):
+        while not self.__parar.is_set():
+            try:
+                expirados = await self.expirar_lote()
+            except Exception as e:
+                print(f"Falha ao expirar os cartões vencidos: {e}")
+                expirados = 0
+
+            if expirados < self.__batch_size:
+                try:
+                    await asyncio.wait_for(self.__parar.wait(), timeout=self.__intervalo)
+                except asyncio.TimeoutError:
+                    pass
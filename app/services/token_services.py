@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import criar_token_acesso
+from app.core.cache import cache_autenticacao
+from app.models.cartao_model import CartaoModel
+
+
+class TokenServices:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def gerar_token(cpf_titular: str) -> Tuple[str, datetime]:
+        return criar_token_acesso(cpf_titular), datetime.now(timezone.utc) + timedelta(weeks=1)
+
+    async def resolver_token(self, cpf_titular: str, cartoes: List[CartaoModel]) -> Tuple[str, datetime]:
+        agora = datetime.now(timezone.utc)
+
+        for cartao in cartoes:
+            if cartao.token_expiracao > agora:
+                return cartao.token, cartao.token_expiracao
+
+        token, expiracao = self.gerar_token(cpf_titular)
+
+        if cartoes:
+            await self.rotacionar_tokens({cpf_titular: (token, expiracao)})
+
+        return token, expiracao
+
+    async def rotacionar_tokens(self, tokens: Dict[str, Tuple[str, datetime]]):
+        tabela = CartaoModel.__table__
+
+        await self.db.execute(
+            update(tabela)
+            .where(tabela.c.cpf_titular == bindparam("b_cpf"))
+            .values(token=bindparam("b_token"), token_expiracao=bindparam("b_expiracao")),
+            [
+                {"b_cpf": cpf_titular, "b_token": token, "b_expiracao": expiracao}
+                for cpf_titular, (token, expiracao) in tokens.items()
+            ]
+        )
+        await cache_autenticacao.invalidar(tokens)
@@ -0,0 +1,39 @@
+from multiprocessing import cpu_count
+from os import environ
+
+import uvicorn
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOOPS = ("auto", "asyncio", "uvloop")
+PROTOCOLOS_HTTP = ("auto", "h11", "httptools")
+
+
+def opcao(nome: str, padrao: str, permitidas: tuple) -> str:
+    valor = environ.get(nome, padrao).lower()
+
+    if valor not in permitidas:
+        raise ValueError(f"{nome} deve ser um dos valores: {', '.join(permitidas)}.")
+
+    return valor
+
+
+def configuracao_servidor() -> dict:
+    return {
+        "host": environ.get("SERVIDOR_HOST", "0.0.0.0"),
+        "port": int(environ.get("SERVIDOR_PORTA", 8000)),
+        "workers": int(environ.get("SERVIDOR_WORKERS", cpu_count())),
+        "loop": opcao("SERVIDOR_LOOP", "auto", LOOPS),
+        "http": opcao("SERVIDOR_HTTP", "auto", PROTOCOLOS_HTTP),
+        "backlog": int(environ.get("SERVIDOR_BACKLOG", 2048)),
+        "timeout_keep_alive": int(environ.get("SERVIDOR_KEEP_ALIVE", 5)),
+        "timeout_graceful_shutdown": int(environ.get("SERVIDOR_TIMEOUT_DRENAGEM", 30)),
+        "log_level": environ.get("SERVIDOR_LOG_LEVEL", "info"),
+        "access_log": environ.get("SERVIDOR_ACCESS_LOG", "false").lower() == "true",
+        "proxy_headers": True
+    }
+
+
+if __name__ == '__main__':
+    uvicorn.run("app.main:app", **configuracao_servidor())
@@ -0,0 +1,32 @@
+import asyncio
+import signal
+
+from dotenv import load_dotenv
+
+from app.core.metricas import ExportadorMetricas
+from app.services.email_dispatcher import EmailDispatcher, SmtpPool
+from app.services.rabbitmq_consumer import RabbitmqConsumer
+
+load_dotenv()
+
+
+async def main():
+    smtp_pool = SmtpPool()
+    consumer = RabbitmqConsumer(EmailDispatcher(smtp_pool))
+    exportador_metricas = ExportadorMetricas()
+    exportador_metricas.start()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, consumer.stop)
+
+    try:
+        await consumer.consume_messages()
+    finally:
+        await consumer.close()
+        await smtp_pool.close()
+        await exportador_metricas.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Mede e-mails/s do EmailDispatcher (sessões SMTP autenticadas reaproveitadas)
+contra o envio antigo, que abria uma conexão e fazia login a cada e-mail.
+
+Um servidor SMTP local (aiosmtpd) substitui o provedor real, aceitando
+qualquer credencial e descartando as mensagens. O aiosmtpd não faz parte das
+dependências do projeto e deve ser instalado à parte (pip install aiosmtpd).
+
+Uso:
+
+    python -m benchmarks.bench_email_dispatcher --emails 2000 --pool 10
+"""
+import argparse
+import asyncio
+import time
+from os import environ
+from uuid import uuid4
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from app.services.email_dispatcher import EmailDispatcher, SmtpPool
+
+HOST = "127.0.0.1"
+PORT = 8025
+USUARIO = "bench@localhost"
+SENHA = "bench"
+
+
+class Descartar:
+    async def handle_DATA(self, server, session, envelope):
+        return "250 OK"
+
+
+def autenticar(server, session, envelope, mechanism, auth_data):
+    return AuthResult(success=True)
+
+
+async def enviar_por_conexao(message):
+    async with aiosmtplib.SMTP(hostname=HOST, port=PORT, timeout=10) as client:
+        await client.login(USUARIO, SENHA)
+        await client.send_message(message)
+
+
+async def medir(nome: str, enviar, emails: int, concorrencia: int):
+    semaforo = asyncio.Semaphore(concorrencia)
+
+    async def tarefa():
+        async with semaforo:
+            await enviar()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tarefa() for _ in range(emails)))
+    duracao = time.perf_counter() - inicio
+
+    print(f"{nome:<22} {emails:>7} e-mails  {duracao:8.2f}s  {emails / duracao:10.1f} e-mails/s")
+
+
+async def main(emails: int, pool: int):
+    environ.update({
+        "SMTP_HOST": HOST,
+        "SMTP_PORT": str(PORT),
+        "SMTP_USER": USUARIO,
+        "SMTP_PASSWORD": SENHA
+    })
+
+    smtp_pool = SmtpPool(tamanho=pool)
+    dispatcher = EmailDispatcher(smtp_pool, concorrencia=pool)
+    message = dispatcher.mensagem_ativacao(uuid4(), "JOAO DA SILVA", "joaodasilva@email.com")
+
+    await medir("conexão por e-mail", lambda: enviar_por_conexao(message), emails, pool)
+
+    try:
+        await medir("pool de sessões", lambda: dispatcher.enviar(message), emails, pool)
+    finally:
+        await smtp_pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--emails", type=int, default=1000)
+    parser.add_argument("--pool", type=int, default=5)
+    args = parser.parse_args()
+
+    controller = Controller(
+        Descartar(),
+        hostname=HOST,
+        port=PORT,
+        authenticator=autenticar,
+        auth_require_tls=False
+    )
+    controller.start()
+    try:
+        asyncio.run(main(args.emails, args.pool))
+    finally:
+        controller.stop()
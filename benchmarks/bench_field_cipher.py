@@ -0,0 +1,65 @@
+"""
+Custo por linha para gravar e ler os três campos sensíveis de um cartão
+(número, CVV e token), comparando o encapsulamento antigo em JWT com a
+cifra AES-GCM mais o fingerprint HMAC do número do cartão.
+
+Uso:
+
+    python -m benchmarks.bench_field_cipher --linhas 20000
+"""
+import argparse
+import base64
+import os
+import time
+
+from jose import jwt
+
+from app.core.crypto import FieldCipher, fingerprint
+
+SEGREDO = "bench-secret"
+ALGORITMO = "HS256"
+NUMERO = "4539578763621486"
+CVV = "123"
+TOKEN = jwt.encode({"type": "access_token", "sub": "12345678912"}, SEGREDO, algorithm=ALGORITMO)
+
+
+def jwt_linha():
+    numero = jwt.encode({"numero_cartao": NUMERO}, SEGREDO, algorithm=ALGORITMO)
+    cvv = jwt.encode({"cvv": CVV}, SEGREDO, algorithm=ALGORITMO)
+    token = jwt.encode({"token": TOKEN}, SEGREDO, algorithm=ALGORITMO)
+
+    jwt.decode(numero, SEGREDO, algorithms=[ALGORITMO])
+    jwt.decode(cvv, SEGREDO, algorithms=[ALGORITMO])
+    jwt.decode(token, SEGREDO, algorithms=[ALGORITMO])
+
+
+def aes_linha(cipher: FieldCipher):
+    numero = cipher.encrypt(NUMERO, "numero_cartao")
+    fingerprint(NUMERO)
+    cvv = cipher.encrypt(CVV, "cvv")
+    token = cipher.encrypt(TOKEN, "token")
+
+    cipher.decrypt(numero, "numero_cartao")
+    cipher.decrypt(cvv, "cvv")
+    cipher.decrypt(token, "token")
+
+
+def medir(nome: str, funcao, linhas: int):
+    inicio = time.perf_counter()
+    for _ in range(linhas):
+        funcao()
+    duracao = time.perf_counter() - inicio
+
+    print(f"{nome:<6} {duracao / linhas * 1e6:10.2f} µs/linha  {linhas / duracao:12.1f} linhas/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--linhas", type=int, default=10000)
+    args = parser.parse_args()
+
+    chave = base64.urlsafe_b64encode(os.urandom(32)).decode()
+    cipher = FieldCipher.from_settings(f"bench:{chave}", SEGREDO)
+
+    medir("jwt", jwt_linha, args.linhas)
+    medir("aes", lambda: aes_linha(cipher), args.linhas)
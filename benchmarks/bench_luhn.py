@@ -0,0 +1,62 @@
+"""
+Números de cartão válidos gerados por segundo: laço antigo (16 dígitos com
+random.randint seguidos da validação de Luhn), dígito verificador calculado
+diretamente, geração em lote (NumPy, quando instalado) e retirada do pool
+pré-gerado.
+
+Uso:
+
+    python -m benchmarks.bench_luhn --quantidade 100000
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from app.core.luhn import (
+    NumerosCartaoPool,
+    carregar_numpy,
+    gerar_numero_cartao,
+    gerar_numeros_cartao,
+    validar_luhn,
+)
+
+
+def gerar_numero_antigo() -> str:
+    while True:
+        numero = ''.join([str(random.randint(0, 9)) for _ in range(16)])
+        if validar_luhn(numero):
+            return numero
+
+
+def medir(nome: str, funcao, quantidade: int):
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+
+    print(f"{nome:<26} {quantidade / duracao:14.1f} números/s")
+
+
+async def medir_pool(quantidade: int):
+    pool = NumerosCartaoPool(tamanho=quantidade)
+    pool.obter()
+    while len(pool) < quantidade - 1:
+        await asyncio.sleep(0.01)
+
+    medir("pool pré-gerado", lambda: [pool.obter() for _ in range(quantidade - 1)], quantidade - 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--quantidade", type=int, default=50000)
+    args = parser.parse_args()
+    quantidade = args.quantidade
+
+    medir("laço antigo (random)", lambda: [gerar_numero_antigo() for _ in range(quantidade)], quantidade)
+    medir("dígito direto (secrets)", lambda: [gerar_numero_cartao() for _ in range(quantidade)], quantidade)
+    medir(
+        "lote NumPy" if carregar_numpy() is not None else "lote (sem NumPy)",
+        lambda: gerar_numeros_cartao(quantidade),
+        quantidade
+    )
+    asyncio.run(medir_pool(quantidade))
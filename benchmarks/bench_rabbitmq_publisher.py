@@ -0,0 +1,90 @@
+"""
+Compara publicações/s entre o publisher compartilhado (conexão persistente,
+pool de canais e publisher confirms) e o modelo antigo, que abria uma conexão
+nova a cada mensagem.
+
+Uso (com as variáveis RABBITMQ_* definidas e o broker no ar):
+
+    python -m benchmarks.bench_rabbitmq_publisher --mensagens 2000 --concorrencia 50
+"""
+import argparse
+import asyncio
+import json
+import time
+from os import environ
+
+import aio_pika
+from dotenv import load_dotenv
+
+from app.services.rabbitmq_publisher import RabbitmqPublisher
+
+EXCHANGE = "bench_exchange"
+ROUTING_KEY = "bench_rk"
+PAYLOAD = {
+    "action": "send_card_to_approval",
+    "data": {
+        "uuid": "9534299a-8c90-473d-b9c6-cc2bb18103ae",
+        "titular_cartao": "JOAO DA SILVA",
+        "cpf_titular": "12345678912",
+        "email": "JOAODASILVA@EMAIL.COM"
+    }
+}
+
+
+async def publicar_por_conexao(url: str):
+    connection = await aio_pika.connect_robust(url)
+    try:
+        channel = await connection.channel()
+        exchange = await channel.declare_exchange(EXCHANGE, aio_pika.ExchangeType.DIRECT, durable=True)
+        await exchange.publish(
+            aio_pika.Message(body=json.dumps(PAYLOAD).encode(), delivery_mode=aio_pika.DeliveryMode.PERSISTENT),
+            routing_key=ROUTING_KEY
+        )
+    finally:
+        await connection.close()
+
+
+async def medir(nome: str, publicar, mensagens: int, concorrencia: int):
+    semaforo = asyncio.Semaphore(concorrencia)
+
+    async def tarefa():
+        async with semaforo:
+            await publicar()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tarefa() for _ in range(mensagens)))
+    duracao = time.perf_counter() - inicio
+
+    print(f"{nome:<22} {mensagens:>7} msgs  {duracao:8.2f}s  {mensagens / duracao:10.1f} msgs/s")
+
+
+async def main(mensagens: int, concorrencia: int):
+    url = (
+        f"amqp://{environ.get('RABBITMQ_DEFAULT_USER')}:{environ.get('RABBITMQ_DEFAULT_PASS')}"
+        f"@{environ.get('RABBITMQ_HOST')}:{environ.get('RABBITMQ_PORT')}/"
+    )
+
+    await medir("conexão por mensagem", lambda: publicar_por_conexao(url), mensagens, concorrencia)
+
+    publisher = RabbitmqPublisher(pool_size=concorrencia)
+    await publisher.connect()
+    try:
+        await medir(
+            "publisher com pool",
+            lambda: publisher.send_message(PAYLOAD, exchange=EXCHANGE, routing_key=ROUTING_KEY),
+            mensagens,
+            concorrencia
+        )
+    finally:
+        await publisher.close()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mensagens", type=int, default=1000)
+    parser.add_argument("--concorrencia", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.mensagens, args.concorrencia))
@@ -0,0 +1,78 @@
+"""
+Orçamento de tempo de inicialização: importa o módulo informado em um processo
+novo com "python -X importtime", lista os módulos mais lentos (tempo próprio e
+acumulado, em ms), soma o tempo por pacote de topo e falha (código de saída 1)
+se o tempo total passar de --orcamento-ms ou se algum módulo de --proibidos
+tiver sido carregado.
+
+Uso (com as variáveis de ambiente da aplicação definidas):
+
+    python -m benchmarks.importacao --modulo app.main --orcamento-ms 1500 --proibidos aio_pika aiosmtplib numpy
+"""
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+LINHA_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def medir_importacao(modulo: str) -> list:
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True,
+        text=True
+    )
+
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar {modulo}:\n{processo.stderr}")
+
+    modulos = []
+    for linha in processo.stderr.splitlines():
+        encontrado = LINHA_IMPORTTIME.match(linha)
+        if encontrado:
+            proprio, acumulado, recuo, nome = encontrado.groups()
+            modulos.append({
+                "modulo": nome,
+                "proprio_ms": int(proprio) / 1000,
+                "acumulado_ms": int(acumulado) / 1000,
+                "nivel": len(recuo) // 2
+            })
+
+    return modulos
+
+
+def main(args) -> int:
+    modulos = medir_importacao(args.modulo)
+    total = next(m["acumulado_ms"] for m in reversed(modulos) if m["modulo"] == args.modulo)
+
+    print(f"{'módulo':<60} {'próprio (ms)':>13} {'acumulado (ms)':>15}")
+    for m in sorted(modulos, key=lambda m: m["acumulado_ms"], reverse=True)[:args.top]:
+        print(f"{'  ' * m['nivel'] + m['modulo']:<60} {m['proprio_ms']:>13.1f} {m['acumulado_ms']:>15.1f}")
+
+    por_pacote = defaultdict(float)
+    for m in modulos:
+        por_pacote[m["modulo"].split(".")[0]] += m["proprio_ms"]
+
+    print(f"\n{'pacote':<60} {'tempo (ms)':>13}")
+    for pacote, tempo in sorted(por_pacote.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{pacote:<60} {tempo:>13.1f}")
+
+    carregados = {m["modulo"].split(".")[0] for m in modulos}
+    violacoes = sorted(set(args.proibidos) & carregados)
+
+    print(f"\nTotal para importar {args.modulo}: {total:.1f} ms (orçamento: {args.orcamento_ms:.0f} ms).")
+    if violacoes:
+        print(f"Módulos que deveriam ser carregados sob demanda: {', '.join(violacoes)}.")
+
+    return 1 if total > args.orcamento_ms or violacoes else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modulo", default="app.main")
+    parser.add_argument("--orcamento-ms", type=float, default=1500)
+    parser.add_argument("--proibidos", nargs="*", default=["aio_pika", "aiormq", "aiosmtplib", "numpy"])
+    parser.add_argument("--top", type=int, default=25)
+    sys.exit(main(parser.parse_args()))
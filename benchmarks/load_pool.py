@@ -0,0 +1,92 @@
+"""
+Mede a latência (p50/p99) de consultas concorrentes para diferentes tamanhos
+do pool de conexões, reproduzindo a disputa por conexões das rotas da API.
+
+Cada requisição obtém uma sessão, executa uma consulta que segura a conexão
+por --duracao-ms e a devolve ao pool. O tempo medido inclui a espera por uma
+conexão livre.
+
+Uso (com DB_URL definida e o Postgres no ar):
+
+    python -m benchmarks.load_pool --pool-sizes 5 10 20 40 --requisicoes 2000 --concorrencia 100
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from os import environ
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+async def executar(db_url: str, pool_size: int, args) -> dict:
+    engine = create_async_engine(
+        db_url,
+        pool_size=pool_size,
+        max_overflow=args.max_overflow,
+        pool_timeout=args.pool_timeout
+    )
+    sessao = async_sessionmaker(bind=engine, class_=AsyncSession)
+    semaforo = asyncio.Semaphore(args.concorrencia)
+    latencias = []
+    erros = 0
+
+    async def requisicao():
+        nonlocal erros
+        async with semaforo:
+            inicio = time.perf_counter()
+            try:
+                async with sessao() as session:
+                    await session.execute(text("SELECT pg_sleep(:t)"), {"t": args.duracao_ms / 1000})
+            except Exception:
+                erros += 1
+                return
+            latencias.append((time.perf_counter() - inicio) * 1000)
+
+    async with sessao() as session:
+        await session.execute(text("SELECT 1"))
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(requisicao() for _ in range(args.requisicoes)))
+    duracao = time.perf_counter() - inicio
+
+    await engine.dispose()
+
+    return {
+        "pool_size": pool_size,
+        "rps": len(latencias) / duracao,
+        "p50": statistics.median(latencias) if latencias else 0.0,
+        "p99": percentil(latencias, 0.99) if latencias else 0.0,
+        "erros": erros
+    }
+
+
+async def main(args):
+    load_dotenv()
+    db_url = environ.get("DB_URL")
+
+    print(f"{'pool':>6} {'req/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10} {'erros':>7}")
+    for pool_size in args.pool_sizes:
+        resultado = await executar(db_url, pool_size, args)
+        print(
+            f"{resultado['pool_size']:>6} {resultado['rps']:>10.1f} "
+            f"{resultado['p50']:>10.2f} {resultado['p99']:>10.2f} {resultado['erros']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--max-overflow", type=int, default=0)
+    parser.add_argument("--pool-timeout", type=float, default=30)
+    parser.add_argument("--requisicoes", type=int, default=2000)
+    parser.add_argument("--concorrencia", type=int, default=100)
+    parser.add_argument("--duracao-ms", type=float, default=5)
+    asyncio.run(main(parser.parse_args()))
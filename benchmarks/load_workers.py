@@ -0,0 +1,134 @@
+"""
+Mede o throughput (req/s) e a latência (p50/p99) da API em modo de produção
+para diferentes quantidades de workers do servidor.
+
+Para cada quantidade, sobe "python -m app.servidor" com SERVIDOR_WORKERS
+definido, aguarda a rota responder, dispara requisições por --duracao
+segundos a partir de --processos-cliente processos (para que o cliente não
+seja o gargalo) e encerra o servidor com SIGTERM.
+
+Uso (com as variáveis de ambiente da aplicação definidas):
+
+    python -m benchmarks.load_workers --workers 1 2 4 8 --duracao 10 --concorrencia 64
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+async def disparar(url: str, concorrencia: int, duracao: float):
+    latencias = []
+    erros = 0
+    fim = time.perf_counter() + duracao
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=concorrencia, max_keepalive_connections=concorrencia)
+    ) as client:
+        async def cliente():
+            nonlocal erros
+            while time.perf_counter() < fim:
+                inicio = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    erros += 1
+                    continue
+                latencias.append((time.perf_counter() - inicio) * 1000)
+
+        await asyncio.gather(*(cliente() for _ in range(concorrencia)))
+
+    return latencias, erros
+
+
+def carga(url: str, concorrencia: int, duracao: float):
+    return asyncio.run(disparar(url, concorrencia, duracao))
+
+
+def aguardar(url: str, timeout: float = 60):
+    limite = time.monotonic() + timeout
+
+    while time.monotonic() < limite:
+        try:
+            if httpx.get(url).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+
+    raise TimeoutError(f"O servidor não respondeu em {timeout}s.")
+
+
+def executar(workers: int, args) -> dict:
+    url = f"http://127.0.0.1:{args.porta}{args.rota}"
+    env = {
+        **os.environ,
+        "SERVIDOR_HOST": "127.0.0.1",
+        "SERVIDOR_PORTA": str(args.porta),
+        "SERVIDOR_WORKERS": str(workers),
+        "SERVIDOR_LOG_LEVEL": "warning"
+    }
+    servidor = subprocess.Popen([sys.executable, "-m", "app.servidor"], env=env)
+
+    try:
+        aguardar(url)
+
+        concorrencia = max(1, args.concorrencia // args.processos_cliente)
+        with ProcessPoolExecutor(args.processos_cliente) as executor:
+            inicio = time.perf_counter()
+            resultados = list(executor.map(
+                carga,
+                [url] * args.processos_cliente,
+                [concorrencia] * args.processos_cliente,
+                [args.duracao] * args.processos_cliente
+            ))
+            duracao = time.perf_counter() - inicio
+    finally:
+        servidor.send_signal(signal.SIGTERM)
+        servidor.wait()
+
+    latencias = [latencia for parcial, _ in resultados for latencia in parcial]
+
+    return {
+        "workers": workers,
+        "rps": len(latencias) / duracao,
+        "p50": statistics.median(latencias) if latencias else 0.0,
+        "p99": percentil(latencias, 0.99) if latencias else 0.0,
+        "erros": sum(erros for _, erros in resultados)
+    }
+
+
+def main(args):
+    resultados = [executar(workers, args) for workers in args.workers]
+    base = resultados[0]["rps"] or 1
+
+    print(f"{'workers':>8} {'req/s':>10} {'escala':>7} {'p50 (ms)':>10} {'p99 (ms)':>10} {'erros':>7}")
+    for resultado in resultados:
+        print(
+            f"{resultado['workers']:>8} {resultado['rps']:>10.1f} {resultado['rps'] / base:>6.2f}x "
+            f"{resultado['p50']:>10.2f} {resultado['p99']:>10.2f} {resultado['erros']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rota", default="/api/v1/monitoramento/pool_conexoes")
+    parser.add_argument("--porta", type=int, default=8100)
+    parser.add_argument("--duracao", type=float, default=10)
+    parser.add_argument("--concorrencia", type=int, default=64)
+    parser.add_argument("--processos-cliente", type=int, default=4)
+    main(parser.parse_args())
@@ -0,0 +1,74 @@
+"""
+Custo do MetricasMiddleware por requisição (em µs): chama um app ASGI mínimo,
+com uma rota registrada, diretamente e envolvido pelo middleware, e mede o
+custo de montar o texto exportado em /metricas para a quantidade de rotas
+informada.
+
+Uso (com as variáveis de ambiente da aplicação definidas):
+
+    python -m benchmarks.metricas --requisicoes 100000 --rotas 50
+"""
+import argparse
+import asyncio
+import time
+from types import SimpleNamespace
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.metricas import MetricasMiddleware, http_duracao, http_requisicoes, metricas  # noqa: E402
+
+ROTA = SimpleNamespace(path="/api/v1/cartoes/{cartao_uuid}")
+
+
+async def app_minimo(scope, receive, send):
+    scope["route"] = ROTA
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receber():
+    return {"type": "http.request", "body": b""}
+
+
+async def enviar(mensagem):
+    pass
+
+
+async def medir(aplicacao, requisicoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(requisicoes):
+        await aplicacao({"type": "http", "method": "GET", "path": "/"}, receber, enviar)
+    return (time.perf_counter() - inicio) / requisicoes * 1_000_000
+
+
+async def executar(args):
+    instrumentado = MetricasMiddleware(app_minimo)
+    await medir(app_minimo, 1000)
+    await medir(instrumentado, 1000)
+
+    direto = await medir(app_minimo, args.requisicoes)
+    com_metricas = await medir(instrumentado, args.requisicoes)
+
+    print(f"{'app':<22} {'µs/requisição':>14}")
+    print(f"{'sem middleware':<22} {direto:>14.2f}")
+    print(f"{'com MetricasMiddleware':<22} {com_metricas:>14.2f}")
+    print(f"{'custo adicional':<22} {com_metricas - direto:>14.2f}")
+
+    for indice in range(args.rotas):
+        for status in (200, 400, 404):
+            http_requisicoes.inc("GET", f"/rota/{indice}", status)
+            http_duracao.observar(0.01, "GET", f"/rota/{indice}")
+
+    inicio = time.perf_counter()
+    texto = metricas.exportar()
+    print(f"\nExportação com {args.rotas} rotas: {(time.perf_counter() - inicio) * 1000:.2f} ms "
+          f"({len(texto.splitlines())} linhas).")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requisicoes", type=int, default=100000)
+    parser.add_argument("--rotas", type=int, default=50)
+    asyncio.run(executar(parser.parse_args()))
@@ -0,0 +1,174 @@
+"""
+Validações por segundo de CartaoRequest: validadores Python anteriores
+(field_validator em modo "before", normalização com gerador por caractere e
+HTTPException dentro do pydantic) contra as restrições nativas do pydantic-core
+com a remoção de acentos em cache, para um payload isolado e para um lote no
+formato de /solicitar_cartoes_lote (com --invalidos% de itens inválidos).
+
+Uso (com as variáveis de ambiente da aplicação definidas):
+
+    python -m benchmarks.validacao --lote 5000 --invalidos 10 --repeticoes 5
+"""
+import argparse
+import random
+import time
+import unicodedata
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError, field_validator
+
+load_dotenv()
+
+from app.core.validacao import mensagem_validacao  # noqa: E402
+from app.schemas.cartao_schema import CartaoRequest  # noqa: E402
+
+NOMES = ["JOÃO DA SILVA", "MARIA JOSÉ SOUZA", "ANTÔNIO CONCEIÇÃO", "ANA PAULA LIMA", "JOSÉ  DE  ARAÚJO"]
+ENDERECOS = ["RUA DA FELICIDADE, BAIRRO ALEGRIA", "AVENIDA SÃO JOÃO, 1000", "PRAÇA DA SÉ, CENTRO"]
+INVALIDOS = [
+    {"titular_cartao": "JOAO 2"},
+    {"cpf_titular": "123"},
+    {"endereco": "   "},
+    {"email": ""}
+]
+
+
+def sem_acentos(v: str) -> str:
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', v) if unicodedata.category(c) != 'Mn'
+    )
+
+
+class CartaoRequestAnterior(BaseModel):
+    titular_cartao: str
+    cpf_titular: str
+    endereco: str
+    email: str
+
+    @field_validator("endereco", mode="before")
+    def validator_endereco(cls, v):
+        if not v.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Endereço é um campo obrigatório e não pode ser uma string vazia."
+            )
+        return sem_acentos(" ".join(v.split()))
+
+    @field_validator("titular_cartao", mode="before")
+    def validator_titular_cartao(cls, v):
+        if not v.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Nome titular é um campo obrigatório e não pode ser uma string vazia."
+            )
+        v = " ".join(v.split())
+        if not all(parte.isalpha() or parte.isspace() for parte in v):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O nome do titular deve ser composto apenas por letras."
+            )
+        return sem_acentos(v)
+
+    @field_validator('cpf_titular', mode="before")
+    def validar_cpf(cls, v):
+        if not v.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CPF é um campo obrigatório e não pode ser uma string vazia."
+            )
+        if not v.isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O CPF deve conter apenas números."
+            )
+        if len(v) != 11:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="O CPF deve conter exatamente 11 dígitos."
+            )
+        return v
+
+    @field_validator("email", mode="before")
+    def validator_email(cls, v):
+        if not v.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="E-mail é um campo obrigatório e não pode ser uma string vazia."
+            )
+        return sem_acentos(" ".join(v.split()))
+
+
+def gerar_lote(quantidade: int, percentual_invalidos: float) -> list:
+    aleatorio = random.Random(42)
+    itens = []
+
+    for indice in range(quantidade):
+        item = {
+            "titular_cartao": aleatorio.choice(NOMES),
+            "cpf_titular": f"{aleatorio.randrange(10 ** 11):011d}",
+            "endereco": aleatorio.choice(ENDERECOS),
+            "email": f"TITULAR{indice}@EMAIL.COM"
+        }
+        if aleatorio.random() * 100 < percentual_invalidos:
+            item.update(aleatorio.choice(INVALIDOS))
+        itens.append(item)
+
+    return itens
+
+
+def validar_anterior(itens: list) -> int:
+    validos = 0
+
+    for item in itens:
+        try:
+            CartaoRequestAnterior.model_validate(item)
+            validos += 1
+        except HTTPException:
+            pass
+
+    return validos
+
+
+def validar_atual(itens: list) -> int:
+    validos = 0
+
+    for item in itens:
+        try:
+            CartaoRequest.model_validate(item)
+            validos += 1
+        except ValidationError as e:
+            erro = e.errors()[0]
+            mensagem_validacao(CartaoRequest, erro["loc"][0], erro)
+
+    return validos
+
+
+def medir(funcao, itens: list, repeticoes: int) -> float:
+    funcao(itens)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao(itens)
+    return len(itens) * repeticoes / (time.perf_counter() - inicio)
+
+
+def main(args):
+    cenarios = {
+        "payload isolado": gerar_lote(1, 0) * 1000,
+        f"lote de {args.lote} ({args.invalidos:.0f}% inválidos)": gerar_lote(args.lote, args.invalidos)
+    }
+
+    print(f"{'cenário':<34} {'anterior (val/s)':>17} {'atual (val/s)':>15} {'ganho':>7}")
+    for nome, itens in cenarios.items():
+        assert validar_anterior(itens) == validar_atual(itens)
+
+        anterior = medir(validar_anterior, itens, args.repeticoes)
+        atual = medir(validar_atual, itens, args.repeticoes)
+        print(f"{nome:<34} {anterior:>17.0f} {atual:>15.0f} {atual / anterior:>6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lote", type=int, default=5000)
+    parser.add_argument("--invalidos", type=float, default=10)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,37 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.email_dispatcher import EmailDispatchError, EmailDispatcher, SmtpPool
+
+
+@pytest.mark.asyncio
+async def test_falhas_de_envio_liberam_vagas_do_pool(mocker, monkeypatch):
+    monkeypatch.setenv("SMTP_PORT", "587")
+    monkeypatch.delenv("SMTP_USER", raising=False)
+    abertas = []
+
+    async def falhar_envio(message):
+        await asyncio.sleep(0.01)
+        raise ConnectionError("SMTP indisponível")
+
+    def conexao(**kwargs):
+        client = MagicMock()
+        client.is_connected = True
+        client.connect = AsyncMock(side_effect=lambda: abertas.append(client))
+        client.close = MagicMock(side_effect=lambda: abertas.remove(client))
+        client.send_message = AsyncMock(side_effect=falhar_envio)
+        assert len(abertas) < 1
+        return client
+
+    mocker.patch("app.services.email_dispatcher.aiosmtplib.SMTP", side_effect=conexao)
+    dispatcher = EmailDispatcher(
+        SmtpPool(tamanho=1), concorrencia=4, max_tentativas=2, backoff_base=0.001, backoff_max=0.001
+    )
+    mensagens = [dispatcher.mensagem_ativacao(f"uuid-{i}", "JOAO", "JOAO@EMAIL.COM") for i in range(4)]
+
+    resultados = await asyncio.wait_for(dispatcher.enviar_lote(mensagens), timeout=5)
+
+    assert all(isinstance(resultado, EmailDispatchError) for resultado in resultados)
+    assert abertas == []
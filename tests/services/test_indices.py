@@ -0,0 +1,177 @@
+import json
+import re
+import uuid
+from datetime import datetime, timezone
+from os import environ
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.future import select
+
+from app.models.cartao_model import CartaoModel, StatusEnum
+from app.models.idempotencia_model import IdempotenciaModel
+from app.models.movimentacao_model import MovimentacaoModel
+from app.services.status_services import origens_permitidas
+
+TEST_DB_URL = environ.get("TEST_DB_URL")
+CPF_TESTE = "12345678912"
+UUID_TESTE = uuid.uuid4()
+
+pytestmark = [
+    pytest.mark.skipif(not TEST_DB_URL, reason="TEST_DB_URL não definida."),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+INDICES_CPF = {"ix_cartoes_cpf_titular_id", "ix_cartoes_cpf_titular_titular_cartao"}
+
+CONSULTAS = {
+    "cartao_por_uuid": select(CartaoModel).where(CartaoModel.uuid == UUID_TESTE),
+    "cartoes_do_titular": select(CartaoModel).where(CartaoModel.cpf_titular == CPF_TESTE),
+    "tokens_do_titular": select(
+        CartaoModel.uuid, CartaoModel.token, CartaoModel.token_expiracao
+    ).where(CartaoModel.cpf_titular == CPF_TESTE),
+    "listar_cartoes_por_cpf": select(CartaoModel.id, CartaoModel.uuid, CartaoModel.saldo_centavos)
+    .where(CartaoModel.cpf_titular == CPF_TESTE, CartaoModel.id > 0)
+    .order_by(CartaoModel.id)
+    .limit(51),
+    "atualizar_dados_titular": select(CartaoModel).where(
+        CartaoModel.cpf_titular == CPF_TESTE,
+        CartaoModel.titular_cartao == "JOAO DA SILVA"
+    ),
+    "titulares_do_lote": select(CartaoModel.cpf_titular, CartaoModel.token, CartaoModel.token_expiracao)
+    .where(CartaoModel.cpf_titular.in_([CPF_TESTE, "98765432100"]))
+    .distinct(CartaoModel.cpf_titular)
+    .order_by(CartaoModel.cpf_titular, CartaoModel.token_expiracao.desc()),
+    "rotacionar_tokens": update(CartaoModel)
+    .where(CartaoModel.cpf_titular == CPF_TESTE)
+    .values(token_expiracao=datetime.now(timezone.utc)),
+    "recarregar_cartao": update(CartaoModel)
+    .where(CartaoModel.uuid == UUID_TESTE, CartaoModel.status == StatusEnum.ATIVO)
+    .values(saldo_centavos=CartaoModel.saldo_centavos + 100),
+    "extrato": select(MovimentacaoModel)
+    .where(MovimentacaoModel.cartao_id == select(CartaoModel.id).where(CartaoModel.uuid == UUID_TESTE).scalar_subquery())
+    .order_by(MovimentacaoModel.data_criacao.desc(), MovimentacaoModel.id.desc())
+    .limit(51),
+    "cartoes_vencidos": select(CartaoModel.id)
+    .where(CartaoModel.expiracao < func.current_date(), CartaoModel.status.in_(origens_permitidas(StatusEnum.EXPIRADO)))
+    .order_by(CartaoModel.expiracao)
+    .limit(1000),
+    "chave_idempotencia": select(IdempotenciaModel).where(
+        IdempotenciaModel.escopo == f"recarregar_cartao:{UUID_TESTE}",
+        IdempotenciaModel.chave == "chave"
+    ),
+}
+
+
+INDICES_ESPERADOS = {
+    "cartao_por_uuid": {"cartoes_uuid_key"},
+    "cartoes_do_titular": INDICES_CPF,
+    "tokens_do_titular": INDICES_CPF,
+    "listar_cartoes_por_cpf": {"ix_cartoes_cpf_titular_id"},
+    "atualizar_dados_titular": {"ix_cartoes_cpf_titular_titular_cartao"},
+    "titulares_do_lote": INDICES_CPF,
+    "rotacionar_tokens": INDICES_CPF,
+    "recarregar_cartao": {"cartoes_uuid_key"},
+    "extrato": {"cartoes_uuid_key", "ix_movimentacoes_cartao_id_data_criacao_id"},
+    "cartoes_vencidos": {"ix_cartoes_expiracao"},
+    "chave_idempotencia": {"chaves_idempotencia_pkey"},
+}
+
+POPULAR = [
+    "LOCK TABLE cartoes, movimentacoes, chaves_idempotencia IN SHARE UPDATE EXCLUSIVE MODE",
+    """
+    INSERT INTO cartoes (
+        uuid, titular_cartao, cpf_titular, status, email, endereco, saldo_centavos, numero_cartao,
+        numero_cartao_fingerprint, expiracao, cvv, data_criacao, token, token_expiracao
+    )
+    SELECT
+        gen_random_uuid(), 'TITULAR ' || upper(md5((i % 20000)::text)), lpad((i % 20000)::text, 11, '0'),
+        (ARRAY['ATIVO', 'EM_ANALISE', 'BLOQUEADO', 'CANCELADO'])[1 + i % 4]::statusenum,
+        'TITULAR' || i || '@EMAIL.COM', 'RUA ' || i, i % 100000, 'numero', md5('indices' || i),
+        CASE WHEN i % 200 = 0 THEN current_date - i % 30 ELSE current_date + 30 + i % 1800 END,
+        'cvv', now(), 'token', now() + interval '1 hour'
+    FROM generate_series(1, 50000) AS i
+    """,
+    f"""
+    INSERT INTO cartoes (
+        uuid, titular_cartao, cpf_titular, status, email, endereco, saldo_centavos, numero_cartao,
+        numero_cartao_fingerprint, expiracao, cvv, data_criacao, token, token_expiracao
+    )
+    SELECT
+        gen_random_uuid(), 'TITULAR PRINCIPAL', '{CPF_TESTE}', 'ATIVO', 'PRINCIPAL@EMAIL.COM', 'RUA PRINCIPAL',
+        0, 'numero', md5('principal' || i), current_date + 365, 'cvv', now(), 'token', now() + interval '1 hour'
+    FROM generate_series(1, 2000) AS i
+    """,
+    """
+    INSERT INTO movimentacoes (
+        id, data_criacao, cartao_id, tipo, operacao, valor_centavos, saldo_centavos
+    )
+    SELECT
+        nextval('movimentacoes_id_seq'), now() - (c.id * 7 + i * 90) % 365 * interval '1 day', c.id,
+        'CREDITO', 'RECARGA', 100, 100 * i
+    FROM cartoes AS c CROSS JOIN generate_series(1, 4) AS i
+    """,
+    """
+    INSERT INTO chaves_idempotencia (escopo, chave, hash_requisicao, data_criacao, expiracao)
+    SELECT 'recarregar_cartao:' || gen_random_uuid(), 'chave' || i, md5(i::text), now(), now() + interval '1 day'
+    FROM generate_series(1, 20000) AS i
+    """,
+    "ANALYZE cartoes",
+    "ANALYZE movimentacoes",
+    "ANALYZE chaves_idempotencia",
+]
+
+TABELAS_POPULADAS = text("SELECT relname FROM pg_class WHERE relkind = 'r' AND reltuples > 0")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def conexao():
+    engine = create_async_engine(TEST_DB_URL)
+
+    async with engine.connect() as conexao:
+        for sql in POPULAR:
+            await conexao.execute(text(sql))
+        yield conexao
+        await conexao.rollback()
+
+    await engine.dispose()
+
+
+def nos_do_plano(plano: dict):
+    yield plano
+    for filho in plano.get("Plans", []):
+        yield from nos_do_plano(filho)
+
+
+def indice_da_tabela(nome: str) -> str:
+    return re.sub(r"^movimentacoes_\w+?_cartao_id_data_criacao_id_idx$", "ix_movimentacoes_cartao_id_data_criacao_id", nome)
+
+
+async def plano(conexao, nome: str) -> dict:
+    sql = str(CONSULTAS[nome].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    resultado = await conexao.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plano = resultado.scalar()
+    return (json.loads(plano) if isinstance(plano, str) else plano)[0]["Plan"]
+
+
+@pytest.mark.parametrize("nome", CONSULTAS)
+async def test_consultas_frequentes_usam_indice(conexao, nome):
+    nos = list(nos_do_plano(await plano(conexao, nome)))
+    populadas = set((await conexao.execute(TABELAS_POPULADAS)).scalars())
+
+    varreduras = [
+        no["Relation Name"]
+        for no in nos
+        if no["Node Type"] == "Seq Scan" and no["Relation Name"] in populadas
+    ]
+    indices = {indice_da_tabela(no["Index Name"]) for no in nos if "Index Name" in no}
+
+    assert not varreduras, f"{nome} faz seq scan em {varreduras}."
+    assert indices and indices <= INDICES_ESPERADOS[nome], f"{nome} usa {sorted(indices)}."
+
+
+async def test_listagem_por_cpf_dispensa_ordenacao(conexao):
+    assert all(no["Node Type"] != "Sort" for no in nos_do_plano(await plano(conexao, "listar_cartoes_por_cpf")))
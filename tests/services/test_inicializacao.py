@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from httpx import AsyncClient
+
+import app.main as main
+from app.scripts.gerar_openapi import gerar_openapi
+
+
+@pytest.fixture
+def openapi_limpo():
+    main.app.openapi_schema = None
+    yield
+    main.app.openapi_schema = None
+
+
+def test_importar_app_nao_carrega_mensageria_smtp_numpy():
+    processo = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.main; print(' '.join(m for m in ('aio_pika', 'aiosmtplib', 'numpy') if m in sys.modules))"
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert processo.stdout.strip() == ""
+
+
+@pytest.mark.asyncio
+async def test_openapi_servido_do_arquivo_pre_gerado(mocker, tmp_path, openapi_limpo):
+    arquivo = tmp_path / "openapi.json"
+    documento = gerar_openapi(arquivo)
+    documento["info"]["title"] = "Gerado no build"
+    arquivo.write_text(json.dumps(documento), encoding="utf-8")
+
+    mocker.patch.object(main, "CAMINHO_OPENAPI", arquivo)
+    main.app.openapi_schema = None
+
+    async with AsyncClient(app=main.app, base_url="http://test") as client:
+        response = await client.get("/openapi.json")
+
+    assert response.json() == documento
+    assert response.json()["paths"]
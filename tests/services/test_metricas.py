@@ -0,0 +1,78 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.configs import settings
+from app.core.metricas import Histograma, RegistroMetricas
+from app.main import app
+
+
+def test_histograma_renderiza_buckets_acumulados():
+    registro = RegistroMetricas()
+    histograma = registro.registrar(Histograma("latencia_segundos", "Latência.", ("rota",), (0.1, 1.0)))
+
+    histograma.observar(0.05, "/a")
+    histograma.observar(0.5, "/a")
+    histograma.observar(3.0, "/a")
+
+    linhas = registro.exportar().splitlines()
+
+    assert "# TYPE latencia_segundos histogram" in linhas
+    assert 'latencia_segundos_bucket{rota="/a",le="0.1"} 1' in linhas
+    assert 'latencia_segundos_bucket{rota="/a",le="1.0"} 2' in linhas
+    assert 'latencia_segundos_bucket{rota="/a",le="+Inf"} 3' in linhas
+    assert 'latencia_segundos_sum{rota="/a"} 3.55' in linhas
+    assert 'latencia_segundos_count{rota="/a"} 3' in linhas
+
+
+def test_exportar_soma_os_snapshots_de_todos_os_workers(tmp_path):
+    registro = RegistroMetricas(str(tmp_path))
+    registro.contador("requisicoes_total", "Requisições.", ("status",)).inc(200)
+    (tmp_path / "outro-worker.json").write_text(json.dumps({"requisicoes_total": [[[200], 2.0]]}))
+
+    assert 'requisicoes_total{status="200"} 3.0' in registro.exportar().splitlines()
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_exportar_ignora_snapshots_de_processos_encerrados(tmp_path):
+    processo = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    orfao = tmp_path / f"{socket.gethostname()}-{processo.stdout.strip()}.json"
+    orfao.write_text(json.dumps({"requisicoes_total": [[[200], 5.0]], "em_andamento": [[["GET"], 4.0]]}))
+    antigo = tmp_path / "outro-host-1.json"
+    antigo.write_text(json.dumps({"requisicoes_total": [[[200], 2.0]], "em_andamento": [[["GET"], 3.0]]}))
+    os.utime(antigo, (0, 0))
+
+    registro = RegistroMetricas(str(tmp_path), intervalo=5)
+    registro.contador("requisicoes_total", "Requisições.", ("status",)).inc(200)
+    registro.medidor("em_andamento", "Em andamento.", ("metodo",)).inc("GET")
+    linhas = registro.exportar().splitlines()
+
+    assert not orfao.exists()
+    assert 'requisicoes_total{status="200"} 3.0' in linhas
+    assert 'em_andamento{metodo="GET"} 1.0' in linhas
+
+    registro.remover()
+    assert [arquivo.name for arquivo in tmp_path.glob("*.json")] == ["outro-host-1.json"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_registra_a_rota_e_o_status():
+    rota = f"{settings.API_V1}/monitoramento/metricas"
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await client.get(rota)
+        await client.get("/rota_inexistente")
+        response = await client.get(rota)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    linhas = response.text.splitlines()
+    assert f'http_requisicoes_total{{metodo="GET",rota="{rota}",status="200"}} 1.0' in linhas
+    assert 'http_requisicoes_total{metodo="GET",rota="nao_encontrada",status="404"} 1.0' in linhas
+    assert f'http_requisicao_duracao_segundos_count{{metodo="GET",rota="{rota}"}} 1' in linhas
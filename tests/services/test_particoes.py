@@ -0,0 +1,53 @@
+from datetime import date
+from os import environ
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.scripts.criar_particoes import garantir_particao
+
+TEST_DB_URL = environ.get("TEST_DB_URL")
+MES_TESTE = date(2099, 1, 1)
+
+pytestmark = pytest.mark.skipif(not TEST_DB_URL, reason="TEST_DB_URL não definida.")
+
+
+@pytest.mark.asyncio
+async def test_criar_particao_move_linhas_da_particao_padrao():
+    engine = create_async_engine(TEST_DB_URL)
+
+    try:
+        async with engine.connect() as conn:
+            transacao = await conn.begin()
+
+            cartao_id = await conn.scalar(text(
+                "INSERT INTO cartoes (uuid, titular_cartao, cpf_titular, status, email, endereco, saldo_centavos, "
+                "numero_cartao, numero_cartao_fingerprint, expiracao, cvv, data_criacao, token, token_expiracao) "
+                "VALUES (gen_random_uuid(), 'TESTE PARTICAO', '11122233344', 'ATIVO', 'TESTE@EMAIL.COM', "
+                "'RUA DO TESTE', 0, 'x', md5(random()::text), current_date, 'x', now(), 'x', now()) RETURNING id"
+            ))
+            await conn.execute(text(
+                "INSERT INTO movimentacoes (data_criacao, cartao_id, tipo, operacao, valor_centavos, saldo_centavos) "
+                "VALUES ('2099-01-15 12:00:00+00', :cartao_id, 'CREDITO', 'RECARGA', 100, 100), "
+                "('2099-02-15 12:00:00+00', :cartao_id, 'CREDITO', 'RECARGA', 100, 200)"
+            ), {"cartao_id": cartao_id})
+
+            assert await garantir_particao(conn, "movimentacoes", MES_TESTE) is True
+            assert await garantir_particao(conn, "movimentacoes", MES_TESTE) is False
+
+            particoes = (await conn.execute(text(
+                "SELECT tableoid::regclass::text, count(*) FROM movimentacoes "
+                "WHERE cartao_id = :cartao_id GROUP BY 1"
+            ), {"cartao_id": cartao_id})).all()
+            padrao_anexada = await conn.scalar(text(
+                "SELECT count(*) FROM pg_inherits "
+                "WHERE inhrelid = 'movimentacoes_padrao'::regclass AND inhparent = 'movimentacoes'::regclass"
+            ))
+
+            await transacao.rollback()
+
+        assert dict(particoes) == {"movimentacoes_2099_01": 1, "movimentacoes_padrao": 1}
+        assert padrao_anexada == 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.rabbitmq_consumer import RabbitmqConsumer
+
+
+def mensagem(body: bytes):
+    message = MagicMock()
+    message.body = body
+    message.routing_key = "approval_rk"
+    message.ack = AsyncMock()
+    message.reject = AsyncMock()
+    return message
+
+
+@pytest.fixture
+def consumer(monkeypatch):
+    monkeypatch.setenv("RABBITMQ_PORT", "5672")
+    dispatcher = MagicMock()
+    dispatcher.enviar = AsyncMock()
+    return RabbitmqConsumer(dispatcher)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [
+    b"nao e json",
+    json.dumps({"data": {}}).encode(),
+    json.dumps({"data": {"uuid": "invalido"}}).encode(),
+    json.dumps({"data": ["lista"]}).encode(),
+])
+async def test_mensagens_invalidas_rejeitadas_sem_reenfileirar(consumer, body):
+    aprovacao, ativacao = mensagem(body), mensagem(body)
+
+    await consumer._RabbitmqConsumer__on_approval(aprovacao)
+    await consumer._RabbitmqConsumer__on_activation(ativacao)
+
+    for message in (aprovacao, ativacao):
+        message.reject.assert_awaited_once_with(requeue=False)
+        message.ack.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_ativacao_confirma_aprovacao_pendente(consumer):
+    body = json.dumps({
+        "data": {"uuid": str(uuid.uuid4()), "titular_cartao": "JOAO", "email": "JOAO@EMAIL.COM"}
+    }).encode()
+    aprovacao, ativacao = mensagem(body), mensagem(body)
+
+    await consumer._RabbitmqConsumer__on_approval(aprovacao)
+    aprovacao.ack.assert_not_awaited()
+
+    await consumer._RabbitmqConsumer__on_activation(ativacao)
+
+    aprovacao.ack.assert_awaited_once()
+    ativacao.ack.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_aprovacoes_sem_ativacao_descartadas_apos_idade_maxima(monkeypatch):
+    monkeypatch.setenv("RABBITMQ_PORT", "5672")
+    monkeypatch.setenv("RABBITMQ_APROVACAO_MAX_IDADE", "0.05")
+    consumer = RabbitmqConsumer(MagicMock())
+    antiga, recente = (
+        mensagem(json.dumps({"data": {"uuid": str(uuid.uuid4())}}).encode()) for _ in range(2)
+    )
+
+    await consumer._RabbitmqConsumer__on_approval(antiga)
+    await asyncio.sleep(0.06)
+    await consumer._RabbitmqConsumer__on_approval(recente)
+
+    assert await consumer._RabbitmqConsumer__descartar_aprovacoes_antigas() == 1
+    antiga.ack.assert_awaited_once()
+    recente.ack.assert_not_awaited()
+
+    await asyncio.sleep(0.06)
+
+    assert await consumer._RabbitmqConsumer__descartar_aprovacoes_antigas() == 1
+    recente.ack.assert_awaited_once()
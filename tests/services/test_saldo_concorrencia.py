@@ -0,0 +1,220 @@
+import asyncio
+from os import environ
+from unittest.mock import AsyncMock
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.dinheiro import LIMITE_SALDO_CENTAVOS, de_centavos
+from app.database.unit_of_work import UnitOfWork
+from app.models.cartao_model import CartaoModel, StatusEnum
+from app.models.idempotencia_model import IdempotenciaModel
+from app.models.movimentacao_model import MovimentacaoModel, TipoMovimentacaoEnum, OperacaoEnum
+from app.schemas.cartao_schema import CartaoRecarga, CartaoRecargaWrapper, CartaoTransferir
+from app.services.cartao_services import CartaoServices
+from app.services.idempotencia_services import IdempotenciaServices
+from app.services.token_services import TokenServices
+
+TEST_DB_URL = environ.get("TEST_DB_URL")
+CPF_TESTE = "99988877766"
+
+pytestmark = pytest.mark.skipif(not TEST_DB_URL, reason="TEST_DB_URL não definida.")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def sessao_factory():
+    engine = create_async_engine(TEST_DB_URL, pool_size=20, max_overflow=20)
+    factory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+
+    yield factory
+
+    async with factory() as session:
+        cartoes_teste = select(CartaoModel.id).where(CartaoModel.cpf_titular == CPF_TESTE)
+        await session.execute(delete(MovimentacaoModel).where(MovimentacaoModel.cartao_id.in_(cartoes_teste)))
+        await session.execute(delete(CartaoModel).where(CartaoModel.cpf_titular == CPF_TESTE))
+        await session.commit()
+
+    await engine.dispose()
+
+
+async def criar_cartoes(sessao_factory, saldos):
+    cartoes = []
+
+    async with sessao_factory() as session:
+        for saldo in saldos:
+            cartao = CartaoModel(
+                titular_cartao="TESTE CONCORRENCIA",
+                cpf_titular=CPF_TESTE,
+                endereco="RUA DO TESTE",
+                email="TESTE@EMAIL.COM"
+            )
+            cartao.gerar_dados()
+            cartao.status = StatusEnum.ATIVO
+            cartao.saldo_centavos = saldo * 100
+            cartao.token, cartao.token_expiracao = TokenServices.gerar_token(CPF_TESTE)
+            session.add(cartao)
+            cartoes.append(cartao)
+
+        await session.flush()
+        session.add_all([
+            MovimentacaoModel(
+                cartao_id=cartao.id,
+                tipo=TipoMovimentacaoEnum.CREDITO,
+                operacao=OperacaoEnum.SALDO_INICIAL,
+                valor_centavos=cartao.saldo_centavos,
+                saldo_centavos=cartao.saldo_centavos
+            )
+            for cartao in cartoes
+        ])
+        await session.commit()
+
+    return [cartao.uuid for cartao in cartoes]
+
+
+async def saldos(sessao_factory, uuids):
+    async with sessao_factory() as session:
+        query = await session.execute(
+            select(CartaoModel.uuid, CartaoModel.saldo_centavos).where(CartaoModel.uuid.in_(uuids))
+        )
+        return {linha.uuid: de_centavos(linha.saldo_centavos) for linha in query.all()}
+
+
+async def saldos_ledger(sessao_factory, uuids):
+    async with sessao_factory() as session:
+        query = await session.execute(
+            select(
+                CartaoModel.uuid,
+                func.sum(
+                    case(
+                        (MovimentacaoModel.tipo == TipoMovimentacaoEnum.CREDITO, MovimentacaoModel.valor_centavos),
+                        else_=-MovimentacaoModel.valor_centavos
+                    )
+                ).label("saldo_centavos")
+            )
+            .join(MovimentacaoModel, MovimentacaoModel.cartao_id == CartaoModel.id)
+            .where(CartaoModel.uuid.in_(uuids))
+            .group_by(CartaoModel.uuid)
+        )
+        return {linha.uuid: de_centavos(linha.saldo_centavos) for linha in query.all()}
+
+
+async def executar(sessao_factory, operacao):
+    async with sessao_factory() as session:
+        try:
+            await operacao(CartaoServices(UnitOfWork(session)))
+            return True
+        except HTTPException:
+            return False
+
+
+@pytest.mark.asyncio
+async def test_recargas_concorrentes_sem_perda(sessao_factory):
+    uuid, = await criar_cartoes(sessao_factory, [0])
+
+    resultados = await asyncio.gather(*(
+        executar(sessao_factory, lambda s: s.recarregar_cartao(CartaoRecarga(valor="0.01"), uuid))
+        for _ in range(200)
+    ))
+
+    assert all(resultados)
+    assert (await saldos(sessao_factory, [uuid]))[uuid] == 2
+    assert await saldos_ledger(sessao_factory, [uuid]) == await saldos(sessao_factory, [uuid])
+
+
+@pytest.mark.asyncio
+async def test_transferencias_concorrentes_nao_excedem_saldo(sessao_factory):
+    pagante, recebente = await criar_cartoes(sessao_factory, [100, 0])
+
+    resultados = await asyncio.gather(*(
+        executar(sessao_factory, lambda s: s.transferir_saldo(
+            CartaoTransferir(uuid_pagante=pagante, uuid_recebente=recebente, valor=10)
+        ))
+        for _ in range(30)
+    ))
+
+    assert sum(resultados) == 10
+    assert await saldos(sessao_factory, [pagante, recebente]) == {pagante: 0, recebente: 100}
+    assert await saldos_ledger(sessao_factory, [pagante, recebente]) == {pagante: 0, recebente: 100}
+
+
+@pytest.mark.asyncio
+async def test_transferencias_cruzadas_conservam_saldo(sessao_factory):
+    a, b = await criar_cartoes(sessao_factory, [500, 500])
+
+    await asyncio.gather(*(
+        executar(sessao_factory, lambda s, origem=origem, destino=destino: s.transferir_saldo(
+            CartaoTransferir(uuid_pagante=origem, uuid_recebente=destino, valor=7)
+        ))
+        for i in range(100)
+        for origem, destino in [(a, b) if i % 2 else (b, a)]
+    ))
+
+    resultado = await saldos(sessao_factory, [a, b])
+    assert sum(resultado.values()) == 1000
+    assert min(resultado.values()) >= 0
+    assert await saldos_ledger(sessao_factory, [a, b]) == resultado
+
+
+@pytest.mark.asyncio
+async def test_operacoes_nao_ultrapassam_limite_de_saldo(sessao_factory):
+    cheio, pagante = await criar_cartoes(sessao_factory, [LIMITE_SALDO_CENTAVOS // 100 - 1, 10])
+
+    async with sessao_factory() as session:
+        services = CartaoServices(UnitOfWork(session))
+
+        with pytest.raises(HTTPException) as recarga:
+            await services.recarregar_cartao(CartaoRecarga(valor=5), cheio)
+
+        with pytest.raises(HTTPException) as transferencia:
+            await services.transferir_saldo(CartaoTransferir(uuid_pagante=pagante, uuid_recebente=cheio, valor=5))
+
+    assert recarga.value.status_code == transferencia.value.status_code == 400
+    assert "não pode ultrapassar" in recarga.value.detail
+    assert "recebedor não pode ultrapassar" in transferencia.value.detail
+    assert await saldos(sessao_factory, [cheio, pagante]) == {
+        cheio: de_centavos(LIMITE_SALDO_CENTAVOS - 100),
+        pagante: 10
+    }
+
+
+@pytest.mark.asyncio
+async def test_recarga_idempotente_grava_resposta_na_mesma_transacao(mocker, sessao_factory):
+    uuid, = await criar_cartoes(sessao_factory, [0])
+    escopo = f"recarregar_cartao:{uuid}"
+
+    async def recarregar():
+        async with sessao_factory() as session:
+            uow = UnitOfWork(session)
+
+            async def operacao():
+                resposta = await CartaoServices(uow).recarregar_cartao(CartaoRecarga(valor=10), uuid, "chave")
+                return CartaoRecargaWrapper(**resposta)
+
+            return await IdempotenciaServices(uow).executar("chave", escopo, {"valor": "10"}, operacao)
+
+    try:
+        gravar = mocker.patch.object(
+            IdempotenciaServices,
+            "_IdempotenciaServices__gravar",
+            AsyncMock(side_effect=RuntimeError("processo encerrado"))
+        )
+        with pytest.raises(RuntimeError):
+            await recarregar()
+
+        assert (await saldos(sessao_factory, [uuid]))[uuid] == 0
+
+        mocker.stop(gravar)
+        resposta = await recarregar()
+
+        assert resposta.status_code == 200
+        assert (await saldos(sessao_factory, [uuid]))[uuid] == 10
+        async with sessao_factory() as session:
+            registro = await session.get(IdempotenciaModel, (escopo, "chave"))
+            assert registro.status_code == 200
+    finally:
+        async with sessao_factory() as session:
+            await session.execute(delete(IdempotenciaModel).where(IdempotenciaModel.escopo == escopo))
+            await session.commit()